@@ -0,0 +1,197 @@
+# Асинхронные клиенты gateway на grpc.aio.
+# Модуль намеренно не импортирует clients.grpc.client: там вызывается grpc_gevent.init_gevent(),
+# который переводит gRPC на gevent и несовместим с event loop asyncio.
+from grpc import aio
+
+from config import settings
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
+    OpenCreditCardAccountRequest,
+    OpenCreditCardAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
+    OpenDebitCardAccountRequest,
+    OpenDebitCardAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (
+    OpenDepositAccountRequest,
+    OpenDepositAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
+    OpenSavingsAccountRequest,
+    OpenSavingsAccountResponse
+)
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+    IssuePhysicalCardRequest,
+    IssuePhysicalCardResponse
+)
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardRequest, IssueVirtualCardResponse
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest,
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+    MakePurchaseOperationRequest,
+    MakePurchaseOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+    MakeTopUpOperationRequest,
+    MakeTopUpOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+    MakeTransferOperationRequest,
+    MakeTransferOperationResponse
+)
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
+from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+
+def build_gateway_grpc_aio_channel() -> aio.Channel:
+    """
+    Фабричная функция (билдер) для создания асинхронного gRPC-канала к сервису grpc-gateway.
+    Канал нужно создавать и использовать внутри одного event loop.
+
+    :return: Асинхронный gRPC-канал (grpc.aio.Channel).
+    """
+    return aio.insecure_channel(settings.gateway_grpc_client.client_url)
+
+
+class UsersGatewayGRPCAsyncClient:
+    """
+    Асинхронный gRPC-клиент для взаимодействия с UsersGatewayService.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к UsersGatewayService.
+        """
+        self.channel = channel
+        self.stub = UsersGatewayServiceStub(channel)
+
+    async def get_user(self, user_id: str) -> GetUserResponse:
+        """
+        Получение пользователя по его ID.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ с данными пользователя.
+        """
+        return await self.stub.GetUser(GetUserRequest(id=user_id))
+
+    async def create_user(self) -> CreateUserResponse:
+        """
+        Создание нового пользователя с фейковыми данными.
+
+        :return: Ответ с информацией о созданном пользователе.
+        """
+        request = CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return await self.stub.CreateUser(request)
+
+
+class AccountsGatewayGRPCAsyncClient:
+    """
+    Асинхронный gRPC-клиент для взаимодействия с AccountsGatewayService.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к AccountsGatewayService.
+        """
+        self.channel = channel
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        return await self.stub.GetAccounts(GetAccountsRequest(user_id=user_id))
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        return await self.stub.OpenDepositAccount(OpenDepositAccountRequest(user_id=user_id))
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        return await self.stub.OpenSavingsAccount(OpenSavingsAccountRequest(user_id=user_id))
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        return await self.stub.OpenDebitCardAccount(OpenDebitCardAccountRequest(user_id=user_id))
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        return await self.stub.OpenCreditCardAccount(OpenCreditCardAccountRequest(user_id=user_id))
+
+
+class CardsGatewayGRPCAsyncClient:
+    """
+    Асинхронный gRPC-клиент для взаимодействия с CardsGatewayService.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        self.channel = channel
+        self.stub = CardsGatewayServiceStub(channel)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        return await self.stub.IssueVirtualCard(IssueVirtualCardRequest(user_id=user_id, account_id=account_id))
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        return await self.stub.IssuePhysicalCard(IssuePhysicalCardRequest(user_id=user_id, account_id=account_id))
+
+
+class OperationsGatewayGRPCAsyncClient:
+    """
+    Асинхронный gRPC-клиент для взаимодействия с OperationsGatewayService.
+    Статус и сумма операций генерируются так же, как в OperationsGatewayGRPCClient.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        :param channel: Асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        self.channel = channel
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        request = MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        request = MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        request = MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+            category=fake.category()
+        )
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
+        request = MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.stub.MakeCashWithdrawalOperation(request)
@@ -0,0 +1,80 @@
+from grpc import Channel
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from contracts.services.accounts.accounts_service_pb2_grpc import AccountsServiceStub
+from contracts.services.accounts.account_pb2 import AccountType, AccountStatus
+from contracts.services.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+from contracts.services.accounts.rpc_create_account_pb2 import CreateAccountRequest, CreateAccountResponse
+from config import settings
+
+
+class AccountsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним AccountsService (в обход gateway).
+    Используется сидингом для быстрого открытия счетов.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к AccountsService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+
+    def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса со списком счетов.
+        """
+        return self.stub.GetAccounts(request)
+
+    def create_account_api(self, request: CreateAccountRequest) -> CreateAccountResponse:
+        """
+        Низкоуровневый вызов метода CreateAccount через gRPC.
+
+        :param request: gRPC-запрос с данными нового счёта.
+        :return: Ответ от сервиса с данными созданного счёта.
+        """
+        return self.stub.CreateAccount(request)
+
+    def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        """
+        Получение всех счетов пользователя (без карт).
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ со списком счетов.
+        """
+        request = GetAccountsRequest(user_id=user_id)
+        return self.get_accounts_api(request)
+
+    def create_account(self, user_id: str, account_type: AccountType.ValueType) -> CreateAccountResponse:
+        """
+        Создание активного счёта с нулевым балансом.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_type: Тип счёта (AccountType).
+        :return: Ответ с данными созданного счёта.
+        """
+        request = CreateAccountRequest(
+            type=account_type,
+            status=AccountStatus.ACCOUNT_STATUS_ACTIVE,
+            user_id=user_id,
+            balance=0.0
+        )
+        return self.create_account_api(request)
+
+
+def build_accounts_service_grpc_client() -> AccountsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsServiceGRPCClient.
+
+    :return: Инициализированный клиент для AccountsService.
+    """
+    return AccountsServiceGRPCClient(
+        channel=build_service_grpc_client(settings.accounts_service_grpc_client, "ACCOUNTS_SERVICE_GRPC_CLIENT")
+    )
@@ -0,0 +1,20 @@
+from grpc import Channel, insecure_channel
+
+from tools.config.grpc import GRPCClientConfig
+
+
+def build_service_grpc_client(config: GRPCClientConfig | None, name: str) -> Channel:
+    """
+    Фабричная функция (билдер) для создания gRPC-канала к внутреннему сервису в обход gateway.
+
+    Внутренние сервисы используются только сидингом (SEEDS.BACKEND=services),
+    поэтому их адреса в настройках необязательны.
+
+    :param config: Настройки gRPC-клиента сервиса (например, settings.accounts_service_grpc_client).
+    :param name: Имя секции настроек — для понятной ошибки, если адрес не задан.
+    :return: gRPC-канал (Channel) к сервису.
+    """
+    if config is None:
+        raise ValueError(f"{name}.HOST and {name}.PORT must be set to seed through internal services")
+
+    return insecure_channel(config.client_url)
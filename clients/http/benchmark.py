@@ -0,0 +1,100 @@
+import argparse
+import logging
+import time
+
+import gevent
+from gevent.pool import Pool
+from locust.env import Environment
+
+from clients.http.gateway.client import build_gateway_locust_http_client
+from config import settings
+from tools.config.http import HTTPClientBackend, HTTPPoolSharing
+from tools.logger import get_logger
+
+logger = get_logger("HTTP_BENCHMARK")
+
+
+def run_benchmark(backend: HTTPClientBackend, path: str, concurrency: int, duration: float) -> dict[str, float]:
+    """
+    Нагружает gateway GET-запросами к path в concurrency гринлетов в течение duration секунд
+    через клиент Locust выбранного бэкенда и измеряет процессорное время генератора нагрузки.
+
+    Args:
+        backend: HTTP-бэкенд клиента
+        path: Путь запроса относительно GATEWAY_HTTP_CLIENT.URL
+        concurrency: Количество одновременных гринлетов (виртуальных пользователей)
+        duration: Длительность замера в секундах
+
+    Returns:
+        dict[str, float]: Запросы, неуспешные запросы (failures) и исключения клиента (errors),
+        запросы в секунду и запросы на секунду CPU (на ядро)
+    """
+    settings.gateway_http_client.backend = backend
+    environment = Environment()
+    failures = 0
+
+    @environment.events.request.add_listener
+    def on_request(exception=None, **kwargs):
+        nonlocal failures
+        failures += exception is not None
+
+    # Без владельца у каждого клиента свой пул (GATEWAY_HTTP_CLIENT.POOL_SHARING=user)
+    clients = [build_gateway_locust_http_client(environment, "benchmark") for _ in range(concurrency)]
+    deadline = time.monotonic() + duration
+    count = errors = 0
+
+    def worker(client) -> None:
+        nonlocal count, errors
+        while time.monotonic() < deadline:
+            try:
+                client.get(path)
+            except Exception:
+                errors += 1
+            count += 1
+
+    started, cpu_started = time.monotonic(), time.process_time()
+    Pool(concurrency).map(worker, clients)
+    elapsed, cpu = time.monotonic() - started, time.process_time() - cpu_started
+
+    return {
+        "requests": count,
+        "failures": failures,
+        "errors": errors,
+        "rps": count / elapsed,
+        "requests_per_cpu_second": count / cpu if cpu else 0.0
+    }
+
+
+if __name__ == '__main__':
+    """
+    Сравнение HTTP-бэкендов по пропускной способности и CPU генератора нагрузки:
+    python -m clients.http.benchmark --path api/v1/users/<user_id> --concurrency 50 --duration 10
+
+    Запросы в секунду CPU — сколько запросов одно ядро воркера Locust успевает отправить и обработать;
+    их отношение между бэкендами показывает выигрыш на ядро. Генератор и gateway лучше разнести по разным машинам.
+    """
+    parser = argparse.ArgumentParser(description="Compare HTTP client backends by requests per CPU second")
+    parser.add_argument("--path", default="/", help="GET path relative to GATEWAY_HTTP_CLIENT.URL")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--backend", choices=[backend.value for backend in HTTPClientBackend], action="append")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(name)s | %(levelname)s | %(message)s")
+    # Одинаковые условия для бэкендов: свой пул на каждый гринлет
+    settings.gateway_http_client.pool_sharing = HTTPPoolSharing.USER
+
+    results = {}
+    for backend in arguments.backend or list(HTTPClientBackend):
+        results[backend] = run_benchmark(HTTPClientBackend(backend), arguments.path, arguments.concurrency, arguments.duration)
+        logger.info(
+            f"{backend}: {results[backend]['requests']} requests, {results[backend]['failures']} failures, "
+            f"{results[backend]['errors']} errors, "
+            f"{results[backend]['rps']:.0f} req/s, {results[backend]['requests_per_cpu_second']:.0f} req per CPU second"
+        )
+        gevent.sleep(1)
+
+    if len(results) > 1:
+        baseline = results[HTTPClientBackend.HTTPX]["requests_per_cpu_second"] if HTTPClientBackend.HTTPX in results else 0
+        for backend, result in results.items():
+            if backend != HTTPClientBackend.HTTPX and baseline:
+                logger.info(f"{backend}: x{result['requests_per_cpu_second'] / baseline:.2f} requests per core vs httpx")
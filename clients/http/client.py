@@ -1,6 +1,12 @@
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
 
-from httpx import Client, URL, Response, QueryParams
+from httpx import AsyncClient, Client, HTTPStatusError, URL, Request, Response, QueryParams
+from pydantic import BaseModel
+
+from clients.http.fast import FastHTTPClient
+from clients.http.validation import LazyResponse, RawResponse, ResponseValidator
+
+T = TypeVar("T", bound=BaseModel)
 
 # Тип расширений, которые можно передать в запрос
 # В нашем случае мы используем только параметр "route", но можно добавить и другие
@@ -8,15 +14,61 @@ class HTTPClientExtensions(TypedDict, total=False):
     route: str
 
     
+def raise_for_status(response: Response) -> None:
+    """
+    Выбрасывает httpx.HTTPStatusError, если статус ответа не 2xx. Ответ FastResponse
+    (бэкенд fasthttp) приводится к httpx.Response, чтобы ошибка была одинаковой для обоих бэкендов.
+
+    :param response: Ответ сервера.
+    """
+    if 200 <= response.status_code < 300:
+        return
+    if isinstance(response, Response):
+        response.raise_for_status()
+
+    request = Request(response.request.method, str(response.request.url))
+    raise HTTPStatusError(
+        f"HTTP {response.status_code} for url '{request.url}'",
+        request=request,
+        response=Response(response.status_code, content=response.content, request=request)
+    )
+
+
 class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
+    Вместо httpx.Client можно передать FastHTTPClient (clients/http/fast.py) — бэкенд на geventhttpclient
+    с тем же get/post; ответ у него FastResponse с теми же text, content и status_code.
+
+    :param client: экземпляр httpx.Client (или FastHTTPClient) для выполнения HTTP-запросов
+    :param validator: политика валидации ответов (см. clients/http/validation.py); по умолчанию — каждый ответ
+    :param raise_for_status: выбрасывать httpx.HTTPStatusError на ответы не 2xx (например, при сидинге,
+        чтобы ошибка gateway не превращалась в ошибку валидации тела ответа)
 
-    :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    Высокоуровневые методы наследников объявляют схему ответа, но при политиках sampled и lazy
+    возвращают LazyResponse, а при off — RawResponse, у которого обращение к полям схемы
+    выбрасывает AttributeError (только тело ответа в content).
     """
 
-    def __init__(self, client: Client):
+    def __init__(
+            self,
+            client: Client | FastHTTPClient,
+            validator: ResponseValidator | None = None,
+            raise_for_status: bool = False
+    ):
         self.client = client
+        self.validator = validator or ResponseValidator()
+        self.raise_for_status = raise_for_status
+
+    def validate(self, schema: type[T], response: Response) -> T | LazyResponse[T] | RawResponse[T]:
+        """
+        Валидирует тело ответа в схему согласно политике валидации клиента.
+
+        :param schema: Схема ответа.
+        :param response: Ответ сервера.
+        :return: Модель схемы (или её ленивая/сырая замена, см. ResponseValidator).
+        """
+        return self.validator.validate(schema, response.content)
     
     def get(self, url: URL | str, params: QueryParams | None = None, extensions: HTTPClientExtensions | None = None) -> Response:
         """
@@ -27,7 +79,10 @@ class HTTPClient:
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url, params=params, extensions=extensions)
+        response = self.client.get(url, params=params, extensions=extensions)
+        if self.raise_for_status:
+            raise_for_status(response)
+        return response
     
     def post(self, url: str, json: Any | None = None, extensions: HTTPClientExtensions | None = None) -> Response:
         """
@@ -38,5 +93,57 @@ class HTTPClient:
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json, extensions = extensions)
-    
\ No newline at end of file
+        response = self.client.post(url=url, json=json, extensions = extensions)
+        if self.raise_for_status:
+            raise_for_status(response)
+        return response
+    
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+    Используется там, где нужен asyncio вместо gevent (например, асинхронный сидер seeds/aio.py).
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param validator: политика валидации ответов (см. clients/http/validation.py); по умолчанию — каждый ответ
+
+    Высокоуровневые методы наследников объявляют схему ответа, но при политиках sampled и lazy
+    возвращают LazyResponse, а при off — RawResponse, у которого обращение к полям схемы
+    выбрасывает AttributeError (только тело ответа в content).
+    """
+
+    def __init__(self, client: AsyncClient, validator: ResponseValidator | None = None):
+        self.client = client
+        self.validator = validator or ResponseValidator()
+
+    def validate(self, schema: type[T], response: Response) -> T | LazyResponse[T] | RawResponse[T]:
+        """
+        Валидирует тело ответа в схему согласно политике валидации клиента.
+
+        :param schema: Схема ответа.
+        :param response: Ответ сервера.
+        :return: Модель схемы (или её ленивая/сырая замена, см. ResponseValidator).
+        """
+        return self.validator.validate(schema, response.content)
+
+    async def get(self, url: URL | str, params: QueryParams | None = None, extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url, params=params, extensions=extensions)
+
+    async def post(self, url: str, json: Any | None = None, extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.post(url=url, json=json, extensions=extensions)
@@ -14,6 +14,45 @@ def locust_request_event_hook(request: Request) -> None:
     request.extensions["start_time"] = time.time()
 
 
+def fire_locust_request_event(environment: Environment, response: Response) -> None:
+    """
+    Отправляет метрики прочитанного ответа в `environment.events.request`.
+    Общая часть синхронного и асинхронного response event hook.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param response: Ответ HTTPX с уже прочитанным телом.
+    """
+    exception: HTTPError | HTTPStatusError | None = None
+
+    try:
+        # Проверка на статус ошибки (например, 500, 404 и т.д.)
+        response = response.raise_for_status()
+    except (HTTPError, HTTPStatusError) as error:
+        exception = error
+
+    request = response.request
+
+    # Получаем route, если он был передан через extensions, иначе используем raw path
+    route = request.extensions.get("route", request.url.path)
+    # Время начала запроса, установленное в request event hook
+    start_time = request.extensions.get("start_time", time.time())
+    # Вычисляем длительность запроса в миллисекундах
+    response_time = (time.time() - start_time) * 1000
+    # Определяем размер тела ответа (можно заменить на 0, если не нужно)
+    response_length = len(response.content)
+
+    # Отправляем событие в Locust
+    environment.events.request.fire(
+        name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
+        context=None,  # Контекст (опционально, можно использовать для расширений)
+        response=response,  # Объект ответа (опционально)
+        exception=exception,  # Исключение, если оно произошло
+        request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
+        response_time=response_time,  # Время выполнения запроса в мс
+        response_length=response_length,  # Размер тела ответа
+    )
+
+
 def locust_response_event_hook(environment: Environment):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
@@ -27,34 +66,31 @@ def locust_response_event_hook(environment: Environment):
     """
 
     def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
-
-        try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
-
-        request = response.request
-
-        # Получаем route, если он был передан через extensions, иначе используем raw path
-        route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
-        )
-
-    return inner
\ No newline at end of file
+        # Читаем тело ответа, чтобы учесть его размер в метриках
+        response.read()
+        fire_locust_request_event(environment, response)
+
+    return inner
+
+
+async def locust_async_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный вариант locust_request_event_hook для httpx.AsyncClient.
+    """
+    locust_request_event_hook(request)
+
+
+def locust_async_response_event_hook(environment: Environment):
+    """
+    Асинхронный вариант locust_response_event_hook для httpx.AsyncClient:
+    метрики уходят в тот же `environment.events.request`, что и у синхронных клиентов.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :return: Асинхронная функция-хук для HTTPX response event hook.
+    """
+
+    async def inner(response: Response) -> None:
+        await response.aread()
+        fire_locust_request_event(environment, response)
+
+    return inner
@@ -0,0 +1,137 @@
+# HTTP-бэкенд на geventhttpclient (стек FastHttp из Locust).
+# FastHTTPClient повторяет методы httpx.Client, которые вызывает HTTPClient (get, post),
+# поэтому клиенты gateway работают с ним без изменений. Запрос стоит в несколько раз меньше CPU,
+# чем через httpx (см. clients/http/benchmark.py), так что генератор нагрузки дольше не упирается в процессор.
+from typing import Any
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+import gevent.ssl
+from geventhttpclient.client import HTTPClientPool
+from httpx import QueryParams
+from locust.contrib.fasthttp import FastHttpSession, FastResponse
+from locust.event import EventHook
+
+from clients.http.transport import get_pooled_transport
+from tools.config.http import HTTPClientConfig
+
+# Лимит соединений пула, если GATEWAY_HTTP_CLIENT.MAX_CONNECTIONS не задан (geventhttpclient требует число)
+DEFAULT_CONCURRENCY = 1000
+
+# Общие пулы соединений процесса и пулы виртуальных пользователей — как транспорты httpx (clients/http/transport.py)
+shared_client_pools: dict[str, HTTPClientPool] = {}
+user_client_pools: WeakKeyDictionary[object, dict[str, HTTPClientPool]] = WeakKeyDictionary()
+
+
+class FastHTTPRequestEvent:
+    """
+    Приводит события FastHttpSession к формату хуков httpx (clients/http/event_hooks/locust_event_hook.py):
+    имя "<метод> <route>" и тип запроса "HTTP", чтобы статистика не зависела от бэкенда.
+
+    Attributes:
+        request_event: Событие Locust (environment.events.request)
+    """
+
+    def __init__(self, request_event: EventHook):
+        self.request_event = request_event
+
+    def fire(self, *, request_type: str, name: str, **kwargs) -> None:
+        self.request_event.fire(request_type="HTTP", name=f"{request_type} {name}", **kwargs)
+
+
+class FastHTTPClient:
+    """
+    HTTP-клиент на FastHttpSession с интерфейсом httpx.Client, который использует HTTPClient.
+
+    Route для статистики берётся из extensions["route"], иначе — путь URL (как в хуках httpx).
+    Ответ — FastResponse (text, content, status_code, json() как у httpx.Response).
+    Ошибки соединения, как и у httpx, выбрасываются исключением (запрос при этом уже учтён в статистике).
+
+    :param base_url: Базовый адрес сервиса.
+    :param session: Сессия FastHttp с пулом соединений.
+    """
+
+    def __init__(self, base_url: str, session: FastHttpSession):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.session = session
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            params: QueryParams | None = None,
+            json: Any | None = None,
+            extensions: dict | None = None
+    ) -> FastResponse:
+        """
+        Выполняет запрос и отправляет метрики в событие сессии.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта относительно base_url.
+        :param params: GET-параметры запроса.
+        :param json: Данные в формате JSON.
+        :param extensions: Расширения запроса (route — имя запроса в статистике).
+        :return: Ответ FastResponse.
+        """
+        full_url = f"{self.base_url}{str(url).lstrip('/')}"
+        if params:
+            full_url = f"{full_url}?{QueryParams(params)}"
+        route = (extensions or {}).get("route") or urlparse(full_url).path
+
+        response = self.session.request(method, full_url, name=route, json=json)
+        if response.status_code == 0 and getattr(response, "error", None) is not None:
+            raise response.error
+
+        return response
+
+    def get(self, url: str, params: QueryParams | None = None, extensions: dict | None = None) -> FastResponse:
+        return self.request("GET", url, params=params, extensions=extensions)
+
+    def post(self, url: str, json: Any | None = None, extensions: dict | None = None) -> FastResponse:
+        return self.request("POST", url, json=json, extensions=extensions)
+
+
+def build_http_client_pool(config: HTTPClientConfig) -> HTTPClientPool:
+    """
+    Создаёт пул соединений geventhttpclient с лимитом и таймаутами из настроек клиента.
+
+    :param config: Настройки HTTP-клиента.
+    :return: Пул соединений.
+    """
+    return HTTPClientPool(
+        concurrency=config.max_connections or DEFAULT_CONCURRENCY,
+        connection_timeout=config.timeout,
+        network_timeout=config.timeout,
+        ssl_context_factory=gevent.ssl.create_default_context
+    )
+
+
+def build_fast_http_client(
+        config: HTTPClientConfig,
+        domain: str,
+        request_event: EventHook | None = None,
+        owner: object | None = None
+) -> FastHTTPClient:
+    """
+    Создаёт FastHTTPClient. Пул соединений общий согласно config.pool_sharing (см. get_http_transport).
+    HTTP/2 этот бэкенд не поддерживает: config.http2 игнорируется.
+
+    :param config: Настройки HTTP-клиента.
+    :param domain: Домен клиента (например, "users") — ключ общего пула в режиме DOMAIN.
+    :param request_event: Событие Locust для метрик; без него метрики никуда не отправляются.
+    :param owner: Владелец пула для режима USER (например, объект пользователя Locust).
+    :return: Готовый к использованию FastHTTPClient.
+    """
+    client_pool = get_pooled_transport(
+        config, domain, owner, build_http_client_pool, shared_client_pools, user_client_pools
+    )
+    session = FastHttpSession(
+        base_url=config.client_url,
+        request_event=FastHTTPRequestEvent(request_event or EventHook()),
+        user=None,
+        insecure=False,
+        client_pool=client_pool,
+        max_retries=0
+    )
+
+    return FastHTTPClient(config.client_url, session)
@@ -12,7 +12,11 @@ from clients.http.gateway.accounts.schema import (
     OpenSavingsAccountRequestSchema, 
     OpenSavingsAccountResponseSchema
     )
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    get_gateway_response_validator
+)
 from tools.routes import APIRoutes
 
 
@@ -20,6 +24,8 @@ from tools.routes import APIRoutes
 class AccountsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
     """
 
     def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
@@ -82,43 +88,47 @@ class AccountsGatewayHTTPClient(HTTPClient):
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.validate(GetAccountsResponseSchema, response)
 
     # Добавили новый метод
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.validate(OpenDepositAccountResponseSchema, response)
 
     # Добавили новый метод
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.validate(OpenSavingsAccountResponseSchema, response)
 
     # Добавили новый метод
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate(OpenDebitCardAccountResponseSchema, response)
 
     # Добавили новый метод
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate(OpenCreditCardAccountResponseSchema, response)
 
-def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_http_client(raise_for_status: bool = False) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param raise_for_status: выбрасывать httpx.HTTPStatusError на ответы не 2xx (см. HTTPClient).
     :return: Готовый к использованию AccountsGatewayHTTPClient.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+    return AccountsGatewayHTTPClient(client=build_gateway_http_client("accounts"), raise_for_status=raise_for_status)
 
 
 
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        owner: object | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -126,6 +136,10 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, "accounts", owner),
+        validator=get_gateway_response_validator()
+    )
\ No newline at end of file
@@ -0,0 +1,397 @@
+# Асинхронные клиенты http-gateway на httpx.AsyncClient.
+# Используют те же маршруты и схемы, что и синхронные клиенты в clients/http/gateway/*/client.py.
+import logging
+
+from httpx import AsyncClient, QueryParams
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.event_hooks.locust_event_hook import (
+    locust_async_request_event_hook,
+    locust_async_response_event_hook
+)
+from clients.http.gateway.client import (
+    get_gateway_response_validator,
+    report_http_stream_stats,
+    warn_http2_user_pool_sharing
+)
+from clients.http.gateway.accounts.schema import (
+    GetAccountsQuerySchema,
+    GetAccountsResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema
+)
+from clients.http.gateway.cards.schema import (
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema,
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema
+)
+from clients.http.gateway.documents.schema import GetContractDocumentResponseSchema, GetTariffDocumentResponseSchema
+from clients.http.gateway.operations.schema import (
+    GetOperationResponseSchema,
+    GetOperationsQuerySchema,
+    GetOperationsResponseSchema,
+    GetOperationsSummaryQuerySchema,
+    GetOperationsSummaryResponseSchema,
+    GetReceiptResponseSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeCashWithdrawalOperationResponseSchema,
+    MakeFeeOperationRequestSchema,
+    MakeFeeOperationResponseSchema,
+    MakePurchaseOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakeTransferOperationResponseSchema
+)
+from clients.http.gateway.users.schema import CreateUserRequestSchema, CreateUserResponseSchema, GetUserResponseSchema
+from clients.http.transport import get_http_async_transport
+from config import settings
+from tools.config.http import HTTPPoolSharing
+from tools.routes import APIRoutes
+
+
+def build_gateway_http_async_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url
+    )
+
+
+def build_gateway_locust_http_async_client(
+        environment: Environment,
+        domain: str = "gateway",
+        owner: object | None = None
+) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient, адаптированный под Locust (асинхронный вариант
+    build_gateway_locust_http_client): хуки отправляют метрики в тот же environment.events.request.
+
+    Клиент используется только из event loop процесса (см. tools/locust/aio.py).
+    Пул соединений общий согласно GATEWAY_HTTP_CLIENT.POOL_SHARING, как у синхронных клиентов.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param domain: Домен клиента (например, "users") — ключ общего пула в режиме DOMAIN.
+    :param owner: Виртуальный пользователь Locust — владелец пула в режиме USER.
+    :return: Экземпляр httpx.AsyncClient с хуками сбора метрик.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if settings.gateway_http_client.http2:
+        report_http_stream_stats(environment)
+        if settings.gateway_http_client.pool_sharing == HTTPPoolSharing.USER:
+            warn_http2_user_pool_sharing()
+
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        transport=get_http_async_transport(settings.gateway_http_client, domain, owner),
+        event_hooks={
+            "request": [locust_async_request_event_hook],
+            "response": [locust_async_response_event_hook(environment)]
+        }
+    )
+
+
+class UsersGatewayHTTPAsyncClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
+    """
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get(
+            f"{APIRoutes.USERS}{user_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
+        )
+        return self.validate(GetUserResponseSchema, response)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        request = CreateUserRequestSchema()
+        response = await self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        return self.validate(CreateUserResponseSchema, response)
+
+
+class AccountsGatewayHTTPAsyncClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
+    """
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get(
+            APIRoutes.ACCOUNTS,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRoutes.ACCOUNTS)
+        )
+        return self.validate(GetAccountsResponseSchema, response)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.post(f"{APIRoutes.ACCOUNTS}/open-deposit-account", json=request.model_dump(by_alias=True))
+        return self.validate(OpenDepositAccountResponseSchema, response)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.post(f"{APIRoutes.ACCOUNTS}/open-savings-account", json=request.model_dump(by_alias=True))
+        return self.validate(OpenSavingsAccountResponseSchema, response)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(OpenDebitCardAccountResponseSchema, response)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(OpenCreditCardAccountResponseSchema, response)
+
+
+class CardsGatewayHTTPAsyncClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
+    """
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.CARDS}/issue-virtual-card", json=request.model_dump(by_alias=True))
+        return self.validate(IssueVirtualCardResponseSchema, response)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.CARDS}/issue-physical-card", json=request.model_dump(by_alias=True))
+        return self.validate(IssuePhysicalCardResponseSchema, response)
+
+
+class DocumentsGatewayHTTPAsyncClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
+    """
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        response = await self.get(
+            f"{APIRoutes.DOCUMENTS}/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}")
+        )
+        return self.validate(GetTariffDocumentResponseSchema, response)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        response = await self.get(
+            f"{APIRoutes.DOCUMENTS}/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}")
+        )
+        return self.validate(GetContractDocumentResponseSchema, response)
+
+
+class OperationsGatewayHTTPAsyncClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
+    """
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+        response = await self.get(
+            f"{APIRoutes.OPERATIONS}/{operation_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/{{operation_id}}")
+        )
+        return self.validate(GetOperationResponseSchema, response)
+
+    async def get_operations_receipt(self, operation_id: str) -> GetReceiptResponseSchema:
+        response = await self.get(
+            f"{APIRoutes.OPERATIONS}/operation-receipt/{operation_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operation-receipt/{{operation_id}}")
+        )
+        return self.validate(GetReceiptResponseSchema, response)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get(
+            APIRoutes.OPERATIONS,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRoutes.OPERATIONS)
+        )
+        return self.validate(GetOperationsResponseSchema, response)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+        query = GetOperationsSummaryQuerySchema(account_id=account_id)
+        response = await self.get(
+            f"{APIRoutes.OPERATIONS}/operations-summary",
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operations-summary")
+        )
+        return self.validate(GetOperationsSummaryResponseSchema, response)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+        request = MakeFeeOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(
+            f"{APIRoutes.OPERATIONS}/make-fee-operation",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(MakeFeeOperationResponseSchema, response)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+        request = MakeCashbackOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(
+            f"{APIRoutes.OPERATIONS}/make-cashback-operation",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(MakeCashbackOperationResponseSchema, response)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+        request = MakeBillPaymentOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(
+            f"{APIRoutes.OPERATIONS}/make-bill-payment-operation",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(MakeBillPaymentOperationResponseSchema, response)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(
+            f"{APIRoutes.OPERATIONS}/make-top-up-operation",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(MakeTopUpOperationResponseSchema, response)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(
+            f"{APIRoutes.OPERATIONS}/make-transfer-operation",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(MakeTransferOperationResponseSchema, response)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+        request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(
+            f"{APIRoutes.OPERATIONS}/make-purchase-operation",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(MakePurchaseOperationResponseSchema, response)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeCashWithdrawalOperationResponseSchema:
+        request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(
+            f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation",
+            json=request.model_dump(by_alias=True)
+        )
+        return self.validate(MakeCashWithdrawalOperationResponseSchema, response)
+
+
+def build_users_gateway_locust_http_async_client(
+        environment: Environment,
+        owner: object | None = None
+) -> UsersGatewayHTTPAsyncClient:
+    """
+    Функция создаёт экземпляр UsersGatewayHTTPAsyncClient, адаптированный под Locust.
+
+    :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
+    :return: экземпляр UsersGatewayHTTPAsyncClient с хуками сбора метрик.
+    """
+    return UsersGatewayHTTPAsyncClient(
+        client=build_gateway_locust_http_async_client(environment, "users", owner),
+        validator=get_gateway_response_validator()
+    )
+
+
+def build_accounts_gateway_locust_http_async_client(
+        environment: Environment,
+        owner: object | None = None
+) -> AccountsGatewayHTTPAsyncClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayHTTPAsyncClient, адаптированный под Locust.
+
+    :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
+    :return: экземпляр AccountsGatewayHTTPAsyncClient с хуками сбора метрик.
+    """
+    return AccountsGatewayHTTPAsyncClient(
+        client=build_gateway_locust_http_async_client(environment, "accounts", owner),
+        validator=get_gateway_response_validator()
+    )
+
+
+def build_cards_gateway_locust_http_async_client(
+        environment: Environment,
+        owner: object | None = None
+) -> CardsGatewayHTTPAsyncClient:
+    """
+    Функция создаёт экземпляр CardsGatewayHTTPAsyncClient, адаптированный под Locust.
+
+    :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
+    :return: экземпляр CardsGatewayHTTPAsyncClient с хуками сбора метрик.
+    """
+    return CardsGatewayHTTPAsyncClient(
+        client=build_gateway_locust_http_async_client(environment, "cards", owner),
+        validator=get_gateway_response_validator()
+    )
+
+
+def build_documents_gateway_locust_http_async_client(
+        environment: Environment,
+        owner: object | None = None
+) -> DocumentsGatewayHTTPAsyncClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayHTTPAsyncClient, адаптированный под Locust.
+
+    :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
+    :return: экземпляр DocumentsGatewayHTTPAsyncClient с хуками сбора метрик.
+    """
+    return DocumentsGatewayHTTPAsyncClient(
+        client=build_gateway_locust_http_async_client(environment, "documents", owner),
+        validator=get_gateway_response_validator()
+    )
+
+
+def build_operations_gateway_locust_http_async_client(
+        environment: Environment,
+        owner: object | None = None
+) -> OperationsGatewayHTTPAsyncClient:
+    """
+    Функция создаёт экземпляр OperationsGatewayHTTPAsyncClient, адаптированный под Locust.
+
+    :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
+    :return: экземпляр OperationsGatewayHTTPAsyncClient с хуками сбора метрик.
+    """
+    return OperationsGatewayHTTPAsyncClient(
+        client=build_gateway_locust_http_async_client(environment, "operations", owner),
+        validator=get_gateway_response_validator()
+    )
@@ -4,7 +4,11 @@ from clients.http.gateway.cards.schema import (
     IssuePhysicalCardResponseSchema,
     IssueVirtualCardRequestSchema,
     IssueVirtualCardResponseSchema)
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    get_gateway_response_validator
+)
 from httpx import Response
 
 from clients.http.client import HTTPClient
@@ -15,6 +19,8 @@ from tools.routes import APIRoutes
 class CardsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/cards/issue-virtual-card.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
     """
 
     def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
@@ -43,24 +49,28 @@ class CardsGatewayHTTPClient(HTTPClient):
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.validate(IssueVirtualCardResponseSchema, response)
 
     # Добавили новый метод
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.validate(IssuePhysicalCardResponseSchema, response)
 
-def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
+def build_cards_gateway_http_client(raise_for_status: bool = False) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param raise_for_status: выбрасывать httpx.HTTPStatusError на ответы не 2xx (см. HTTPClient).
     :return: Готовый к использованию CardsGatewayHTTPClient.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+    return CardsGatewayHTTPClient(client=build_gateway_http_client("cards"), raise_for_status=raise_for_status)
 
 
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        owner: object | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -68,6 +78,10 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, "cards", owner),
+        validator=get_gateway_response_validator()
+    )
@@ -1,4 +1,6 @@
 import logging
+from functools import cache
+
 from httpx import Client
 from locust.env import Environment
 from config import settings
@@ -6,18 +8,79 @@ from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,  # Хук для отслеживания начала запроса
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
+from clients.http.fast import FastHTTPClient, build_fast_http_client
+from clients.http.transport import get_http_transport, http_stream_stats
+from clients.http.validation import ResponseValidator
+from tools.config.http import HTTPClientBackend, HTTPPoolSharing
+from tools.logger import get_logger
+
+logger = get_logger("GATEWAY_HTTP_CLIENT")
 
-def build_gateway_http_client() -> Client:
+def build_gateway_http_client(domain: str = "gateway") -> Client | FastHTTPClient:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
+    Пул соединений берётся согласно GATEWAY_HTTP_CLIENT.POOL_SHARING (см. clients/http/transport.py).
+    При GATEWAY_HTTP_CLIENT.BACKEND=fasthttp вместо httpx используется FastHTTPClient (clients/http/fast.py).
 
-    :return: Готовый к использованию объект httpx.Client.
+    :param domain: Домен клиента (например, "users") — ключ общего пула в режиме DOMAIN.
+    :return: Готовый к использованию объект httpx.Client (или FastHTTPClient).
     """
+    if settings.gateway_http_client.backend == HTTPClientBackend.FAST_HTTP:
+        return build_fast_http_client(settings.gateway_http_client, domain)
+
     return Client(
         timeout=settings.gateway_http_client.timeout, 
-        base_url=settings.gateway_http_client.client_url)
+        base_url=settings.gateway_http_client.client_url,
+        transport=get_http_transport(settings.gateway_http_client, domain))
+
+@cache
+def get_gateway_response_validator() -> ResponseValidator:
+    """
+    Политика валидации ответов нагрузочных клиентов http-gateway согласно GATEWAY_HTTP_CLIENT.VALIDATION.
+    Валидатор один на процесс, поэтому в режиме sampled каждый N-й ответ считается по всем клиентам процесса.
+    Клиенты вне Locust (например, сидинг) валидируют каждый ответ: им нужны данные ответов.
+
+    :return: Валидатор ответов.
+    """
+    return ResponseValidator(
+        policy=settings.gateway_http_client.validation,
+        sample_rate=settings.gateway_http_client.validation_sample_rate
+    )
+
+
+@cache
+def warn_http2_user_pool_sharing() -> None:
+    """
+    Предупреждает (один раз на процесс), что HTTP/2 включён при POOL_SHARING=user: у каждого виртуального
+    пользователя своё соединение, и запросы разных пользователей не мультиплексируются.
+    """
+    logger.warning(
+        "GATEWAY_HTTP_CLIENT.HTTP2 is enabled with POOL_SHARING=user: every virtual user opens its own "
+        "HTTP/2 connection and requests are not multiplexed across users. Use POOL_SHARING=global or domain."
+    )
+
+
+def report_http_stream_stats(environment: Environment) -> None:
+    """
+    Подключает вывод потоковых метрик HTTP/2 (см. HTTPStreamStats) в лог по окончании теста.
+    Подключается один раз на окружение Locust; каждый процесс (воркер) выводит свои метрики.
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+    :param environment: Объект окружения Locust.
+    """
+    if getattr(environment, "http_stream_stats_reported", False):
+        return
+    environment.http_stream_stats_reported = True
+
+    @environment.events.test_stop.add_listener
+    def on_test_stop(**kwargs):
+        logger.info(f"HTTP streams of {settings.gateway_http_client.client_url}: {http_stream_stats.summary()}")
+
+
+def build_gateway_locust_http_client(
+        environment: Environment,
+        domain: str = "gateway",
+        owner: object | None = None
+) -> Client | FastHTTPClient:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -29,16 +92,33 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Пул соединений общий согласно GATEWAY_HTTP_CLIENT.POOL_SHARING: на виртуального пользователя (owner),
+    на домен или на весь процесс (см. clients/http/transport.py). При GATEWAY_HTTP_CLIENT.HTTP2
+    запросы идут потоками HTTP/2, а по окончании теста в лог выводятся потоковые метрики.
+
+    При GATEWAY_HTTP_CLIENT.BACKEND=fasthttp возвращается FastHTTPClient на geventhttpclient:
+    метрики уходят в тот же `environment.events.request` с теми же именами запросов.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
-    :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
+    :param domain: Домен клиента (например, "users") — ключ общего пула в режиме DOMAIN.
+    :param owner: Виртуальный пользователь Locust — владелец пула в режиме USER.
+    :return: httpx.Client (или FastHTTPClient) с подключёнными хуками под нагрузочное тестирование.
     """
+    if settings.gateway_http_client.backend == HTTPClientBackend.FAST_HTTP:
+        return build_fast_http_client(settings.gateway_http_client, domain, environment.events.request, owner)
+
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
+    if settings.gateway_http_client.http2:
+        report_http_stream_stats(environment)
+        if settings.gateway_http_client.pool_sharing == HTTPPoolSharing.USER:
+            warn_http2_user_pool_sharing()
 
     return Client(
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        transport=get_http_transport(settings.gateway_http_client, domain, owner),
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
             "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
@@ -2,7 +2,8 @@ from httpx import Response
 from locust.env import Environment
 from clients.http.gateway.client import (
     build_gateway_http_client, 
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    get_gateway_response_validator
 )
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.documents.schema import (
@@ -16,6 +17,8 @@ from tools.routes import APIRoutes
 class DocumentsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
     """
 
     def get_tariff_document_api(self, account_id: str) -> Response:
@@ -42,23 +45,27 @@ class DocumentsGatewayHTTPClient(HTTPClient):
     
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.validate(GetTariffDocumentResponseSchema, response)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.validate(GetContractDocumentResponseSchema, response)
 
 
-def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_http_client(raise_for_status: bool = False) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param raise_for_status: выбрасывать httpx.HTTPStatusError на ответы не 2xx (см. HTTPClient).
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+    return DocumentsGatewayHTTPClient(client=build_gateway_http_client("documents"), raise_for_status=raise_for_status)
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        owner: object | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -66,6 +73,10 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, "documents", owner),
+        validator=get_gateway_response_validator()
+    )
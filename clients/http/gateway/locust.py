@@ -1,6 +1,18 @@
 from locust import TaskSet, SequentialTaskSet
 
 
+from clients.http.gateway.aio import (
+    AccountsGatewayHTTPAsyncClient,
+    CardsGatewayHTTPAsyncClient,
+    DocumentsGatewayHTTPAsyncClient,
+    OperationsGatewayHTTPAsyncClient,
+    UsersGatewayHTTPAsyncClient,
+    build_accounts_gateway_locust_http_async_client,
+    build_cards_gateway_locust_http_async_client,
+    build_documents_gateway_locust_http_async_client,
+    build_operations_gateway_locust_http_async_client,
+    build_users_gateway_locust_http_async_client
+)
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
 from clients.http.gateway.documents.client import (
@@ -12,6 +24,7 @@ from clients.http.gateway.operations.client import (
     build_operations_gateway_locust_http_client
 )
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from tools.locust.aio import AsyncTaskSet, AsyncSequentialTaskSet
 
 class GatewayHTTPTaskSet(TaskSet):
     """
@@ -32,12 +45,14 @@ class GatewayHTTPTaskSet(TaskSet):
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
+        Клиенты делят пул соединений согласно GATEWAY_HTTP_CLIENT.POOL_SHARING
+        (по умолчанию — один пул на виртуального пользователя).
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, self.user)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, self.user)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, self.user)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, self.user)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, self.user)
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     """
@@ -57,8 +72,54 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
\ No newline at end of file
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, self.user)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, self.user)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, self.user)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, self.user)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, self.user)
+
+
+class GatewayHTTPAsyncTaskSet(AsyncTaskSet):
+    """
+    Базовый AsyncTaskSet для асинхронных HTTP-сценариев, работающих с http-gateway.
+
+    Задачи пишутся как корутины (async def с @task) и используют асинхронные клиенты gateway
+    (clients/http/gateway/aio.py). Запускается пользователем AsyncLocustBaseUser.
+    """
+
+    users_gateway_client: UsersGatewayHTTPAsyncClient
+    cards_gateway_client: CardsGatewayHTTPAsyncClient
+    accounts_gateway_client: AccountsGatewayHTTPAsyncClient
+    documents_gateway_client: DocumentsGatewayHTTPAsyncClient
+    operations_gateway_client: OperationsGatewayHTTPAsyncClient
+
+    def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов. Пулы соединений — как у GatewayHTTPTaskSet.
+        """
+        self.users_gateway_client = build_users_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.cards_gateway_client = build_cards_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.documents_gateway_client = build_documents_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.operations_gateway_client = build_operations_gateway_locust_http_async_client(self.user.environment, self.user)
+
+class GatewayHTTPAsyncSequentialTaskSet(AsyncSequentialTaskSet):
+    """
+    Базовый AsyncSequentialTaskSet для асинхронных HTTP-сценариев, где важен порядок выполнения задач.
+    """
+
+    users_gateway_client: UsersGatewayHTTPAsyncClient
+    cards_gateway_client: CardsGatewayHTTPAsyncClient
+    accounts_gateway_client: AccountsGatewayHTTPAsyncClient
+    documents_gateway_client: DocumentsGatewayHTTPAsyncClient
+    operations_gateway_client: OperationsGatewayHTTPAsyncClient
+
+    def on_start(self) -> None:
+        """
+        Создание асинхронных API клиентов для последовательного сценария.
+        """
+        self.users_gateway_client = build_users_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.cards_gateway_client = build_cards_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.documents_gateway_client = build_documents_gateway_locust_http_async_client(self.user.environment, self.user)
+        self.operations_gateway_client = build_operations_gateway_locust_http_async_client(self.user.environment, self.user)
@@ -3,7 +3,8 @@ from locust.env import Environment
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (
     build_gateway_http_client, 
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    get_gateway_response_validator
     )
 from clients.http.gateway.operations.schema import (
     MakeBillPaymentOperationResponseSchema, 
@@ -34,6 +35,8 @@ from tools.routes import APIRoutes
 class OperationsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
     """
 
     def get_operation_api(self, operation_id: str) -> Response:
@@ -162,21 +165,21 @@ class OperationsGatewayHTTPClient(HTTPClient):
     
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(GetOperationResponseSchema, response)
     
     def get_operations_receipt(self, operation_id: str) -> GetReceiptResponseSchema:
         response = self.get_operations_receipt_api(operation_id)
-        return GetReceiptResponseSchema.model_validate_json(response.text)
+        return self.validate(GetReceiptResponseSchema, response)
     
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(account_id = account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.validate(GetOperationsResponseSchema, response)
     
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(account_id = account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.validate(GetOperationsSummaryResponseSchema, response)
     
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
         request = MakeFeeOperationRequestSchema(
@@ -184,7 +187,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(MakeFeeOperationResponseSchema, response)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
         request = MakeTopUpOperationRequestSchema(
@@ -192,7 +195,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response =self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(MakeTopUpOperationResponseSchema, response)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
         request = MakeCashbackOperationRequestSchema(
@@ -200,7 +203,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response =self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(MakeCashbackOperationResponseSchema, response)
     
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
         request = MakeTransferOperationRequestSchema(
@@ -208,7 +211,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response =self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(MakeTransferOperationResponseSchema, response)
     
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
         request = MakePurchaseOperationRequestSchema(
@@ -216,7 +219,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response =self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(MakePurchaseOperationResponseSchema, response)
     
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
         request = MakeBillPaymentOperationRequestSchema(
@@ -224,7 +227,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response =self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(MakeBillPaymentOperationResponseSchema, response)
     
     def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
         request = MakeCashWithdrawalOperationRequestSchema(
@@ -232,18 +235,22 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response =self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.validate(MakeCashWithdrawalOperationResponseSchema, response)
     
-def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
+def build_operations_gateway_http_client(raise_for_status: bool = False) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param raise_for_status: выбрасывать httpx.HTTPStatusError на ответы не 2xx (см. HTTPClient).
     :return: Готовый к использованию OperationsGatewayHTTPClient.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
+    return OperationsGatewayHTTPClient(client=build_gateway_http_client("operations"), raise_for_status=raise_for_status)
 
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        owner: object | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -251,6 +258,10 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, "operations", owner),
+        validator=get_gateway_response_validator()
+    )
@@ -1,6 +1,10 @@
 from locust.env import Environment
 from httpx import Response
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    get_gateway_response_validator
+)
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.users.schema import CreateUserResponseSchema, GetUserResponseSchema, CreateUserRequestSchema
 from tools.routes import APIRoutes
@@ -9,6 +13,8 @@ from tools.routes import APIRoutes
 class UsersGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    Методы, возвращающие схему ответа, валидируют его согласно политике клиента (см. HTTPClient.validate):
+    при GATEWAY_HTTP_CLIENT.VALIDATION=off обращение к полям ответа выбрасывает AttributeError.
     """
 
     def get_user_api(self, user_id: str) -> Response:
@@ -34,23 +40,27 @@ class UsersGatewayHTTPClient(HTTPClient):
     
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.validate(GetUserResponseSchema, response)
     
     def create_user(self) -> CreateUserResponseSchema:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.validate(CreateUserResponseSchema, response)
     
-def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
+def build_users_gateway_http_client(raise_for_status: bool = False) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param raise_for_status: выбрасывать httpx.HTTPStatusError на ответы не 2xx (см. HTTPClient).
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+    return UsersGatewayHTTPClient(client=build_gateway_http_client("users"), raise_for_status=raise_for_status)
 
 
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        owner: object | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -58,6 +68,10 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param owner: виртуальный пользователь Locust — владелец пула соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, "users", owner),
+        validator=get_gateway_response_validator()
+    )
\ No newline at end of file
@@ -0,0 +1,244 @@
+import ssl
+from collections import Counter
+from functools import cache
+from typing import Callable, TypeVar
+from weakref import WeakKeyDictionary
+
+from httpx import AsyncHTTPTransport, HTTPTransport, Limits, Request, Response, create_ssl_context
+
+from tools.config.http import HTTPClientConfig, HTTPPoolSharing
+
+
+class HTTPStreamStats:
+    """
+    Потоковые метрики HTTP-транспортов процесса: сколько ответов пришло по каждой версии HTTP,
+    сколько соединений (сокетов) открыто и сколько потоков (запросов) прошло через каждое,
+    а также пик одновременных запросов. По ним видно, насколько HTTP/2 мультиплексирует запросы
+    виртуальных пользователей и во сколько раз сокращает количество сокетов.
+
+    Attributes:
+        responses: Количество ответов по версии HTTP (например, "HTTP/2")
+        connections: Количество открытых соединений
+        streams: Количество потоков (запросов) по соединению (живые соединения)
+        max_stream_id: Наибольший ID потока HTTP/2
+        in_flight: Запросы, ожидающие ответа
+        peak_in_flight: Пик одновременных запросов
+    """
+
+    def __init__(self):
+        self.responses: Counter[str] = Counter()
+        self.connections = 0
+        self.streams: WeakKeyDictionary[object, int] = WeakKeyDictionary()
+        self.max_stream_id = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def open_stream(self) -> None:
+        """Отмечает отправку запроса"""
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def close_stream(self, response: Response | None) -> None:
+        """Отмечает получение ответа (или ошибку запроса, если response=None)"""
+        self.in_flight -= 1
+        if response is None:
+            return
+
+        self.responses[response.http_version] += 1
+        self.max_stream_id = max(self.max_stream_id, response.extensions.get("stream_id", 0))
+        network_stream = response.extensions.get("network_stream")
+        if network_stream is not None:
+            if network_stream not in self.streams:
+                self.connections += 1
+            self.streams[network_stream] = self.streams.get(network_stream, 0) + 1
+
+    def summary(self) -> str:
+        """Сводка метрик в одну строку для лога"""
+        versions = ", ".join(f"{version}: {count}" for version, count in sorted(self.responses.items())) or "-"
+        streams = list(self.streams.values())
+        per_connection = sum(streams) / len(streams) if streams else 0
+        return (
+            f"responses ({versions}), {self.connections} connections opened, {len(streams)} alive "
+            f"with {per_connection:.1f} streams per connection, peak {self.peak_in_flight} concurrent streams, "
+            f"max HTTP/2 stream id {self.max_stream_id}"
+        )
+
+
+# Метрики всех метрируемых транспортов процесса
+http_stream_stats = HTTPStreamStats()
+
+
+class MeteredHTTPTransport(HTTPTransport):
+    """
+    Транспорт httpx, который записывает потоковые метрики запросов в HTTPStreamStats.
+    """
+
+    def __init__(self, stats: HTTPStreamStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    def handle_request(self, request: Request) -> Response:
+        self.stats.open_stream()
+        response = None
+        try:
+            response = super().handle_request(request)
+            return response
+        finally:
+            self.stats.close_stream(response)
+
+
+class MeteredAsyncHTTPTransport(AsyncHTTPTransport):
+    """
+    Асинхронный транспорт httpx, который записывает потоковые метрики запросов в HTTPStreamStats.
+    """
+
+    def __init__(self, stats: HTTPStreamStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    async def handle_async_request(self, request: Request) -> Response:
+        self.stats.open_stream()
+        response = None
+        try:
+            response = await super().handle_async_request(request)
+            return response
+        finally:
+            self.stats.close_stream(response)
+
+
+# Транспорт httpx (синхронный или асинхронный) или пул соединений другого бэкенда (см. clients/http/fast.py)
+T = TypeVar("T")
+
+# Общие транспорты (пулы соединений) процесса по ключу: адрес сервиса и домен (для DOMAIN)
+shared_transports: dict[str, HTTPTransport] = {}
+# Транспорты виртуальных пользователей (для USER): удаляются вместе с пользователем
+user_transports: WeakKeyDictionary[object, dict[str, HTTPTransport]] = WeakKeyDictionary()
+# То же для асинхронных транспортов: они живут в event loop процесса (см. tools/locust/aio.py)
+shared_async_transports: dict[str, AsyncHTTPTransport] = {}
+user_async_transports: WeakKeyDictionary[object, dict[str, AsyncHTTPTransport]] = WeakKeyDictionary()
+
+
+def build_http_limits(config: HTTPClientConfig) -> Limits:
+    """
+    Лимиты пула соединений и keep-alive из настроек клиента.
+    """
+    return Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry
+    )
+
+
+@cache
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Общий SSL-контекст транспортов процесса. Загрузка корневых сертификатов стоит десятки миллисекунд
+    на контекст (даже для http), поэтому при пуле на пользователя свой контекст на каждый транспорт
+    заметно замедляет спавн тысяч пользователей.
+    """
+    return create_ssl_context()
+
+
+def build_http_transport(config: HTTPClientConfig) -> HTTPTransport:
+    """
+    Создаёт транспорт httpx (пул соединений) с лимитами и keep-alive из настроек клиента.
+
+    При config.http2 запросы мультиплексируются потоками HTTP/2 поверх общих соединений:
+    для https версия согласуется через ALPN, для http используется HTTP/2 без согласования
+    (prior knowledge, h2c) — gateway должен его поддерживать. Такой транспорт пишет
+    потоковые метрики в http_stream_stats. Нужен пакет h2 (httpx[http2]).
+
+    :param config: Настройки HTTP-клиента.
+    :return: Транспорт httpx.
+    """
+    if not config.http2:
+        return HTTPTransport(verify=get_ssl_context(), limits=build_http_limits(config))
+
+    return MeteredHTTPTransport(
+        http_stream_stats,
+        verify=get_ssl_context(),
+        limits=build_http_limits(config),
+        http1=config.url.scheme == "https",
+        http2=True
+    )
+
+
+def build_http_async_transport(config: HTTPClientConfig) -> AsyncHTTPTransport:
+    """
+    Создаёт асинхронный транспорт httpx с теми же настройками, что и build_http_transport.
+
+    :param config: Настройки HTTP-клиента.
+    :return: Асинхронный транспорт httpx.
+    """
+    if not config.http2:
+        return AsyncHTTPTransport(verify=get_ssl_context(), limits=build_http_limits(config))
+
+    return MeteredAsyncHTTPTransport(
+        http_stream_stats,
+        verify=get_ssl_context(),
+        limits=build_http_limits(config),
+        http1=config.url.scheme == "https",
+        http2=True
+    )
+
+
+def get_pooled_transport(
+        config: HTTPClientConfig,
+        domain: str,
+        owner: object | None,
+        build: Callable[[HTTPClientConfig], T],
+        shared: dict[str, T],
+        users: WeakKeyDictionary[object, dict[str, T]]
+) -> T:
+    """
+    Возвращает транспорт (пул соединений) согласно config.pool_sharing из реестров shared и users,
+    создавая его через build (см. get_http_transport).
+    """
+    if config.pool_sharing == HTTPPoolSharing.USER:
+        if owner is None:
+            return build(config)
+        transports = users.setdefault(owner, {})
+        if config.client_url not in transports:
+            transports[config.client_url] = build(config)
+        return transports[config.client_url]
+
+    key = config.client_url if config.pool_sharing == HTTPPoolSharing.GLOBAL else f"{config.client_url}|{domain}"
+    if key not in shared:
+        shared[key] = build(config)
+    return shared[key]
+
+
+def get_http_transport(config: HTTPClientConfig, domain: str, owner: object | None = None) -> HTTPTransport:
+    """
+    Возвращает транспорт (пул соединений) для клиента домена согласно config.pool_sharing:
+    - USER: один пул на владельца (виртуального пользователя Locust), общий для всех его доменных клиентов;
+      без владельца у клиента свой пул;
+    - DOMAIN: один пул на домен (users, cards, ...) на процесс, общий для всех пользователей;
+    - GLOBAL: один пул на процесс для всех доменов и пользователей.
+
+    Клиенты httpx с общим транспортом остаются отдельными (у каждого свои хуки и base_url),
+    но соединения и keep-alive у них общие: меньше пулов, файловых дескрипторов и handshake'ов при спавне.
+    При DOMAIN и GLOBAL max_connections ограничивает одновременные запросы всех пользователей процесса
+    (для HTTP/1.1; соединение HTTP/2 несёт много запросов, поэтому с HTTP/2 обычно выбирают GLOBAL).
+
+    :param config: Настройки HTTP-клиента.
+    :param domain: Домен клиента (например, "users").
+    :param owner: Владелец пула для режима USER (например, объект пользователя Locust).
+    :return: Транспорт httpx.
+    """
+    return get_pooled_transport(config, domain, owner, build_http_transport, shared_transports, user_transports)
+
+
+def get_http_async_transport(config: HTTPClientConfig, domain: str, owner: object | None = None) -> AsyncHTTPTransport:
+    """
+    Возвращает асинхронный транспорт (пул соединений) для клиента домена, как get_http_transport.
+    Асинхронные транспорты хранятся отдельно от синхронных и используются только из event loop процесса.
+
+    :param config: Настройки HTTP-клиента.
+    :param domain: Домен клиента (например, "users").
+    :param owner: Владелец пула для режима USER (например, объект пользователя Locust).
+    :return: Асинхронный транспорт httpx.
+    """
+    return get_pooled_transport(
+        config, domain, owner, build_http_async_transport, shared_async_transports, user_async_transports
+    )
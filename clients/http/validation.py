@@ -0,0 +1,105 @@
+# Политика валидации ответов HTTP-клиентов.
+# Разбор JSON в pydantic-схему — заметная доля CPU генератора нагрузки на каждый запрос.
+# В нагрузочном прогоне схему ответа обычно достаточно проверять выборочно, а сценарию часто
+# нужны лишь отдельные ответы (например, user_id созданного пользователя), поэтому валидацию
+# можно делать на каждом N-м ответе, откладывать до первого обращения к полю или отключать.
+from itertools import count
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+from tools.config.http import HTTPResponseValidation
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LazyResponse(Generic[T]):
+    """
+    Ответ, который валидируется в схему при первом обращении к атрибуту (затем — как обычная модель).
+    Ошибка валидации выбрасывается в месте обращения, а не в месте запроса.
+    Это не экземпляр схемы: isinstance(response, schema) ложно, а передать его в поле другой модели нельзя.
+
+    :param schema: Схема ответа.
+    :param content: Тело ответа.
+    """
+
+    __slots__ = ("_lazy_schema", "_lazy_content", "_lazy_model")
+
+    def __init__(self, schema: type[T], content: bytes):
+        self._lazy_schema = schema
+        self._lazy_content = content
+        self._lazy_model: T | None = None
+
+    def __getattr__(self, name: str):
+        if self._lazy_model is None:
+            self._lazy_model = self._lazy_schema.model_validate_json(self._lazy_content)
+        return getattr(self._lazy_model, name)
+
+    def __repr__(self) -> str:
+        if self._lazy_model is None:
+            return f"LazyResponse[{self._lazy_schema.__name__}]({len(self._lazy_content)} bytes)"
+        return repr(self._lazy_model)
+
+
+class RawResponse(Generic[T]):
+    """
+    Непровалидированный ответ при выключенной валидации: только схема и тело ответа в байтах.
+    Обращение к полям схемы — ошибка: сценарий, которому нужны данные ответа, должен использовать lazy.
+
+    :param schema: Схема ответа.
+    :param content: Тело ответа.
+    """
+
+    __slots__ = ("schema", "content")
+
+    def __init__(self, schema: type[T], content: bytes):
+        self.schema = schema
+        self.content = content
+
+    def __getattr__(self, name: str):
+        raise AttributeError(
+            f"Response validation is off: {self.schema.__name__}.{name} is not available "
+            f"(use GATEWAY_HTTP_CLIENT.VALIDATION=lazy to read responses)"
+        )
+
+    def __repr__(self) -> str:
+        return f"RawResponse[{self.schema.__name__}]({len(self.content)} bytes)"
+
+
+class ResponseValidator:
+    """
+    Валидирует тело ответа в схему согласно политике:
+    - full — каждый ответ сразу (по умолчанию, как без политики);
+    - sampled — каждый sample_rate-й ответ сразу, остальные лениво (LazyResponse):
+      нарушение контракта видно в статистике Locust, а данные ответа по-прежнему доступны сценарию;
+    - lazy — при первом обращении к полю (LazyResponse); ответ, который сценарий не читает, не разбирается;
+    - off — не валидирует (RawResponse с телом ответа в байтах).
+
+    Тело валидируется из байтов (response.content) — без промежуточного декодирования в строку.
+    Счётчик выборки общий для всех клиентов с этим валидатором (см. get_gateway_response_validator).
+
+    :param policy: Политика валидации.
+    :param sample_rate: Для sampled — валидировать сразу один ответ из sample_rate.
+    """
+
+    def __init__(self, policy: HTTPResponseValidation = HTTPResponseValidation.FULL, sample_rate: int = 1):
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.counter = count()
+
+    def validate(self, schema: type[T], content: bytes) -> T | LazyResponse[T] | RawResponse[T]:
+        """
+        Валидирует тело ответа в схему согласно политике.
+
+        :param schema: Схема ответа.
+        :param content: Тело ответа.
+        :return: Модель схемы, LazyResponse или RawResponse (см. политики).
+        """
+        if self.policy == HTTPResponseValidation.FULL:
+            return schema.model_validate_json(content)
+        if self.policy == HTTPResponseValidation.OFF:
+            return RawResponse(schema, content)
+        if self.policy == HTTPResponseValidation.SAMPLED and next(self.counter) % self.sample_rate == 0:
+            return schema.model_validate_json(content)
+
+        return LazyResponse(schema, content)
@@ -3,8 +3,9 @@ from locust.env import Environment
 
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.locust import init_seeds
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
-from seeds.schema.result import SeedUserResult
+from seeds.user import SeedUser
 from tools.locust.user import LocustBaseUser
 
 
@@ -12,20 +13,15 @@ from tools.locust.user import LocustBaseUser
 # Мы используем его, чтобы заранее прогнать сидинг и загрузить пользователей в память.
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Создаем экземпляр сидинг-сценария
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
-
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг (в распределённом режиме — один раз на мастере, воркеры получают свою часть пула)
+    # и загружаем результат в окружение Locust
+    init_seeds(environment, ExistingUserGetDocumentsSeedsScenario())
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
 class GetDocumentsTaskSet(GatewayGRPCTaskSet):
     # Типизируем объект пользователя из сидинга
-    seed_user: SeedUserResult
+    seed_user: SeedUser
 
     # Метод вызывается при запуске каждой сессии пользователя (до начала задач)
     def on_start(self) -> None:
@@ -2,25 +2,23 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.locust import init_seeds
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
-from seeds.schema.result import SeedUserResult
+from seeds.user import SeedUser
 from tools.locust.user import LocustBaseUser
 
 
 # Хук инициализации — вызывается перед началом запуска нагрузки
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Выполняем сидинг
-    seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей и счета
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг (в распределённом режиме — один раз на мастере, воркеры получают свою часть пула)
+    # и загружаем результат в окружение Locust
+    init_seeds(environment, ExistingUserIssueVirtualCardSeedsScenario())
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
 class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
-    seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    seed_user: SeedUser  # Типизированная ссылка на данные из сидинга
 
     def on_start(self) -> None:
         super().on_start()
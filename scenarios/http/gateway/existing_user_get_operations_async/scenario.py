@@ -0,0 +1,49 @@
+from locust import task, events
+from locust.env import Environment
+
+from clients.http.gateway.locust import GatewayHTTPAsyncTaskSet
+from seeds.locust import init_seeds
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from seeds.user import SeedUser
+from tools.locust.user import AsyncLocustBaseUser
+
+
+# Хук инициализации — вызывается перед началом запуска нагрузки
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Сидинг тот же, что и у синхронного сценария existing_user_get_operations
+    init_seeds(environment, ExistingUserGetOperationsSeedsScenario())
+
+
+# Асинхронный TaskSet: задачи — корутины, запросы выполняются в event loop воркера
+class GetOperationsAsyncTaskSet(GatewayHTTPAsyncTaskSet):
+    seed_user: SeedUser  # Типизированная ссылка на данные из сидинга
+
+    def on_start(self) -> None:
+        super().on_start()
+        # Получаем случайного пользователя из подготовленного списка
+        self.seed_user = self.user.environment.seeds.get_random_user()
+
+    @task(5)
+    async def get_accounts(self):
+        # Получаем список счетов пользователя
+        await self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+
+    @task(3)
+    async def get_operations(self):
+        # Получаем список операций по счёту
+        await self.operations_gateway_client.get_operations(
+            account_id=self.seed_user.credit_card_accounts[0].account_id
+        )
+
+    @task(2)
+    async def get_operations_summary(self):
+        # Получаем статистику по операциям пользователя
+        await self.operations_gateway_client.get_operations_summary(
+            account_id=self.seed_user.credit_card_accounts[0].account_id
+        )
+
+
+# Асинхронный пользователь: та же нагрузка, что и у синхронного сценария, но через асинхронные клиенты
+class GetOperationsAsyncScenarioUser(AsyncLocustBaseUser):
+    tasks = [GetOperationsAsyncTaskSet]
@@ -0,0 +1,374 @@
+import os
+
+if __name__ == '__main__':
+    # Асинхронному сидеру не нужен monkey-patching gevent, который выполняет импорт locust (через config)
+    os.environ.setdefault("LOCUST_SKIP_MONKEY_PATCH", "1")
+
+import argparse
+import asyncio
+import importlib
+import logging
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, TypeVar
+
+from clients.grpc.gateway.aio import (
+    build_gateway_grpc_aio_channel,
+    AccountsGatewayGRPCAsyncClient,
+    CardsGatewayGRPCAsyncClient,
+    OperationsGatewayGRPCAsyncClient,
+    UsersGatewayGRPCAsyncClient
+)
+from clients.http.gateway.aio import (
+    build_gateway_http_async_client,
+    AccountsGatewayHTTPAsyncClient,
+    CardsGatewayHTTPAsyncClient,
+    OperationsGatewayHTTPAsyncClient,
+    UsersGatewayHTTPAsyncClient
+)
+from seeds.dumps import (
+    append_seed_user_result,
+    load_seed_user_results,
+    remove_seeds_checkpoint,
+    save_seeds_telemetry,
+    seeds_result_exists
+)
+from seeds.scenario import SeedsScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+from seeds.telemetry import SeedsTelemetry
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_AIO")
+
+T = TypeVar("T")
+
+
+class AsyncSeedsBuilder:
+    """
+    Асинхронный сидер на asyncio: строит тот же SeedsResult, что и SeedsBuilder, но без gevent.
+
+    Все пользователи строятся из одного event loop: users_concurrency корутин-воркеров берут
+    пользователей по очереди, а все вызовы к gateway ограничены entities_concurrency одновременных
+    запросов (asyncio.Semaphore). Тысячи одновременных запросов стоят одного потока, поэтому
+    этот сидер подходит для больших наборов данных перед тестом (см. CLI ниже).
+
+    Зависимости внутри пользователя и порядок сущностей в результате такие же, как у SeedsBuilder.
+    Дозаполнение существующих пользователей и адаптивный лимит не поддерживаются.
+
+    Attributes:
+        users_gateway_client: Асинхронный клиент пользователей (gRPC или HTTP)
+        cards_gateway_client: Асинхронный клиент карт
+        accounts_gateway_client: Асинхронный клиент счетов
+        operations_gateway_client: Асинхронный клиент операций
+        users_concurrency: Количество одновременно создаваемых пользователей
+        entities_concurrency: Количество одновременных запросов к gateway
+        telemetry: Телеметрия сидинга, если подключена
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCAsyncClient | UsersGatewayHTTPAsyncClient,
+            cards_gateway_client: CardsGatewayGRPCAsyncClient | CardsGatewayHTTPAsyncClient,
+            accounts_gateway_client: AccountsGatewayGRPCAsyncClient | AccountsGatewayHTTPAsyncClient,
+            operations_gateway_client: OperationsGatewayGRPCAsyncClient | OperationsGatewayHTTPAsyncClient,
+            users_concurrency: int = 1,
+            entities_concurrency: int = 1
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.users_concurrency = users_concurrency
+        self.entities_concurrency = entities_concurrency
+        self.telemetry: SeedsTelemetry | None = None
+        self.semaphore: asyncio.Semaphore | None = None
+
+    async def request(self, method: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """
+        Выполняет вызов к gateway, ограничивая количество одновременных запросов,
+        и записывает его латентность в телеметрию (без времени ожидания слота).
+        """
+        async with self.semaphore:
+            start = time.perf_counter()
+            error = False
+            try:
+                return await method(**kwargs)
+            except Exception:
+                error = True
+                raise
+            finally:
+                if self.telemetry is not None:
+                    self.telemetry.record(method.__name__, time.perf_counter() - start, error=error)
+
+    @staticmethod
+    async def gather(*groups: list[Callable[[], Awaitable[T]]]) -> list[list[T]]:
+        """
+        Выполняет независимые задачи конкурентно и возвращает результаты,
+        сгруппированные и упорядоченные так же, как задачи.
+        """
+        values = await asyncio.gather(*(task() for group in groups for task in group))
+
+        results, start = [], 0
+        for group in groups:
+            results.append(values[start:start + len(group)])
+            start += len(group)
+
+        return results
+
+    async def build_card_result(self, method: Callable[..., Awaitable[Any]], user_id: str, account_id: str) -> SeedCardResult:
+        response = await self.request(method, user_id=user_id, account_id=account_id)
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_operation_result(
+            self,
+            method: Callable[..., Awaitable[Any]],
+            card_id: str,
+            account_id: str
+    ) -> SeedOperationResult:
+        response = await self.request(method, card_id=card_id, account_id=account_id)
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_account_result(self, method: Callable[..., Awaitable[Any]], user_id: str) -> SeedAccountResult:
+        response = await self.request(method, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_card_account_result(
+            self,
+            method: Callable[..., Awaitable[Any]],
+            plan: SeedAccountsPlan,
+            user_id: str
+    ) -> SeedAccountResult:
+        """
+        Открывает карточный счёт, затем выпускает карты и выполняет операции по карте,
+        выпущенной вместе со счётом (как SeedsBuilder.build_card_account_children).
+        """
+        response = await self.request(method, user_id=user_id)
+        account_id, card_id = response.account.id, response.account.cards[0].id
+
+        cards = self.cards_gateway_client
+        operations = self.operations_gateway_client
+        card = partial(self.build_card_result, user_id=user_id, account_id=account_id)
+        operation = partial(self.build_operation_result, card_id=card_id, account_id=account_id)
+        (
+            physical_cards,
+            top_up_operations,
+            purchase_operations,
+            virtual_cards,
+            transfer_operations,
+            cash_withdrawal_operations
+        ) = await self.gather(
+            [partial(card, cards.issue_physical_card)] * plan.physical_cards.count,
+            [partial(operation, operations.make_top_up_operation)] * plan.top_up_operations.count,
+            [partial(operation, operations.make_purchase_operation)] * plan.purchase_operations.count,
+            [partial(card, cards.issue_virtual_card)] * plan.virtual_cards.count,
+            [partial(operation, operations.make_transfer_operation)] * plan.transfer_operations.count,
+            [partial(operation, operations.make_cash_withdrawal_operation)] * plan.cash_withdrawal_operations.count
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            top_up_operations=top_up_operations,
+            purchase_operations=purchase_operations,
+            virtual_cards=virtual_cards,
+            transfer_operations=transfer_operations,
+            cash_withdrawal_operations=cash_withdrawal_operations
+        )
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя, затем параллельно все его счета согласно плану.
+        """
+        response = await self.request(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        accounts = self.accounts_gateway_client
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = await self.gather(
+            [partial(self.build_account_result, accounts.open_savings_account, user_id)] * plan.savings_accounts.count,
+            [partial(self.build_account_result, accounts.open_deposit_account, user_id)] * plan.deposit_accounts.count,
+            [
+                partial(self.build_card_account_result, accounts.open_debit_card_account, plan.debit_card_accounts, user_id)
+            ] * plan.debit_card_accounts.count,
+            [
+                partial(self.build_card_account_result, accounts.open_credit_card_account, plan.credit_card_accounts, user_id)
+            ] * plan.credit_card_accounts.count
+        )
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=savings_accounts,
+            deposit_accounts=deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
+        )
+
+    async def report(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            logger.info(self.telemetry.progress())
+
+    async def build(
+            self,
+            plan: SeedsPlan,
+            count: int | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Создаёт count пользователей по плану (по умолчанию plan.users.count), сохраняя их порядок.
+
+        Args:
+            plan: План генерации данных
+            count: Сколько пользователей создать (например, остаток после чекпоинта)
+            on_user: Функция, вызываемая для каждого созданного пользователя
+
+        Returns:
+            SeedsResult: Результат с данными созданных пользователей
+        """
+        count = plan.users.count if count is None else count
+        self.semaphore = asyncio.Semaphore(self.entities_concurrency)
+        users: list[SeedUserResult | None] = [None] * count
+        indexes = iter(range(count))
+
+        async def worker() -> None:
+            for index in indexes:
+                users[index] = user = await self.build_user(plan.users)
+                if self.telemetry is not None:
+                    self.telemetry.user_done()
+                if on_user:
+                    on_user(user)
+
+        reporter = None
+        if self.telemetry is not None:
+            reporter = asyncio.create_task(self.report(self.telemetry.report_interval))
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.users_concurrency, count))))
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+        return SeedsResult(users=users)
+
+
+def build_grpc_aio_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера на grpc.aio.
+    Вызывается внутри event loop: все клиенты используют один асинхронный канал.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными gRPC-клиентами
+    """
+    channel = build_gateway_grpc_aio_channel()
+
+    return AsyncSeedsBuilder(
+        users_gateway_client=UsersGatewayGRPCAsyncClient(channel),
+        cards_gateway_client=CardsGatewayGRPCAsyncClient(channel),
+        accounts_gateway_client=AccountsGatewayGRPCAsyncClient(channel),
+        operations_gateway_client=OperationsGatewayGRPCAsyncClient(channel),
+        users_concurrency=settings.seeds.users_concurrency,
+        entities_concurrency=settings.seeds.entities_concurrency
+    )
+
+
+def build_http_aio_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера на httpx.AsyncClient.
+    Все клиенты используют один пул соединений.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными HTTP-клиентами
+    """
+    client = build_gateway_http_async_client()
+
+    return AsyncSeedsBuilder(
+        users_gateway_client=UsersGatewayHTTPAsyncClient(client),
+        cards_gateway_client=CardsGatewayHTTPAsyncClient(client),
+        accounts_gateway_client=AccountsGatewayHTTPAsyncClient(client),
+        operations_gateway_client=OperationsGatewayHTTPAsyncClient(client),
+        users_concurrency=settings.seeds.users_concurrency,
+        entities_concurrency=settings.seeds.entities_concurrency
+    )
+
+
+async def build_aio_seeds(scenario: SeedsScenario, builder: AsyncSeedsBuilder, reseed: bool = False) -> None:
+    """
+    Генерирует дамп сценария асинхронным сидером и сохраняет его там же, где его ищет SeedsScenario.load.
+
+    Как и SeedsScenario.build, пропускает генерацию, если дамп уже есть, и продолжает
+    прерванную генерацию с JSONL-чекпоинта.
+
+    Args:
+        scenario: Сценарий сидинга (план и имя дампа)
+        builder: Асинхронный сидер
+        reseed: Пересоздать данные, даже если дамп существует
+    """
+    if not reseed and seeds_result_exists(scenario.dump, settings.seeds.dumps_format):
+        logger.info(f"[{scenario.scenario}] Seeding dump {scenario.dump} already exists, skipping generation.")
+        return
+    if reseed:
+        remove_seeds_checkpoint(scenario.dump)
+
+    existing = load_seed_user_results(scenario.dump)
+    count = max(scenario.plan.users.count - len(existing), 0)
+    logger.info(
+        f"[{scenario.scenario}] Starting async seeding of {count} users "
+        f"({len(existing)} from checkpoint), users concurrency {builder.users_concurrency}, "
+        f"entities concurrency {builder.entities_concurrency}."
+    )
+
+    builder.telemetry = SeedsTelemetry(count, report_interval=settings.seeds.telemetry_interval, name=scenario.scenario)
+    try:
+        result = await builder.build(
+            scenario.plan,
+            count=count,
+            on_user=lambda user: append_seed_user_result(user, scenario=scenario.dump)
+        )
+    finally:
+        builder.telemetry.stop()
+
+    summary = builder.telemetry.summary()
+    logger.info(f"[{scenario.scenario}] Async seeding completed.\n{summary.to_table()}")
+    save_seeds_telemetry(summary, scenario=scenario.dump)
+    scenario.save(SeedsResult(users=existing + result.users))
+    remove_seeds_checkpoint(scenario.dump)
+
+
+async def main(scenario: SeedsScenario, transport: str, reseed: bool) -> None:
+    if transport == "http":
+        builder = build_http_aio_seeds_builder()
+        try:
+            await build_aio_seeds(scenario, builder, reseed=reseed)
+        finally:
+            await builder.users_gateway_client.client.aclose()
+    else:
+        builder = build_grpc_aio_seeds_builder()
+        try:
+            await build_aio_seeds(scenario, builder, reseed=reseed)
+        finally:
+            await builder.users_gateway_client.channel.close()
+
+
+if __name__ == '__main__':
+    """
+    Генерация дампа сценария асинхронным сидером вне Locust:
+    python -m seeds.aio existing_user_get_operations --transport grpc --users-concurrency 200 --entities-concurrency 2000
+    """
+    parser = argparse.ArgumentParser(description="Build a seeds scenario dump with the asyncio seeder")
+    parser.add_argument("scenario", help="Module name in seeds/scenarios, e.g. existing_user_get_operations")
+    parser.add_argument("--transport", choices=["grpc", "http"], default="grpc")
+    parser.add_argument("--users-concurrency", type=int, default=settings.seeds.users_concurrency)
+    parser.add_argument("--entities-concurrency", type=int, default=settings.seeds.entities_concurrency)
+    parser.add_argument("--reseed", action="store_true", default=settings.seeds.reseed)
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(name)s | %(levelname)s | %(message)s")
+
+    settings.seeds.users_concurrency = arguments.users_concurrency
+    settings.seeds.entities_concurrency = arguments.entities_concurrency
+
+    module = importlib.import_module(f"seeds.scenarios.{arguments.scenario}")
+    scenario_class = next(
+        value for value in vars(module).values()
+        if isinstance(value, type) and issubclass(value, SeedsScenario) and value is not SeedsScenario
+    )
+    asyncio.run(main(scenario_class(), transport=arguments.transport, reseed=arguments.reseed))
@@ -0,0 +1,87 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from seeds.store import SeedsStore, COLUMNS, COLUMN_TYPES
+
+# Бинарный формат дампа сидинга — колонки SeedsStore (см. seeds/store.py), записанные подряд:
+#
+#   header: MAGIC, затем смещения и размеры (в байтах) колонок COLUMNS
+#   колонки: числа little-endian, каждая колонка выровнена по 8 байт
+#
+# Выравнивание позволяет читать колонки напрямую из mmap через memoryview.cast
+# без копирования, а страницы файла разделяются между процессами-воркерами.
+MAGIC = b"SEEDSV1\0"
+HEADER = struct.Struct(f"<8s{len(COLUMNS) * 2}Q")
+
+
+def encode_seeds_binary(store: SeedsStore) -> bytes:
+    """
+    Кодирует колоночное хранилище сидинга в бинарный формат.
+
+    :param store: Хранилище сидинга.
+    :return: Содержимое бинарного дампа.
+    """
+    sections = []
+    for name in COLUMNS:
+        column = store.columns[name]
+        if name not in COLUMN_TYPES:
+            sections.append(bytes(column))
+            continue
+        column = array(COLUMN_TYPES[name], column)
+        if sys.byteorder == "big":
+            column.byteswap()
+        sections.append(column.tobytes())
+
+    offsets, position = [], HEADER.size
+    for section in sections:
+        position += -position % 8
+        offsets.append(position)
+        position += len(section)
+
+    data = bytearray(position)
+    data[:HEADER.size] = HEADER.pack(MAGIC, *offsets, *(len(section) for section in sections))
+    for offset, section in zip(offsets, sections):
+        data[offset:offset + len(section)] = section
+
+    return bytes(data)
+
+
+def open_seeds_binary(path: str) -> SeedsStore:
+    """
+    Открывает бинарный дамп через mmap. Файл не читается целиком: колонки хранилища —
+    это memoryview поверх отображённой памяти (на little-endian платформах без копирования).
+
+    :param path: Путь к бинарному дампу.
+    :return: Колоночное хранилище сидинга.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, *bounds = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"Not a seeds binary dump: {path}")
+
+    view = memoryview(buffer)
+    offsets, lengths = bounds[:len(COLUMNS)], bounds[len(COLUMNS):]
+    columns = {}
+    for name, offset, length in zip(COLUMNS, offsets, lengths):
+        column = view[offset:offset + length]
+        if name in COLUMN_TYPES:
+            if sys.byteorder == "little":
+                column = column.cast(COLUMN_TYPES[name])
+            else:
+                column = array(COLUMN_TYPES[name], column.tobytes())
+                column.byteswap()
+        columns[name] = column
+
+    return SeedsStore(columns)
+
+
+if __name__ == '__main__':
+    """
+    Конвертация бинарного дампа в JSON для отладки:
+    python -m seeds.binary ./dumps/<dump>_seeds.bin > dump.json
+    """
+    print(open_seeds_binary(sys.argv[1]).to_result().model_dump_json(indent=2))
@@ -1,3 +1,12 @@
+import math
+import random
+import time
+from functools import partial
+from typing import Callable, TypeVar
+
+import gevent
+from gevent.pool import Pool
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
@@ -11,13 +20,51 @@ from seeds.schema.plan import (
     SeedUsersPlan,
     SeedAccountsPlan,
 )
+from seeds.store import ACCOUNT_FIELDS, ITEM_FIELDS, CARD_FIELDS
+from seeds.concurrency import (
+    SeedsConcurrencyLimiter,
+    AIMDConcurrencyLimiter,
+    is_gateway_error,
+    is_retryable_error
+)
+from seeds.telemetry import SeedsTelemetry
 from seeds.schema.result import (
     SeedsResult,
     SeedUserResult,
     SeedCardResult,
     SeedAccountResult,
-    SeedOperationResult
+    SeedOperationResult,
+    SeedFailureResult,
+    SeedsFailuresReport
 )
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_BUILDER")
+
+T = TypeVar("T")
+
+# Типы счетов, которые открываются вместе с картой и по которым создаются карты и операции
+CARD_ACCOUNT_FIELDS = ("debit_card_accounts", "credit_card_accounts")
+# Верхняя граница задержки перед повтором запроса в секундах
+MAX_RETRY_DELAY = 10.0
+
+
+class SeedsRequestError(Exception):
+    """
+    Запрос сидера к gateway завершился ошибкой после всех повторов.
+
+    Attributes:
+        method: Имя метода gateway
+        error: Последняя ошибка запроса
+        user_id: ID пользователя, для которого выполнялся запрос (если он уже создан)
+    """
+
+    def __init__(self, method: str, error: Exception):
+        super().__init__(f"{method} failed: {error!r}")
+        self.method = method
+        self.error = error
+        self.user_id: str | None = None
 
 
 class SeedsBuilder:
@@ -25,11 +72,37 @@ class SeedsBuilder:
     SeedsBuilder — генератор (сидер), формирующий необходимые тестовые или демонстрационные данные
     на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами.
 
+    Поддерживает конкурентный режим: пользователи создаются параллельно (не более users_concurrency
+    одновременно), а все вызовы к gateway ограничены entities_concurrency одновременных запросов.
+    Зависимости внутри пользователя сохраняются: сначала создаётся пользователь, затем счёт,
+    и только потом карты и операции по этому счёту. Порядок сущностей в результате совпадает
+    с последовательным режимом (users_concurrency=1, entities_concurrency=1).
+
+    При adaptive_concurrency лимит одновременных запросов подбирается автоматически
+    (AIMD, см. seeds/concurrency.py) в диапазоне от min_entities_concurrency до entities_concurrency
+    по латентности и ошибкам gateway.
+
+    Ошибки gateway изолируются по пользователям: запрос, который gateway не выполнил (недоступен
+    или перегружен), повторяется до retries раз с экспоненциальной задержкой, а пользователь, на котором повторы закончились, исключается
+    из результата (см. SeedsResult.failures). Сидинг прерывается, только если исключённых
+    пользователей больше failure_budget от плана.
+
+    Конкурентность обеспечивается greenlet'ами gevent, поэтому она работает с gRPC-клиентами
+    (grpc_gevent.init_gevent() в clients/grpc/client.py) и с HTTP-клиентами в monkey-patched процессе (Locust).
+
     Attributes:
         users_gateway_client: Клиент для работы с пользователями (HTTP или gRPC)
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        users_concurrency: Максимальное количество одновременно создаваемых пользователей
+        entities_concurrency: Максимальное количество одновременных запросов к gateway
+        entities_limiter: Ограничитель одновременных запросов к gateway (фиксированный или адаптивный)
+        retries: Количество повторов запроса, который gateway не выполнил (см. is_retryable_error)
+        retry_backoff: Задержка перед первым повтором в секундах (удваивается с каждым повтором)
+        failure_budget: Доля пользователей плана, которую можно исключить из результата из-за ошибок
+        retried_requests: Сколько раз запросы повторялись
+        telemetry: Телеметрия сидинга (латентности методов gateway и прогресс), если подключена
     """
 
     def __init__(
@@ -37,12 +110,143 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            users_concurrency: int = 1,
+            entities_concurrency: int = 1,
+            adaptive_concurrency: bool = False,
+            min_entities_concurrency: int = 1,
+            retries: int = 0,
+            retry_backoff: float = 0.2,
+            failure_budget: float = 0.0
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.users_concurrency = users_concurrency
+        self.entities_concurrency = entities_concurrency
+        if adaptive_concurrency:
+            self.entities_limiter: SeedsConcurrencyLimiter = AIMDConcurrencyLimiter(
+                min_limit=min(min_entities_concurrency, entities_concurrency),
+                max_limit=entities_concurrency
+            )
+        else:
+            self.entities_limiter = SeedsConcurrencyLimiter(entities_concurrency)
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.failure_budget = failure_budget
+        self.retried_requests = 0
+        self.telemetry: SeedsTelemetry | None = None
+
+    def request(self, method: Callable[..., T], **kwargs) -> T:
+        """
+        Выполняет вызов к gateway, ограничивая количество одновременных запросов.
+        Латентность и ошибка вызова передаются ограничителю (адаптивный лимит подстраивается под них)
+        и, если подключена телеметрия, записываются по имени метода
+        (время ожидания слота в латентность не входит).
+
+        Повторяются до retries раз только запросы, которые gateway не выполнял (см. is_retryable_error):
+        создающие запросы не идемпотентны, и повтор после таймаута или INTERNAL мог бы создать дубликат.
+        На время задержки перед повтором слот ограничителя освобождается.
+        Исключения не от gateway (ошибки кода сидера) пробрасываются как есть.
+
+        Args:
+            method: Метод клиента gateway (например, cards_gateway_client.issue_physical_card)
+            **kwargs: Аргументы вызова
+
+        Returns:
+            Ответ gateway
+
+        Raises:
+            SeedsRequestError: Ошибка gateway, которую нельзя повторить, или повторы закончились
+        """
+        attempt = 0
+        while True:
+            self.entities_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = method(**kwargs)
+            except Exception as error:
+                self.complete_request(method.__name__, time.perf_counter() - start, error)
+                if not is_gateway_error(error):
+                    raise
+                if attempt >= self.retries or not is_retryable_error(error):
+                    raise SeedsRequestError(method.__name__, error) from error
+                attempt += 1
+                self.retried_requests += 1
+                gevent.sleep(self.get_retry_delay(attempt))
+                continue
+            except BaseException:
+                # Greenlet убит (например, при отмене gather) — слот освобождается без сигнала о нагрузке
+                self.entities_limiter.cancel()
+                raise
+            self.complete_request(method.__name__, time.perf_counter() - start)
+
+            return response
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """
+        Задержка перед повтором: экспоненциальная от retry_backoff со случайным разбросом,
+        чтобы повторы одновременно упавших запросов не приходили на gateway одной пачкой.
+        """
+        return min(self.retry_backoff * 2 ** (attempt - 1), MAX_RETRY_DELAY) * random.uniform(0.5, 1.0)
+
+    def complete_request(self, method: str, seconds: float, error: Exception | None = None) -> None:
+        """
+        Освобождает слот ограничителя и записывает вызов в телеметрию.
+        """
+        self.entities_limiter.release(method, seconds, error)
+        if self.telemetry is not None:
+            self.telemetry.concurrency = self.entities_limiter.limit
+            self.telemetry.record(method, seconds, error=error is not None)
+
+    def gather(self, *groups: list[Callable[[], T]]) -> list[list[T]]:
+        """
+        Выполняет независимые задачи (конкурентно, если entities_concurrency > 1)
+        и возвращает результаты, сгруппированные и упорядоченные так же, как задачи.
+
+        Первая ошибка задачи останавливает остальные и выбрасывается в вызывающем greenlet'е.
+        Она перехватывается внутри задачи, поэтому хаб gevent не печатает её трассировку:
+        пользователь, исключённый в пределах бюджета ошибок (см. isolate), оставляет в логе только предупреждение.
+
+        Args:
+            *groups: Группы задач без аргументов
+
+        Returns:
+            list[list]: Результаты по каждой группе в исходном порядке
+        """
+        tasks = [task for group in groups for task in group]
+
+        if self.entities_concurrency == 1:
+            values = [task() for task in tasks]
+        else:
+            errors: list[Exception] = []
+            greenlets: list[gevent.Greenlet] = []
+
+            def run(task: Callable[[], T]) -> T | None:
+                try:
+                    return task()
+                except Exception as error:
+                    errors.append(error)
+                    gevent.killall([greenlet for greenlet in greenlets if greenlet is not gevent.getcurrent()], block=False)
+                    return None
+
+            greenlets.extend(gevent.spawn(run, task) for task in tasks)
+            try:
+                gevent.joinall(greenlets)
+            except BaseException:
+                gevent.killall(greenlets)
+                raise
+            if errors:
+                raise errors[0]
+            values = [greenlet.value for greenlet in greenlets]
+
+        results, start = [], 0
+        for group in groups:
+            results.append(values[start:start + len(group)])
+            start += len(group)
+
+        return results
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -55,7 +259,7 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self.request(self.cards_gateway_client.issue_physical_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -72,7 +276,7 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_virtual_card(
+        response = self.request(self.cards_gateway_client.issue_virtual_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -89,7 +293,7 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_top_up_operation(
+        response = self.request(self.operations_gateway_client.make_top_up_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -106,7 +310,7 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_purchase_operation(
+        response = self.request(self.operations_gateway_client.make_purchase_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -123,7 +327,7 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_transfer_operation(
+        response = self.request(self.operations_gateway_client.make_transfer_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -140,7 +344,7 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
+        response = self.request(self.operations_gateway_client.make_cash_withdrawal_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -156,7 +360,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        response = self.request(self.accounts_gateway_client.open_savings_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
@@ -169,9 +373,60 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        response = self.request(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
+    def build_card_account_children(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str,
+            account_id: str
+    ) -> SeedAccountResult:
+        """
+        Выпускает карты и выполняет операции по уже открытому карточному счёту согласно плану.
+        Все операции выполняются по карте, выпущенной вместе со счётом (card_id).
+
+        Args:
+            plan: План карт и операций по счёту
+            user_id: Идентификатор пользователя
+            card_id: Идентификатор карты, выпущенной при открытии счёта
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        card_kwargs = {"user_id": user_id, "account_id": account_id}
+        operation_kwargs = {"card_id": card_id, "account_id": account_id}
+
+        (
+            physical_cards,
+            top_up_operations,
+            purchase_operations,
+            virtual_cards,
+            transfer_operations,
+            cash_withdrawal_operations
+        ) = self.gather(
+            [partial(self.build_physical_card_result, **card_kwargs)] * plan.physical_cards.count,
+            [partial(self.build_top_up_operation_result, **operation_kwargs)] * plan.top_up_operations.count,
+            [partial(self.build_purchase_operation_result, **operation_kwargs)] * plan.purchase_operations.count,
+            [partial(self.build_virtual_card_result, **card_kwargs)] * plan.virtual_cards.count,
+            [partial(self.build_transfer_operation_result, **operation_kwargs)] * plan.transfer_operations.count,
+            [
+                partial(self.build_cash_withdrawal_operation_result, **operation_kwargs)
+            ] * plan.cash_withdrawal_operations.count
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            top_up_operations=top_up_operations,
+            purchase_operations=purchase_operations,
+            virtual_cards=virtual_cards,
+            transfer_operations=transfer_operations,
+            cash_withdrawal_operations=cash_withdrawal_operations
+        )
+
     def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
         Открывает дебетовый счёт для пользователя и при необходимости:
@@ -189,35 +444,13 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
+        response = self.request(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
 
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+        return self.build_card_account_children(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
@@ -237,35 +470,13 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
+        response = self.request(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
 
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+        return self.build_card_account_children(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
     def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
@@ -280,41 +491,348 @@ class SeedsBuilder:
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
+        response = self.request(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        try:
+            savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = self.gather(
+                [partial(self.build_savings_account_result, user_id=user_id)] * plan.savings_accounts.count,
+                [partial(self.build_deposit_account_result, user_id=user_id)] * plan.deposit_accounts.count,
+                [
+                    partial(self.build_debit_card_account_result, plan=plan.debit_card_accounts, user_id=user_id)
+                ] * plan.debit_card_accounts.count,
+                [
+                    partial(self.build_credit_card_account_result, plan=plan.credit_card_accounts, user_id=user_id)
+                ] * plan.credit_card_accounts.count
+            )
+        except SeedsRequestError as error:
+            error.user_id = user_id
+            raise
 
         return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
-            ]
+            user_id=user_id,
+            savings_accounts=savings_accounts,
+            deposit_accounts=deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
+        )
+
+    def get_missing_items_plan(self, plan: SeedAccountsPlan, account: SeedAccountResult) -> SeedAccountsPlan:
+        """
+        Возвращает план карт и операций, которых не хватает на счёте до заданного плана.
+
+        Args:
+            plan: План карт и операций по счёту
+            account: Уже созданный счёт
+
+        Returns:
+            SeedAccountsPlan: План недостающих карт и операций
+        """
+        return plan.model_copy(update={
+            item_field: getattr(plan, item_field).model_copy(
+                update={"count": max(getattr(plan, item_field).count - len(getattr(account, item_field)), 0)}
+            )
+            for item_field in ITEM_FIELDS
+        })
+
+    def is_user_matching(self, plan: SeedUsersPlan, user: SeedUserResult) -> bool:
+        """
+        Проверяет, что количество счетов пользователя, а также карт и операций на карточных счетах
+        в точности соответствует плану.
+        """
+        for account_field in ACCOUNT_FIELDS:
+            account_plan: SeedAccountsPlan = getattr(plan, account_field)
+            accounts = getattr(user, account_field)
+            if len(accounts) != account_plan.count:
+                return False
+            if account_field not in CARD_ACCOUNT_FIELDS:
+                continue
+            for account in accounts:
+                if any(len(getattr(account, field)) != getattr(account_plan, field).count for field in ITEM_FIELDS):
+                    return False
+
+        return True
+
+    def get_default_card_ids(self, user: SeedUserResult) -> dict[str, str]:
+        """
+        Возвращает ID карт, выпущенных вместе с карточными счетами пользователя, по ID счёта.
+        В результате сидинга эти карты не сохраняются, поэтому для дозаполнения операций
+        по уже открытым счетам они запрашиваются у gateway.
+
+        Args:
+            user: Уже созданный пользователь
+
+        Returns:
+            dict[str, str]: ID карты, выпущенной при открытии счёта, по ID счёта
+        """
+        issued = {
+            card.card_id
+            for account_field in CARD_ACCOUNT_FIELDS
+            for account in getattr(user, account_field)
+            for card_field in CARD_FIELDS
+            for card in getattr(account, card_field)
+        }
+        response = self.request(self.accounts_gateway_client.get_accounts, user_id=user.user_id)
+
+        card_ids = {}
+        for account in response.accounts:
+            cards = [card.id for card in account.cards if card.id not in issued] or [card.id for card in account.cards]
+            if cards:
+                card_ids[account.id] = cards[0]
+
+        return card_ids
+
+    def top_up_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str | None,
+            account: SeedAccountResult
+    ) -> SeedAccountResult:
+        """
+        Приводит уже открытый карточный счёт к плану: досоздаёт недостающие карты и операции,
+        а лишние (если план уменьшился) не использует.
+
+        Args:
+            plan: План карт и операций по счёту
+            user_id: Идентификатор пользователя
+            card_id: Идентификатор карты, выпущенной при открытии счёта (нужен, если не хватает операций)
+            account: Уже созданный счёт
+
+        Returns:
+            SeedAccountResult: Счёт, соответствующий плану
+
+        Raises:
+            SeedsRequestError: Операции нужно досоздать, а карты, выпущенной при открытии счёта, на стенде нет
+        """
+        kept = {item_field: getattr(account, item_field)[:getattr(plan, item_field).count] for item_field in ITEM_FIELDS}
+        missing = self.get_missing_items_plan(plan, account)
+        if not any(getattr(missing, item_field).count for item_field in ITEM_FIELDS):
+            return account.model_copy(update=kept)
+
+        if card_id is None and any(
+                getattr(missing, item_field).count for item_field in ITEM_FIELDS if item_field not in CARD_FIELDS
+        ):
+            # Карты нет на стенде — это состояние данных, а не ошибка сидера: исключается только этот пользователь
+            raise SeedsRequestError(
+                "get_accounts",
+                LookupError(f"Card issued with account {account.account_id} not found, cannot top up operations")
+            )
+
+        children = self.build_card_account_children(
+            plan=missing,
+            user_id=user_id,
+            card_id=card_id,
+            account_id=account.account_id
         )
+        return account.model_copy(update={
+            item_field: kept[item_field] + getattr(children, item_field) for item_field in ITEM_FIELDS
+        })
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def top_up_user(self, plan: SeedUsersPlan, user: SeedUserResult) -> SeedUserResult:
+        """
+        Приводит уже созданного пользователя к плану (например, после увеличения плана):
+        - открывает недостающие счета каждого типа
+        - на уже открытых карточных счетах досоздаёт недостающие карты и операции
+        Лишние счета, карты и операции (если план уменьшился) в результат не попадают.
+
+        Args:
+            plan: План генерации пользователя
+            user: Уже созданный пользователь
+
+        Returns:
+            SeedUserResult: Тот же объект, если пользователь уже соответствует плану, иначе новый результат
+        """
+        if self.is_user_matching(plan, user):
+            return user
+
+        user_id = user.user_id
+        builders = {
+            "deposit_accounts": partial(self.build_deposit_account_result, user_id=user_id),
+            "savings_accounts": partial(self.build_savings_account_result, user_id=user_id),
+            "debit_card_accounts": partial(
+                self.build_debit_card_account_result, plan=plan.debit_card_accounts, user_id=user_id
+            ),
+            "credit_card_accounts": partial(
+                self.build_credit_card_account_result, plan=plan.credit_card_accounts, user_id=user_id
+            )
+        }
+
+        # Карты, выпущенные при открытии счетов, нужны только если на открытых счетах не хватает операций
+        card_ids = {}
+        if any(
+                getattr(self.get_missing_items_plan(getattr(plan, account_field), account), item_field).count
+                for account_field in CARD_ACCOUNT_FIELDS
+                for account in getattr(user, account_field)[:getattr(plan, account_field).count]
+                for item_field in ITEM_FIELDS
+                if item_field not in CARD_FIELDS
+        ):
+            card_ids = self.get_default_card_ids(user)
+
+        # Некарточные счета переиспользуются как есть, карточные — дозаполняются, недостающие — открываются
+        kept, groups = {}, []
+        for account_field in ACCOUNT_FIELDS:
+            account_plan: SeedAccountsPlan = getattr(plan, account_field)
+            accounts = getattr(user, account_field)[:account_plan.count]
+            tasks = []
+            if account_field in CARD_ACCOUNT_FIELDS:
+                tasks = [
+                    partial(
+                        self.top_up_card_account_result,
+                        plan=account_plan,
+                        user_id=user_id,
+                        card_id=card_ids.get(account.account_id),
+                        account=account
+                    )
+                    for account in accounts
+                ]
+            kept[account_field] = [] if tasks else accounts
+            groups.append(tasks + [builders[account_field]] * (account_plan.count - len(accounts)))
+
+        return SeedUserResult(user_id=user_id, **{
+            account_field: kept[account_field] + accounts
+            for account_field, accounts in zip(ACCOUNT_FIELDS, self.gather(*groups))
+        })
+
+    def isolate(
+            self,
+            build_user: Callable[[], SeedUserResult],
+            failures: SeedsFailuresReport,
+            allowed: int,
+            user_id: str | None = None
+    ) -> SeedUserResult | None:
+        """
+        Строит (или дозаполняет) одного пользователя, изолируя его ошибки: пользователь, на котором
+        закончились повторы, исключается из результата и записывается в отчёт об ошибках.
+
+        Args:
+            build_user: Построение пользователя
+            failures: Отчёт об ошибках текущего сидинга
+            allowed: Сколько пользователей можно исключить, прежде чем прервать сидинг
+            user_id: ID пользователя, если он уже создан
+
+        Returns:
+            SeedUserResult | None: Пользователь или None, если он исключён
+
+        Raises:
+            SeedsRequestError: Исключённых пользователей больше allowed
+        """
+        try:
+            return build_user()
+        except SeedsRequestError as error:
+            user_id = error.user_id or user_id
+            failures.failed_users.append(SeedFailureResult(user_id=user_id, method=error.method, error=repr(error.error)))
+            logger.warning(f"Seed user {user_id or '(not created)'} dropped: {error}")
+            if len(failures.failed_users) > allowed:
+                logger.error(
+                    f"Seeding failure budget exhausted: {len(failures.failed_users)} users failed, {allowed} allowed"
+                )
+                raise
+            return None
+
+    def get_allowed_failures(self, plan: SeedsPlan) -> int:
+        """
+        Сколько пользователей плана можно исключить из результата из-за ошибок (failure_budget).
+        """
+        return math.floor(plan.users.count * self.failure_budget)
+
+    def top_up(
+            self,
+            plan: SeedsPlan,
+            existing: SeedsResult,
+            on_user: Callable[[SeedUserResult], None] | None = None,
+            failures: SeedsFailuresReport | None = None,
+            allowed: int | None = None
+    ) -> SeedsResult:
+        """
+        Приводит уже созданных пользователей к плану (см. top_up_user). Новые пользователи не создаются,
+        лишние (если план уменьшился) в результат не попадают. Пользователь, которого не удалось
+        дозаполнить, исключается из результата (см. isolate).
+
+        Args:
+            plan: Полный план генерации данных
+            existing: Уже созданные пользователи (например, из дампа предыдущего плана)
+            on_user: Функция, вызываемая для каждого изменённого пользователя
+            failures: Отчёт об ошибках, в который дописываются исключённые пользователи
+            allowed: Сколько пользователей можно исключить (по умолчанию — failure_budget от плана);
+                build передаёт свой бюджет, чтобы дозаполнение и создание пользователей делили один бюджет
+
+        Returns:
+            SeedsResult: Пользователи, соответствующие плану, и отчёт об ошибках
+        """
+        failures = SeedsFailuresReport() if failures is None else failures
+        allowed = self.get_allowed_failures(plan) if allowed is None else allowed
+
+        def top_up_user(user: SeedUserResult) -> SeedUserResult | None:
+            result = self.isolate(partial(self.top_up_user, plan=plan.users, user=user), failures, allowed, user.user_id)
+            if result is not None and result is not user and on_user:
+                on_user(result)
+            return result
+
+        users = existing.users[:plan.users.count]
+        if self.users_concurrency == 1:
+            users = [top_up_user(user) for user in users]
+        else:
+            users = Pool(self.users_concurrency).map(top_up_user, users)
+
+        return SeedsResult(users=[user for user in users if user is not None], failures=failures)
+
+    def build(
+            self,
+            plan: SeedsPlan,
+            existing: SeedsResult | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None,
+            allowed_failures: int | None = None
+    ) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        При users_concurrency > 1 пользователи создаются параллельно в пуле greenlet'ов,
+        порядок пользователей в результате сохраняется.
+
+        Если переданы уже созданные пользователи, план сравнивается с ними и создаётся только
+        недостающее: пользователи, счета на уже созданных пользователях, карты и операции на уже
+        открытых счетах (см. top_up). Так пул дёшево растёт при увеличении плана.
+
+        Пользователи, на которых закончились повторы запросов, в результат не попадают
+        (их может оказаться меньше plan.users.count) и перечисляются в SeedsResult.failures.
+
         Args:
             plan: Полный план генерации данных
+            existing: Уже созданные пользователи (например, из чекпоинта или дампа предыдущего плана)
+            on_user: Функция, вызываемая для каждого созданного или изменённого пользователя
+            allowed_failures: Сколько пользователей можно исключить (по умолчанию — failure_budget от плана);
+                шард получает свою долю общего бюджета (см. build_sharded_seeds_result)
 
         Returns:
-            SeedsResult: Результат с данными всех созданных пользователей
+            SeedsResult: Результат с данными всех созданных пользователей и отчёт об ошибках
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        failures = SeedsFailuresReport()
+        retried_requests = self.retried_requests
+        allowed = self.get_allowed_failures(plan) if allowed_failures is None else allowed_failures
+        users = list(self.top_up(plan, existing, on_user=on_user, failures=failures, allowed=allowed).users) if existing else []
+        count = max(plan.users.count - len(users), 0)
+
+        def build_user(_: int) -> SeedUserResult | None:
+            user = self.isolate(partial(self.build_user, plan=plan.users), failures, allowed)
+            if user is None:
+                return None
+            if self.telemetry is not None:
+                self.telemetry.user_done()
+            if on_user:
+                on_user(user)
+            return user
+
+        if self.users_concurrency == 1:
+            built = [build_user(index) for index in range(count)]
+        else:
+            built = Pool(self.users_concurrency).map(build_user, range(count))
+        users.extend(user for user in built if user is not None)
+        failures.retries = self.retried_requests - retried_requests
+
+        return SeedsResult(users=users, failures=failures)
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -328,20 +846,37 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        users_concurrency=settings.seeds.users_concurrency,
+        entities_concurrency=settings.seeds.entities_concurrency,
+        adaptive_concurrency=settings.seeds.adaptive_concurrency,
+        min_entities_concurrency=settings.seeds.min_entities_concurrency,
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff,
+        failure_budget=settings.seeds.failure_budget
     )
 
 
 def build_http_seeds_builder():
     """
     Фабрика для создания сидера с использованием HTTP-клиентов.
+    Клиенты выбрасывают httpx.HTTPStatusError на ответы не 2xx: ошибка gateway изолируется
+    по пользователю и при 429/502/503 повторяется (см. is_retryable_error), а не прерывает сидинг
+    ошибкой валидации тела ответа.
 
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_http_client(),
-        cards_gateway_client=build_cards_gateway_http_client(),
-        accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        users_gateway_client=build_users_gateway_http_client(raise_for_status=True),
+        cards_gateway_client=build_cards_gateway_http_client(raise_for_status=True),
+        accounts_gateway_client=build_accounts_gateway_http_client(raise_for_status=True),
+        operations_gateway_client=build_operations_gateway_http_client(raise_for_status=True),
+        users_concurrency=settings.seeds.users_concurrency,
+        entities_concurrency=settings.seeds.entities_concurrency,
+        adaptive_concurrency=settings.seeds.adaptive_concurrency,
+        min_entities_concurrency=settings.seeds.min_entities_concurrency,
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff,
+        failure_budget=settings.seeds.failure_budget
     )
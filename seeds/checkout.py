@@ -0,0 +1,148 @@
+import random
+from array import array
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+from gevent.event import Event
+from gevent.lock import BoundedSemaphore
+
+from tools.config.seeds import SeedsCheckoutOrder, SeedsExhaustionPolicy
+
+T = TypeVar("T")
+
+
+class SeedsExhaustedError(IndexError):
+    """
+    Пул сидов исчерпан (или не дождались новых сидов в режиме BLOCK).
+    Наследуется от IndexError — так же, как раньше падал list.pop(0) на пустом списке.
+    """
+
+
+class SeedsCheckout(Generic[T]):
+    """
+    Выдача пользователей из пула сидов виртуальным пользователям Locust.
+
+    Каждая выдача — O(1):
+    - SEQUENTIAL: по порядку, каждого пользователя не более одного раза за проход;
+    - RANDOM: случайно без повторений (частичная перетасовка Фишера — Йейтса по мере выдачи);
+    - ROUND_ROBIN: по кругу, пул никогда не исчерпывается.
+
+    Поведение при исчерпании пула (для SEQUENTIAL и RANDOM):
+    - RAISE: SeedsExhaustedError;
+    - WRAP: начинается новый проход по пулу (пустой пополняемый пул ждёт первых сидов);
+    - BLOCK: ожидание новых сидов (notify) до закрытия пула (close) или таймаута.
+
+    Пул может расти (например, при потоковом сидинге): users читается по ссылке,
+    а после добавления пользователей нужно вызвать notify().
+    Выдача защищена замком gevent и безопасна при конкурентных greenlet'ах.
+
+    Attributes:
+        checked_out: Сколько пользователей выдано всего
+        passes: Сколько раз пул был пройден целиком (для WRAP и ROUND_ROBIN)
+        waits: Сколько раз выдача ожидала новых сидов (для BLOCK)
+    """
+
+    def __init__(
+            self,
+            users: Sequence[T],
+            order: SeedsCheckoutOrder = SeedsCheckoutOrder.SEQUENTIAL,
+            policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.RAISE,
+            timeout: float | None = None,
+            closed: bool = True
+    ):
+        """
+        :param users: Пул пользователей (список или последовательность хранилища).
+        :param order: Порядок выдачи.
+        :param policy: Поведение при исчерпании пула.
+        :param timeout: Максимальное время ожидания новых сидов в режиме BLOCK (секунды).
+        :param closed: Пул полный и больше не будет пополняться.
+        """
+        self.users = users
+        self.order = order
+        self.policy = policy
+        self.timeout = timeout
+        self.closed = closed
+
+        self.lock = BoundedSemaphore(1)
+        self.arrived = Event()
+        self.cursor = 0
+        self.permutation = array("I")
+
+        self.checked_out = 0
+        self.passes = 0
+        self.waits = 0
+
+    @property
+    def available(self) -> int:
+        """
+        Сколько пользователей осталось выдать в текущем проходе.
+        """
+        return len(self.users) - self.cursor
+
+    def notify(self) -> None:
+        """
+        Сообщает о новых пользователях в пуле — будит ожидающих в режиме BLOCK.
+        """
+        self.arrived.set()
+
+    def close(self) -> None:
+        """
+        Помечает пул полным: новых сидов не будет, ожидающие в режиме BLOCK получат SeedsExhaustedError.
+        """
+        self.closed = True
+        self.arrived.set()
+
+    def take(self) -> T | None:
+        """
+        Выдаёт следующего пользователя текущего прохода или None, если проход исчерпан.
+        """
+        size = len(self.users)
+        if self.order == SeedsCheckoutOrder.ROUND_ROBIN and size and self.cursor >= size:
+            self.cursor = 0
+            self.passes += 1
+        if self.cursor >= size:
+            return None
+
+        if self.order == SeedsCheckoutOrder.RANDOM:
+            # Досыпаем в перестановку индексы новых пользователей (если пул вырос)
+            self.permutation.extend(range(len(self.permutation), size))
+            swap = random.randrange(self.cursor, size)
+            self.permutation[self.cursor], self.permutation[swap] = (
+                self.permutation[swap], self.permutation[self.cursor]
+            )
+            index = self.permutation[self.cursor]
+        else:
+            index = self.cursor
+
+        self.cursor += 1
+        self.checked_out += 1
+
+        return self.users[index]
+
+    def checkout(self) -> T:
+        """
+        Выдаёт пользователя согласно порядку и политике исчерпания.
+
+        :return: Пользователь из пула.
+        :raises SeedsExhaustedError: Пул исчерпан (RAISE), закрыт или истёк таймаут ожидания (BLOCK).
+        """
+        while True:
+            with self.lock:
+                user = self.take()
+                if user is not None:
+                    return user
+
+                if self.policy == SeedsExhaustionPolicy.WRAP and len(self.users):
+                    self.cursor = 0
+                    self.passes += 1
+                    continue
+                # BLOCK (или WRAP по пустому пулу, который ещё пополняется) — ждём новых сидов
+                if self.policy == SeedsExhaustionPolicy.RAISE or self.closed:
+                    raise SeedsExhaustedError(f"Seeds pool exhausted after {self.checked_out} checkouts")
+
+                self.arrived.clear()
+                self.waits += 1
+
+            # Ждём новых сидов вне замка, чтобы не мешать другим greenlet'ам
+            if not self.arrived.wait(self.timeout):
+                raise SeedsExhaustedError(f"No new seeds arrived in {self.timeout} seconds")
@@ -0,0 +1,218 @@
+from collections import deque
+
+from gevent.event import Event
+from grpc import RpcError, StatusCode
+from httpx import ConnectError, ConnectTimeout, HTTPError, HTTPStatusError, PoolTimeout, TransportError
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_CONCURRENCY")
+
+# Коды gRPC, которыми gateway сигнализирует о перегрузке (остальные — ошибки самого запроса)
+OVERLOAD_STATUS_CODES = {
+    StatusCode.UNAVAILABLE,
+    StatusCode.DEADLINE_EXCEEDED,
+    StatusCode.RESOURCE_EXHAUSTED
+}
+# Коды gRPC, при которых запрос можно повторить: gateway его не выполнял. Создающие запросы сидера
+# не идемпотентны, поэтому после DEADLINE_EXCEEDED или INTERNAL (сущность могла быть уже создана) они не повторяются
+RETRYABLE_STATUS_CODES = {
+    StatusCode.UNAVAILABLE,
+    StatusCode.RESOURCE_EXHAUSTED
+}
+# Ошибки httpx, при которых запрос не был отправлен: соединение не установлено или не дождались слота пула
+RETRYABLE_TRANSPORT_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+# HTTP-статусы перегрузки gateway — аналоги кодов gRPC выше: 429 и 503 — RESOURCE_EXHAUSTED и UNAVAILABLE,
+# 502 — недоступный upstream, 504 — DEADLINE_EXCEEDED. Повторяются только статусы, при которых запрос не выполнялся
+OVERLOAD_HTTP_STATUSES = {429, 502, 503, 504}
+RETRYABLE_HTTP_STATUSES = {429, 502, 503}
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """
+    Проверяет, что ошибка вызова gateway похожа на перегрузку стенда.
+
+    Для gRPC учитывается код ответа (OVERLOAD_STATUS_CODES). Для HTTP — транспортные ошибки
+    httpx (таймауты и ошибки соединения, в том числе httpx.TimeoutException) и статусы OVERLOAD_HTTP_STATUSES
+    (если клиент выбрасывает httpx.HTTPStatusError, см. HTTPClient). Остальные исключения
+    (например, AttributeError или ValidationError) о нагрузке на стенд ничего не говорят.
+    """
+    if isinstance(error, RpcError) and callable(getattr(error, "code", None)):
+        return error.code() in OVERLOAD_STATUS_CODES
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code in OVERLOAD_HTTP_STATUSES
+    return isinstance(error, TransportError)
+
+
+def is_gateway_error(error: BaseException) -> bool:
+    """
+    Проверяет, что ошибка пришла от gateway или транспорта (gRPC или httpx), а не из кода сидера.
+    Ответ HTTP не 2xx — ошибка gateway, только если клиент выбрасывает на него httpx.HTTPStatusError
+    (сидер создаёт HTTP-клиенты с raise_for_status, см. build_http_seeds_builder).
+    """
+    return isinstance(error, (RpcError, HTTPError))
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Проверяет, что запрос можно безопасно повторить: gateway его не выполнял
+    (RETRYABLE_STATUS_CODES, RETRYABLE_HTTP_STATUSES или ошибка установки соединения, RETRYABLE_TRANSPORT_ERRORS).
+    """
+    if isinstance(error, RpcError) and callable(getattr(error, "code", None)):
+        return error.code() in RETRYABLE_STATUS_CODES
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code in RETRYABLE_HTTP_STATUSES
+    return isinstance(error, RETRYABLE_TRANSPORT_ERRORS)
+
+
+class SeedsConcurrencyLimiter:
+    """
+    Ограничитель количества одновременных запросов сидера к gateway (greenlet-safe, FIFO).
+
+    Базовая реализация держит фиксированный лимит — как BoundedSemaphore.
+    Наследники меняют limit по результатам запросов (см. AIMDConcurrencyLimiter).
+
+    Attributes:
+        limit: Текущий лимит одновременных запросов
+        in_flight: Количество выполняющихся запросов
+    """
+
+    def __init__(self, limit: int):
+        self.limit: float = limit
+        self.in_flight = 0
+        self.waiters: deque[Event] = deque()
+
+    def acquire(self) -> None:
+        """
+        Занимает слот под запрос, ожидая освобождения, если лимит исчерпан.
+        """
+        if self.in_flight < int(self.limit) and not self.waiters:
+            self.in_flight += 1
+            return
+
+        waiter = Event()
+        self.waiters.append(waiter)
+        try:
+            waiter.wait()
+        except BaseException:
+            # Слот мог быть выдан в момент прерывания ожидания — возвращаем его
+            if waiter.is_set():
+                self.in_flight -= 1
+                self.wake()
+            else:
+                self.waiters.remove(waiter)
+            raise
+
+    def wake(self) -> None:
+        """
+        Передаёт освободившиеся слоты ожидающим в порядке очереди.
+        """
+        while self.waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            self.waiters.popleft().set()
+
+    def cancel(self) -> None:
+        """
+        Освобождает слот прерванного запроса (например, убитого greenlet'а) без оценки его результата.
+        """
+        self.in_flight -= 1
+        self.wake()
+
+    def release(self, method: str, seconds: float, error: BaseException | None = None) -> None:
+        """
+        Освобождает слот после запроса.
+
+        Args:
+            method: Имя метода gateway
+            seconds: Латентность запроса
+            error: Ошибка запроса, если он завершился неуспешно
+        """
+        self.in_flight -= 1
+        self.wake()
+
+
+class AIMDConcurrencyLimiter(SeedsConcurrencyLimiter):
+    """
+    Адаптивный лимит одновременных запросов по схеме AIMD (additive increase, multiplicative decrease),
+    как окно перегрузки TCP.
+
+    - Пока стенд не перегружен, лимит растёт: в режиме медленного старта на 1 за каждый успешный
+      запрос (удвоение за «окно» запросов), затем на 1 за окно (limit успешных запросов).
+    - Признак перегрузки — ошибка перегрузки (is_overload_error) или латентность метода выше
+      latency_tolerance × его базовой латентности. Тогда лимит умножается на backoff
+      (не чаще одного раза за окно, чтобы пачка одновременных ошибок не обнулила лимит),
+      а медленный старт заканчивается.
+
+    Базовая латентность считается по каждому методу отдельно (создание пользователя и покупка
+    стоят по-разному): это медленно растущее среднее, которое сразу опускается до новых минимумов.
+
+    Attributes:
+        min_limit / max_limit: Границы лимита
+        latency_tolerance: Во сколько раз латентность может превышать базовую без признака перегрузки
+        backoff: Множитель лимита при перегрузке
+        baselines: Базовая латентность по методам
+        decreases: Сколько раз лимит снижался
+    """
+
+    def __init__(
+            self,
+            min_limit: int,
+            max_limit: int,
+            initial_limit: int | None = None,
+            latency_tolerance: float = 2.0,
+            backoff: float = 0.7,
+            baseline_weight: float = 0.01,
+            latency_weight: float = 0.2
+    ):
+        super().__init__(initial_limit or min_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.baseline_weight = baseline_weight
+        self.latency_weight = latency_weight
+
+        self.baselines: dict[str, float] = {}
+        self.latencies: dict[str, float] = {}
+        self.slow_start = True
+        self.window = 0
+        self.decreases = 0
+
+    def is_congested(self, method: str, seconds: float) -> bool:
+        """
+        Обновляет базовую и текущую латентность метода и проверяет признак перегрузки по латентности.
+        """
+        baseline = self.baselines.get(method)
+        if baseline is None:
+            self.baselines[method] = self.latencies[method] = seconds
+            return False
+
+        self.baselines[method] = min(seconds, baseline + (seconds - baseline) * self.baseline_weight)
+        self.latencies[method] += (seconds - self.latencies[method]) * self.latency_weight
+
+        return self.latencies[method] > self.baselines[method] * self.latency_tolerance
+
+    def release(self, method: str, seconds: float, error: BaseException | None = None) -> None:
+        self.in_flight -= 1
+        self.window += 1
+
+        if error is not None and not is_overload_error(error):
+            # Ошибка самого запроса ничего не говорит о нагрузке на стенд
+            self.wake()
+            return
+
+        if error is not None or self.is_congested(method, seconds):
+            # Снижаем лимит не чаще одного раза за окно запросов
+            if self.window >= self.limit:
+                previous = self.limit
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self.slow_start = False
+                self.window = 0
+                self.decreases += 1
+                logger.debug(f"Seeding concurrency decreased: {previous:.1f} -> {self.limit:.1f} ({method})")
+        elif self.slow_start:
+            self.limit = min(float(self.max_limit), self.limit + 1)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+        self.wake()
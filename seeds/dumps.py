@@ -1,25 +1,279 @@
-from seeds.schema.result import SeedsResult
+from seeds.binary import encode_seeds_binary, open_seeds_binary
+from seeds.lazy import SeedsLazyStore, encode_seeds_lines, encode_seeds_index
+from seeds.schema.dump import SeedsDumpMetadata
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedsFailuresReport
+from seeds.store import SeedsStore
+from seeds.telemetry import SeedsTelemetrySummary
 import os
+from collections import defaultdict
+from tools.config.seeds import SeedsDumpsFormat
 from tools.logger import get_logger
 
                   
 logger = get_logger("SEEDS_DUMPS")
 
+DUMPS_DIR = "./dumps"
+
+
+def get_seeds_file(scenario: str, dumps_format: SeedsDumpsFormat = SeedsDumpsFormat.JSON) -> str:
+    """Возвращает путь к файлу с результатом Seeds в указанном формате (JSON или бинарный)"""
+    if dumps_format == SeedsDumpsFormat.BINARY:
+        return f"{DUMPS_DIR}/{scenario}_seeds.bin"
+    return f"{DUMPS_DIR}/{scenario}_seeds.json"
+
+
+def get_seeds_index_file(scenario: str) -> str:
+    """Возвращает путь к индексу смещений пользователей в JSON файле результата (см. seeds/lazy.py)"""
+    return f"{DUMPS_DIR}/{scenario}_seeds.idx"
+
+
+def get_seeds_checkpoint_file(scenario: str) -> str:
+    """Возвращает путь к JSONL файлу с уже созданными пользователями (чекпоинт сидинга)"""
+    return f"{DUMPS_DIR}/{scenario}_seeds.jsonl"
+
+
+def get_seeds_telemetry_file(scenario: str) -> str:
+    """Возвращает путь к текстовому файлу со сводкой телеметрии сидинга (рядом с дампом)"""
+    return f"{DUMPS_DIR}/{scenario}_seeds.telemetry.txt"
+
+
+def get_seeds_failures_file(scenario: str) -> str:
+    """Возвращает путь к JSON файлу с отчётом об ошибках сидинга (рядом с дампом)"""
+    return f"{DUMPS_DIR}/{scenario}_seeds.failures.json"
+
+
+def get_seeds_metadata_file(scenario: str) -> str:
+    """Возвращает путь к JSON файлу с описанием дампа (сценарий, gateway и план)"""
+    return f"{DUMPS_DIR}/{scenario}_seeds.meta.json"
+
+
+def seeds_result_exists(scenario: str, dumps_format: SeedsDumpsFormat = SeedsDumpsFormat.JSON) -> bool:
+    """Проверяет, что для сценария уже сохранён полный результат Seeds"""
+    return os.path.isfile(get_seeds_file(scenario, dumps_format))
+
+
+def touch_seeds_result(scenario: str, dumps_format: SeedsDumpsFormat = SeedsDumpsFormat.JSON):
+    """Обновляет время изменения дампа, чтобы он считался недавно использованным при вытеснении"""
+    os.utime(get_seeds_file(scenario, dumps_format))
+
 
 def save_seeds_result(result: SeedsResult, scenario: str):
-    """Сохраняет результат Seeds в JSON файл"""
-    seeds_file = f"./dumps/{scenario}_seeds.json"
-    if not os.path.exists("dumps"):
-        os.mkdir("dumps")
-    with open(seeds_file, "w+", encoding="utf-8") as file:
-        file.write(result.model_dump_json(indent=2))
+    """
+    Сохраняет результат Seeds в JSON файл (по пользователю на строку) и индекс смещений пользователей
+    для ленивой загрузки (см. seeds/lazy.py).
+    Файл записывается во временный и атомарно переименовывается, поэтому существующий дамп всегда полный.
+    """
+    seeds_file = get_seeds_file(scenario)
+    index_file = get_seeds_index_file(scenario)
+    if not os.path.exists(DUMPS_DIR):
+        os.mkdir(DUMPS_DIR)
+    data, offsets = encode_seeds_lines(result.users)
+    with open(f"{seeds_file}.tmp", "wb") as file:
+        file.write(data)
+    with open(f"{index_file}.tmp", "wb") as file:
+        file.write(encode_seeds_index(offsets))
+    os.replace(f"{seeds_file}.tmp", seeds_file)
+    os.replace(f"{index_file}.tmp", index_file)
     logger.debug(f"Seeding result saved to file: {seeds_file}")
 
 def load_seeds_result(scenario: str) -> SeedsResult:
     """Загружает результат Seeds из JSON файла"""
-    seeds_file = f"./dumps/{scenario}_seeds.json"
+    seeds_file = get_seeds_file(scenario)
     with open(seeds_file, "r", encoding="utf-8") as file:
         result = SeedsResult.model_validate_json(file.read())
         logger.debug(f"Seeding result loaded from file: {seeds_file}")
         
-        return result
\ No newline at end of file
+        return result
+
+
+def load_seeds_result_lazy(scenario: str) -> SeedsLazyStore:
+    """
+    Открывает JSON файл результата Seeds лениво: в памяти только индекс смещений пользователей,
+    а пользователь валидируется при выдаче. Дамп старого формата (с отступами) один раз
+    перезаписывается по пользователю на строку.
+    """
+    seeds_file = get_seeds_file(scenario)
+    result = SeedsLazyStore.open(seeds_file, get_seeds_index_file(scenario))
+    if result is None:
+        logger.info(f"Seeding result rewritten to line-delimited format for lazy loading: {seeds_file}")
+        save_seeds_result(load_seeds_result(scenario), scenario)
+        result = SeedsLazyStore.open(seeds_file, get_seeds_index_file(scenario))
+    logger.debug(f"Seeding result mapped from file: {seeds_file}, users: {len(result)}")
+
+    return result
+
+
+def save_seeds_result_binary(result: SeedsResult, scenario: str):
+    """Сохраняет результат Seeds в компактный бинарный файл (см. seeds/binary.py)"""
+    seeds_file = get_seeds_file(scenario, SeedsDumpsFormat.BINARY)
+    if not os.path.exists(DUMPS_DIR):
+        os.mkdir(DUMPS_DIR)
+    with open(f"{seeds_file}.tmp", "wb") as file:
+        file.write(encode_seeds_binary(SeedsStore.from_result(result)))
+    os.replace(f"{seeds_file}.tmp", seeds_file)
+    logger.debug(f"Seeding result saved to file: {seeds_file}")
+
+
+def load_seeds_result_binary(scenario: str) -> SeedsStore:
+    """Открывает бинарный файл результата Seeds через mmap, не загружая его в память целиком"""
+    seeds_file = get_seeds_file(scenario, SeedsDumpsFormat.BINARY)
+    result = open_seeds_binary(seeds_file)
+    logger.debug(f"Seeding result mapped from file: {seeds_file}")
+
+    return result
+
+
+def save_seeds_telemetry(summary: SeedsTelemetrySummary, scenario: str):
+    """Сохраняет сводку телеметрии сидинга в виде таблицы рядом с дампом"""
+    if not os.path.exists(DUMPS_DIR):
+        os.mkdir(DUMPS_DIR)
+    telemetry_file = get_seeds_telemetry_file(scenario)
+    with open(telemetry_file, "w", encoding="utf-8") as file:
+        file.write(f"{summary.to_table()}\n")
+    logger.debug(f"Seeding telemetry saved to file: {telemetry_file}")
+
+
+def save_seeds_failures(failures: SeedsFailuresReport, scenario: str):
+    """Сохраняет отчёт об ошибках сидинга (повторы и исключённые пользователи) рядом с дампом"""
+    if not os.path.exists(DUMPS_DIR):
+        os.mkdir(DUMPS_DIR)
+    failures_file = get_seeds_failures_file(scenario)
+    with open(failures_file, "w", encoding="utf-8") as file:
+        file.write(failures.model_dump_json(indent=2))
+    logger.debug(f"Seeding failures saved to file: {failures_file}")
+
+
+def save_seeds_metadata(metadata: SeedsDumpMetadata, scenario: str):
+    """Сохраняет описание дампа рядом с ним"""
+    if not os.path.exists(DUMPS_DIR):
+        os.mkdir(DUMPS_DIR)
+    with open(get_seeds_metadata_file(scenario), "w", encoding="utf-8") as file:
+        file.write(metadata.model_dump_json(indent=2))
+
+
+def find_seeds_base_dump(
+        metadata: SeedsDumpMetadata,
+        exclude: str,
+        dumps_format: SeedsDumpsFormat = SeedsDumpsFormat.JSON
+) -> str | None:
+    """
+    Ищет самый свежий дамп того же сценария на том же gateway, но для другого плана —
+    основу для дозаполнения пула до нового плана.
+
+    :param metadata: Описание текущего дампа (используются сценарий и gateway).
+    :param exclude: Имя текущего дампа.
+    :param dumps_format: Формат дампов.
+    :return: Имя найденного дампа или None.
+    """
+    if not os.path.exists(DUMPS_DIR):
+        return None
+
+    candidates = []
+    for entry in os.scandir(DUMPS_DIR):
+        if not entry.name.endswith("_seeds.meta.json"):
+            continue
+        dump = entry.name.removesuffix("_seeds.meta.json")
+        if dump == exclude or not seeds_result_exists(dump, dumps_format):
+            continue
+        with open(entry.path, "r", encoding="utf-8") as file:
+            candidate = SeedsDumpMetadata.model_validate_json(file.read())
+        if (candidate.scenario, candidate.gateway) == (metadata.scenario, metadata.gateway):
+            candidates.append((os.path.getmtime(get_seeds_file(dump, dumps_format)), dump))
+
+    return max(candidates)[1] if candidates else None
+
+
+def get_seeds_dump_mtime(entries: list[os.DirEntry]) -> float:
+    """
+    Время изменения дампа: файла результата (JSON или бинарного), а если его нет — самого свежего файла дампа.
+    """
+    results = [entry for entry in entries if entry.name.endswith(("_seeds.json", "_seeds.bin"))]
+    return max(entry.stat().st_mtime for entry in results or entries)
+
+
+def is_seeds_dump_evictable(dump: str, entries: list[os.DirEntry], keep: str) -> bool:
+    """
+    Проверяет, что дамп можно вытеснить: это не текущий сценарий и не общий пул сидов (см. SeedsRegistry),
+    и у дампа нет чекпоинта (сидинг идёт или прерван) и временных файлов (идёт сохранение).
+    """
+    if dump == keep or dump.startswith("shared_"):
+        return False
+    return not any(entry.name.endswith((".jsonl", ".tmp")) for entry in entries)
+
+
+def evict_seeds_dumps(max_bytes: int, keep: str):
+    """
+    Удаляет самые старые (по времени изменения файла результата) дампы целиком — со всеми файлами
+    рядом с ними (индексом, описанием, телеметрией), пока суммарный размер папки превышает max_bytes.
+    Дампы, которые сейчас строятся или сохраняются, и общий пул сидов не удаляются (см. is_seeds_dump_evictable).
+
+    :param max_bytes: Допустимый суммарный размер файлов в папке дампов.
+    :param keep: Сценарий, дампы которого нельзя удалять (текущий).
+    """
+    if not os.path.exists(DUMPS_DIR):
+        return
+
+    files = [entry for entry in os.scandir(DUMPS_DIR) if entry.is_file()]
+    total = sum(entry.stat().st_size for entry in files)
+
+    dumps: dict[str, list[os.DirEntry]] = defaultdict(list)
+    for entry in files:
+        dump, separator, _ = entry.name.rpartition("_seeds.")
+        if separator:
+            dumps[dump].append(entry)
+
+    evictable = [
+        (get_seeds_dump_mtime(entries), dump, entries)
+        for dump, entries in dumps.items()
+        if is_seeds_dump_evictable(dump, entries, keep)
+    ]
+    for _, dump, entries in sorted(evictable):
+        if total <= max_bytes:
+            break
+
+        for entry in entries:
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+        logger.info(f"Seeding dump evicted to fit disk budget: {DUMPS_DIR}/{dump}_seeds.*")
+
+
+def append_seed_user_result(user: SeedUserResult, scenario: str):
+    """
+    Дописывает созданного пользователя в чекпоинт сидинга отдельной строкой.
+    Строка пишется одним вызовом write в режиме append, поэтому её можно вызывать
+    из разных greenlet'ов и процессов сидинга.
+    """
+    if not os.path.exists(DUMPS_DIR):
+        os.makedirs(DUMPS_DIR, exist_ok=True)
+    with open(get_seeds_checkpoint_file(scenario), "a", encoding="utf-8") as file:
+        file.write(f"{user.model_dump_json()}\n")
+
+
+def load_seed_user_results(scenario: str) -> list[SeedUserResult]:
+    """
+    Загружает пользователей из чекпоинта сидинга.
+    Недописанная последняя строка (падение во время записи) отбрасывается и обрезается в файле,
+    чтобы следующие записи начинались с новой строки.
+    """
+    checkpoint_file = get_seeds_checkpoint_file(scenario)
+    if not os.path.isfile(checkpoint_file):
+        return []
+
+    with open(checkpoint_file, "rb+") as file:
+        data = file.read()
+        complete = data[:data.rfind(b"\n") + 1]
+        if len(complete) != len(data):
+            file.truncate(len(complete))
+            logger.warning(f"Incomplete record dropped from seeding checkpoint: {checkpoint_file}")
+
+    users = [SeedUserResult.model_validate_json(line) for line in complete.splitlines() if line]
+    logger.debug(f"Seeding checkpoint loaded from file: {checkpoint_file}, users: {len(users)}")
+
+    return users
+
+
+def remove_seeds_checkpoint(scenario: str):
+    """Удаляет чекпоинт сидинга (после сохранения полного результата или при пересоздании)"""
+    checkpoint_file = get_seeds_checkpoint_file(scenario)
+    if os.path.isfile(checkpoint_file):
+        os.remove(checkpoint_file)
@@ -0,0 +1,242 @@
+import mmap
+import os
+import random
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+
+from seeds.checkout import SeedsCheckout
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+# Построчный JSON-формат дампа сидинга — обычный JSON SeedsResult, в котором каждый пользователь
+# записан отдельной строкой:
+#
+#   {"users":[
+#   {"user_id": ...},
+#   {"user_id": ...}
+#   ]}
+#
+# Переводы строк внутри записей экранируются JSON-сериализатором, поэтому границы записей
+# находятся поиском "\n" без разбора JSON. Смещения начал записей (uint64 little-endian, плюс
+# конец последней записи + 2) сохраняются в индекс рядом с дампом: с ним дамп открывается за O(1),
+# а запись пользователя валидируется только при выдаче (см. SeedsLazyStore).
+HEADER = b'{"users":[\n'
+FOOTER = b'\n]}\n'
+SEPARATOR = b',\n'
+
+
+def encode_seeds_lines(users: Iterable[SeedUserResult]) -> tuple[bytes, array]:
+    """
+    Кодирует пользователей в построчный JSON-формат.
+
+    :param users: Пользователи пула сидов.
+    :return: Содержимое дампа и индекс смещений записей.
+    """
+    offsets = array("Q", [len(HEADER)])
+    chunks = [HEADER]
+    for user in users:
+        record = user.model_dump_json().encode("utf-8")
+        if len(chunks) > 1:
+            chunks.append(SEPARATOR)
+        chunks.append(record)
+        offsets.append(offsets[-1] + len(record) + len(SEPARATOR))
+    chunks.append(FOOTER)
+
+    return b"".join(chunks), offsets
+
+
+def index_seeds_lines(data: bytes | mmap.mmap) -> array | None:
+    """
+    Строит индекс смещений записей по построчному дампу (один проход поиском "\n", без разбора JSON).
+
+    :param data: Содержимое дампа.
+    :return: Индекс смещений или None, если дамп не в построчном формате (например, с отступами).
+    """
+    end = len(data) - len(FOOTER)
+    if data[:len(HEADER)] != HEADER or data[end:] != FOOTER:
+        return None
+
+    offsets = array("Q", [len(HEADER)])
+    if end > len(HEADER):
+        position = len(HEADER)
+        while (newline := data.find(b"\n", position, end)) != -1:
+            position = newline + 1
+            offsets.append(position)
+        offsets.append(end + len(SEPARATOR))
+
+    return offsets
+
+
+def is_seeds_index_valid(data: bytes | mmap.mmap, offsets: Sequence[int]) -> bool:
+    """
+    Проверяет, что индекс относится к этому дампу (дамп мог быть перезаписан без индекса).
+    """
+    if not offsets or offsets[0] != len(HEADER):
+        return False
+    if len(offsets) == 1:
+        return len(data) == len(HEADER) + len(FOOTER)
+    return offsets[-1] == len(data) - len(FOOTER) + len(SEPARATOR)
+
+
+def encode_seeds_index(offsets: array) -> bytes:
+    """
+    Кодирует индекс смещений записей (uint64 little-endian).
+    """
+    offsets = array("Q", offsets)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def open_seeds_index(path: str) -> Sequence[int] | None:
+    """
+    Открывает индекс смещений записей через mmap (на little-endian платформах без копирования).
+
+    :param path: Путь к индексу.
+    :return: Индекс смещений или None, если файла нет.
+    """
+    if not os.path.isfile(path) or not os.path.getsize(path):
+        return None
+
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if sys.byteorder == "little":
+        return memoryview(buffer).cast("Q")
+
+    offsets = array("Q", buffer)
+    offsets.byteswap()
+    return offsets
+
+
+class SeedsLazyUsers(Sequence):
+    """
+    Последовательность пользователей ленивого хранилища. Запись валидируется при каждом обращении.
+    """
+
+    def __init__(self, store: "SeedsLazyStore"):
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.store.get_user(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seed user index out of range")
+        return self.store.get_user(index)
+
+
+class SeedsLazyStore:
+    """
+    Ленивое хранилище JSON-дампа сидинга в построчном формате.
+
+    В памяти держит только дамп, отображённый через mmap (или строку сообщения мастера),
+    и индекс смещений записей. Запись пользователя валидируется в SeedUserResult только
+    при выдаче (get_next_user, get_random_user), поэтому загрузка не зависит от размера пула,
+    а память — пропорциональна активным виртуальным пользователям, а не пулу.
+
+    Attributes:
+        data: Содержимое дампа
+        offsets: Индекс смещений записей пользователей в data
+        checkout: Выдача пользователей для get_next_user
+    """
+
+    def __init__(self, data: bytes | mmap.mmap, offsets: Sequence[int]):
+        """
+        :param data: Содержимое дампа в построчном формате.
+        :param offsets: Индекс смещений записей (см. encode_seeds_lines).
+        """
+        self.data = data
+        self.offsets = offsets
+        self.checkout: SeedsCheckout[SeedUserResult] = SeedsCheckout(self.users)
+
+    @classmethod
+    def open(cls, path: str, index_path: str) -> "SeedsLazyStore | None":
+        """
+        Открывает построчный дамп через mmap. Если индекса нет или он устарел,
+        он строится одним проходом по дампу и сохраняется рядом.
+
+        :param path: Путь к дампу.
+        :param index_path: Путь к индексу смещений.
+        :return: Ленивое хранилище или None, если дамп не в построчном формате.
+        """
+        with open(path, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        offsets = open_seeds_index(index_path)
+        if offsets is None or not is_seeds_index_valid(data, offsets):
+            offsets = index_seeds_lines(data)
+            if offsets is None:
+                data.close()
+                return None
+            with open(f"{index_path}.tmp", "wb") as file:
+                file.write(encode_seeds_index(offsets))
+            os.replace(f"{index_path}.tmp", index_path)
+
+        return cls(data, offsets)
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "SeedsLazyStore":
+        """
+        Создаёт хранилище из JSON SeedsResult (например, части пула, присланной мастером Locust).
+        JSON не в построчном формате валидируется целиком и перекодируется.
+        """
+        data = data.encode("utf-8") if isinstance(data, str) else data
+        offsets = index_seeds_lines(data)
+        if offsets is None:
+            data, offsets = encode_seeds_lines(SeedsResult.model_validate_json(data).users)
+
+        return cls(data, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def users(self) -> SeedsLazyUsers:
+        """
+        Последовательность всех пользователей хранилища.
+        """
+        return SeedsLazyUsers(self)
+
+    def get_record(self, index: int) -> bytes:
+        """
+        Возвращает JSON-запись пользователя по индексу без валидации.
+        """
+        return self.data[self.offsets[index]:self.offsets[index + 1] - len(SEPARATOR)]
+
+    def encode_slice(self, start: int, stop: int) -> bytes:
+        """
+        Возвращает пользователей с start по stop (не включая) в построчном JSON-формате без их разбора:
+        записи идут в дампе подряд, поэтому срез — один кусок data.
+        """
+        if start >= stop:
+            return HEADER + FOOTER
+        return HEADER + self.data[self.offsets[start]:self.offsets[stop] - len(SEPARATOR)] + FOOTER
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """
+        Возвращает пользователя по индексу (запись валидируется при обращении).
+        Сценарии работают с ним через протокол SeedUser (seeds/user.py), как и с SeedUserView.
+        """
+        return SeedUserResult.model_validate_json(self.get_record(index))
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего пользователя согласно выдаче checkout.
+        """
+        return self.checkout.checkout()
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя.
+        """
+        return self.get_user(random.randrange(len(self)))
+
+    def to_result(self) -> SeedsResult:
+        """
+        Полностью валидирует хранилище в SeedsResult.
+        """
+        return SeedsResult(users=list(self.users))
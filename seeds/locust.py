@@ -0,0 +1,174 @@
+import gevent
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from seeds.lazy import SeedsLazyStore, encode_seeds_lines
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult
+from seeds.shards import partition_seeds_result, split_count, get_seeds_pool_size
+from seeds.store import SeedsStore
+from tools.config.seeds import SeedsCheckoutOrder, SeedsExhaustionPolicy
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_LOCUST")
+
+# Тип кастомного сообщения Locust, в котором мастер отправляет воркеру его часть пула сидов
+SEEDS_PARTITION_MESSAGE = "seeds_partition"
+# Тип кастомного сообщения Locust, которым мастер сообщает воркеру, что потоковый сидинг завершён
+SEEDS_CLOSED_MESSAGE = "seeds_closed"
+# Как часто мастер рассылает воркерам новых пользователей при потоковом сидинге (секунды)
+SEEDS_STREAM_INTERVAL = 1.0
+
+
+def send_seeds_partitions(environment: Environment) -> None:
+    """
+    Делит пул сидов мастера между подключёнными воркерами и отправляет каждому его часть.
+
+    Вызывается на мастере в test_start: это событие срабатывает до рассылки "spawn",
+    а сообщения воркер обрабатывает по порядку, поэтому сиды приходят раньше виртуальных пользователей.
+
+    Части отправляются в построчном JSON-формате (см. seeds/lazy.py), чтобы воркер мог загрузить их лениво.
+    Части ленивого пула мастера вырезаются из дампа без разбора пользователей.
+
+    :param environment: Окружение Locust мастера с загруженными сидами.
+    """
+    runner: MasterRunner = environment.runner
+    workers = sorted(runner.clients.keys())
+    seeds = environment.seeds
+    counts = split_count(len(seeds), len(workers))
+    if isinstance(seeds, SeedsLazyStore):
+        bounds = [sum(counts[:index]) for index in range(len(counts) + 1)]
+        partitions = [seeds.encode_slice(start, stop) for start, stop in zip(bounds, bounds[1:])]
+    else:
+        partitions = [encode_seeds_lines(part.users)[0] for part in partition_seeds_result(seeds, len(workers))]
+
+    for worker, partition in zip(workers, partitions):
+        runner.send_message(SEEDS_PARTITION_MESSAGE, partition.decode("utf-8"), client_id=worker)
+
+    logger.info(f"Seeding partitions sent to {len(workers)} workers: {counts}")
+
+
+def stream_seeds_partitions(environment: Environment) -> None:
+    """
+    Потоковый сидинг на мастере: рассылает воркерам уже созданных пользователей, а затем
+    в фоне раз в SEEDS_STREAM_INTERVAL секунд досылает новых, пока пул мастера не будет закрыт.
+    Каждая порция делится между воркерами со сдвигом, чтобы небольшие порции распределялись равномерно.
+
+    Первая порция отправляется синхронно в test_start — до рассылки "spawn".
+
+    :param environment: Окружение Locust мастера с пополняемым пулом сидов.
+    """
+    runner: MasterRunner = environment.runner
+    workers = sorted(runner.clients.keys())
+    store: SeedsStore = environment.seeds
+    sent = 0
+
+    def send_batch() -> None:
+        nonlocal sent
+        users = store.users[sent:]
+        partitions = partition_seeds_result(SeedsResult(users=[user.to_result() for user in users]), len(workers))
+        shift = sent % len(workers)
+        for worker, partition in zip(workers[shift:] + workers[:shift], partitions):
+            if partition.users or not sent:
+                runner.send_message(SEEDS_PARTITION_MESSAGE, partition.model_dump_json(), client_id=worker)
+        sent += len(users)
+
+    def stream() -> None:
+        while True:
+            closed = store.checkout.closed
+            if len(store) > sent:
+                send_batch()
+            if closed:
+                for worker in workers:
+                    runner.send_message(SEEDS_CLOSED_MESSAGE, None, client_id=worker)
+                logger.info(f"Streaming seeding partitions sent to {len(workers)} workers: {sent} users")
+                return
+            gevent.sleep(SEEDS_STREAM_INTERVAL)
+
+    send_batch()
+    gevent.spawn(stream)
+
+
+def size_seeds_pool(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Подгоняет размер пула сидов под нагрузку (SEEDS.AUTO_SIZE): по количеству виртуальных
+    пользователей Locust (users), SEEDS.SHARING_FACTOR и количеству воркеров (--expect-workers),
+    между которыми мастер поделит пул. Без users в параметрах запуска остаётся размер из плана сценария.
+
+    :param environment: Окружение Locust мастера или локального запуска.
+    :param seeds_scenario: Сценарий сидинга.
+    """
+    users = environment.parsed_options.num_users
+    if not settings.seeds.auto_size or not users:
+        return
+
+    workers = environment.parsed_options.expect_workers if isinstance(environment.runner, MasterRunner) else 1
+    seeds_scenario.pool_size = get_seeds_pool_size(users, settings.seeds.sharing_factor, workers)
+    logger.info(
+        f"Seeding pool sized to the load: {seeds_scenario.pool_size} seed users for {users} virtual users "
+        f"on {workers} workers (sharing factor {settings.seeds.sharing_factor})"
+    )
+    if (
+            settings.seeds.sharing_factor > 1
+            and settings.seeds.checkout_policy == SeedsExhaustionPolicy.RAISE
+            and settings.seeds.checkout_order != SeedsCheckoutOrder.ROUND_ROBIN
+    ):
+        logger.warning(
+            "SEEDS.SHARING_FACTOR > 1 shares seed users between virtual users, but the pool is checked out "
+            "without repeats: use SEEDS.CHECKOUT_POLICY=wrap or SEEDS.CHECKOUT_ORDER=round_robin"
+        )
+
+
+def init_seeds(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Выполняет сидинг в хуке events.init и кладёт пул сидов в environment.seeds.
+
+    - локальный запуск: сидинг и загрузка дампа, как и раньше;
+    - мастер (--master): сидинг выполняется один раз, а в начале теста каждый воркер
+      получает свою непересекающуюся часть пула через кастомное сообщение Locust;
+    - воркер (--worker): сидинг не выполняется, воркер ждёт свою часть от мастера.
+
+    При SEEDS.AUTO_SIZE размер пула считается по нагрузке (см. size_seeds_pool).
+
+    При SEEDS.STREAMING хук не ждёт окончания сидинга: пул пополняется в фоне
+    (см. SeedsScenario.stream), мастер досылает воркерам новых пользователей по мере создания,
+    а виртуальные пользователи ждут сидов в get_next_user, пока пул не закрыт.
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга.
+    """
+    streaming = settings.seeds.streaming
+
+    if isinstance(environment.runner, WorkerRunner):
+        def on_seeds_partition(environment: Environment, msg, **kwargs):
+            seeds = getattr(environment, "seeds", None)
+            if streaming and seeds is not None and not seeds.checkout.closed:
+                # Очередная порция потокового сидинга — дополняем пул
+                seeds.extend(SeedsResult.model_validate_json(msg.data).users)
+                seeds.checkout.notify()
+                return
+            environment.seeds = seeds_scenario.load_partition(msg.data, closed=not streaming)
+
+        def on_seeds_closed(environment: Environment, msg, **kwargs):
+            environment.seeds.checkout.close()
+            logger.info(f"Streaming seeding finished: {len(environment.seeds)} users in the worker pool.")
+
+        if streaming:
+            # Пока первая порция не пришла, виртуальные пользователи ждут сидов в пустом пуле
+            environment.seeds = seeds_scenario.attach_checkout(SeedsStore.empty(), closed=False)
+        environment.runner.register_message(SEEDS_PARTITION_MESSAGE, on_seeds_partition)
+        environment.runner.register_message(SEEDS_CLOSED_MESSAGE, on_seeds_closed)
+        return
+
+    size_seeds_pool(environment, seeds_scenario)
+    if streaming:
+        environment.seeds = seeds_scenario.stream(reseed=environment.parsed_options.reseed)
+    else:
+        seeds_scenario.build(reseed=environment.parsed_options.reseed)
+        environment.seeds = seeds_scenario.load()
+
+    if isinstance(environment.runner, MasterRunner):
+        environment.events.test_start.add_listener(
+            stream_seeds_partitions if streaming else send_seeds_partitions
+        )
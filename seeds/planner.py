@@ -0,0 +1,210 @@
+import argparse
+import importlib
+import math
+from collections import defaultdict
+from statistics import mean
+
+from pydantic import BaseModel, Field
+
+from seeds.builder import SeedsBuilder, CARD_ACCOUNT_FIELDS
+from seeds.scenario import SeedsScenario
+from seeds.services import build_seeds_builder
+from seeds.schema.plan import SeedsPlan, SeedAccountsPlan
+from seeds.shards import build_shard_plan
+from seeds.telemetry import SeedsTelemetry
+from config import settings
+
+# Методы gateway, через которые сидер открывает счета разных типов
+ACCOUNT_METHODS = {
+    "savings_accounts": "open_savings_account",
+    "deposit_accounts": "open_deposit_account",
+    "debit_card_accounts": "open_debit_card_account",
+    "credit_card_accounts": "open_credit_card_account"
+}
+# Методы gateway, через которые сидер создаёт карты и операции по карточному счёту
+ITEM_METHODS = {
+    "physical_cards": "issue_physical_card",
+    "virtual_cards": "issue_virtual_card",
+    "top_up_operations": "make_top_up_operation",
+    "purchase_operations": "make_purchase_operation",
+    "transfer_operations": "make_transfer_operation",
+    "cash_withdrawal_operations": "make_cash_withdrawal_operation"
+}
+
+
+class SeedsEstimate(BaseModel):
+    """
+    Оценка стоимости сидинга по плану.
+
+    Attributes:
+        requests (dict[str, int]): Количество запросов по каждому методу gateway.
+        total_requests (int): Общее количество запросов.
+        latencies (dict[str, float]): Латентность методов в секундах (из калибровки).
+        sequential_seconds (float | None): Время последовательного сидинга.
+        estimated_seconds (float | None): Прогноз времени сидинга при заданной конкурентности.
+    """
+    requests: dict[str, int] = Field(default_factory=dict)
+    total_requests: int = 0
+    latencies: dict[str, float] = Field(default_factory=dict)
+    sequential_seconds: float | None = None
+    estimated_seconds: float | None = None
+
+
+class SeedsPlanner:
+    """
+    Планировщик сидинга: считает, сколько запросов к gateway требует план, и по латентностям
+    методов прогнозирует время сидинга при заданной конкурентности — без создания данных.
+
+    Модель прогноза повторяет SeedsBuilder: запросы ограничены entities_concurrency одновременных
+    вызовов, пользователи строятся по users_concurrency одновременно, а внутри пользователя
+    (при entities_concurrency > 1) счета и их карты/операции создаются параллельно.
+
+    Attributes:
+        plan: План сидинга
+    """
+
+    def __init__(self, plan: SeedsPlan):
+        self.plan = plan
+
+    def count_user_requests(self) -> dict[str, int]:
+        """
+        Считает запросы к gateway, необходимые для создания одного пользователя.
+        """
+        requests = defaultdict(int)
+        requests["create_user"] += 1
+        for account_field, account_method in ACCOUNT_METHODS.items():
+            account_plan: SeedAccountsPlan = getattr(self.plan.users, account_field)
+            requests[account_method] += account_plan.count
+            if account_field not in CARD_ACCOUNT_FIELDS:
+                continue
+            for item_field, item_method in ITEM_METHODS.items():
+                requests[item_method] += account_plan.count * getattr(account_plan, item_field).count
+
+        return {method: count for method, count in requests.items() if count}
+
+    def count_requests(self) -> dict[str, int]:
+        """
+        Считает запросы к gateway, необходимые для всего плана.
+        """
+        return {method: count * self.plan.users.count for method, count in self.count_user_requests().items()}
+
+    def get_user_critical_path(self, latencies: dict[str, float], parallel: bool) -> float:
+        """
+        Время создания одного пользователя: при parallel — длина критического пути
+        (пользователь → самый долгий счёт → самая долгая карта/операция), иначе сумма всех запросов.
+        """
+        accounts = []
+        for account_field, account_method in ACCOUNT_METHODS.items():
+            account_plan: SeedAccountsPlan = getattr(self.plan.users, account_field)
+            items = []
+            if account_field in CARD_ACCOUNT_FIELDS:
+                items = [
+                    latencies[item_method]
+                    for item_field, item_method in ITEM_METHODS.items()
+                    for _ in range(getattr(account_plan, item_field).count)
+                ]
+            children = (max(items) if parallel else sum(items)) if items else 0.0
+            accounts.extend([latencies[account_method] + children] * account_plan.count)
+
+        if not accounts:
+            return latencies["create_user"]
+        return latencies["create_user"] + (max(accounts) if parallel else sum(accounts))
+
+    def estimate(
+            self,
+            latencies: dict[str, float] | None = None,
+            users_concurrency: int = 1,
+            entities_concurrency: int = 1,
+            processes: int = 1
+    ) -> SeedsEstimate:
+        """
+        Оценивает стоимость плана.
+
+        Args:
+            latencies: Латентность методов gateway в секундах (например, из calibrate_seeds_latencies).
+                Для методов без замеров берётся средняя латентность. Без латентностей считаются только запросы.
+            users_concurrency: Количество одновременно создаваемых пользователей
+            entities_concurrency: Количество одновременных запросов к gateway
+            processes: Количество процессов сидинга (SEEDS.PROCESSES)
+
+        Returns:
+            SeedsEstimate: Количество запросов и прогноз времени
+        """
+        requests = self.count_requests()
+        estimate = SeedsEstimate(requests=requests, total_requests=sum(requests.values()))
+        if not latencies:
+            return estimate
+
+        default = mean(latencies.values())
+        latencies = {
+            method: latencies.get(method, default)
+            for method in {"create_user", *ACCOUNT_METHODS.values(), *ITEM_METHODS.values()}
+        }
+        work = sum(count * latencies[method] for method, count in requests.items())
+        per_user = self.get_user_critical_path(latencies, parallel=entities_concurrency > 1)
+        users_per_process = math.ceil(self.plan.users.count / processes)
+
+        estimate.latencies = {method: latencies[method] for method in requests}
+        estimate.sequential_seconds = work
+        estimate.estimated_seconds = max(
+            # Ограничение по одновременным запросам к gateway в каждом процессе
+            work / processes / entities_concurrency,
+            # Ограничение по одновременно создаваемым пользователям
+            math.ceil(users_per_process / users_concurrency) * per_user
+        )
+
+        return estimate
+
+
+def calibrate_seeds_latencies(builder: SeedsBuilder, plan: SeedsPlan, users: int = 3) -> dict[str, float]:
+    """
+    Калибровочный прогон: строит users пользователей по плану и замеряет среднюю латентность
+    каждого метода gateway. Внимание: создаёт на стенде реальные данные.
+
+    Args:
+        builder: Сидер, через который выполняется калибровка
+        plan: План сидинга
+        users: Количество пользователей в калибровочном прогоне
+
+    Returns:
+        dict[str, float]: Средняя латентность методов в секундах
+    """
+    telemetry = builder.telemetry = SeedsTelemetry(total_users=users)
+    try:
+        builder.build(build_shard_plan(plan, users))
+    finally:
+        builder.telemetry = None
+
+    return {method: mean(values) for method, values in telemetry.samples.items()}
+
+
+if __name__ == '__main__':
+    """
+    Оценка стоимости сценария сидинга без его запуска:
+    python -m seeds.planner existing_user_get_operations --calibrate 3 --users-concurrency 10 --entities-concurrency 50
+    """
+    parser = argparse.ArgumentParser(description="Estimate seeding cost of a seeds scenario")
+    parser.add_argument("scenario", help="Module name in seeds/scenarios, e.g. existing_user_get_operations")
+    parser.add_argument("--calibrate", type=int, default=0, help="Users to build in a calibration run (creates data)")
+    parser.add_argument("--users-concurrency", type=int, default=settings.seeds.users_concurrency)
+    parser.add_argument("--entities-concurrency", type=int, default=settings.seeds.entities_concurrency)
+    parser.add_argument("--processes", type=int, default=settings.seeds.processes)
+    arguments = parser.parse_args()
+
+    module = importlib.import_module(f"seeds.scenarios.{arguments.scenario}")
+    scenario_class = next(
+        value for value in vars(module).values()
+        if isinstance(value, type) and issubclass(value, SeedsScenario) and value is not SeedsScenario
+    )
+    seeds_plan = scenario_class().plan
+
+    seeds_latencies = None
+    if arguments.calibrate:
+        seeds_latencies = calibrate_seeds_latencies(build_seeds_builder(), seeds_plan, users=arguments.calibrate)
+
+    print(SeedsPlanner(seeds_plan).estimate(
+        latencies=seeds_latencies,
+        users_concurrency=arguments.users_concurrency,
+        entities_concurrency=arguments.entities_concurrency,
+        processes=arguments.processes
+    ).model_dump_json(indent=2))
@@ -0,0 +1,317 @@
+import hashlib
+from collections import defaultdict
+
+from seeds.builder import CARD_ACCOUNT_FIELDS
+from seeds.dumps import save_seeds_result, load_seeds_result, seeds_result_exists
+from seeds.schema.plan import SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult
+from seeds.store import ACCOUNT_FIELDS, ITEM_FIELDS, CARD_FIELDS
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_REGISTRY")
+
+
+def get_user_capabilities(user: SeedUserResult) -> dict[str, int]:
+    """
+    Возможности пользователя для индекса реестра:
+    - "<тип счёта>" — количество счетов этого типа (например, "credit_card_accounts": 2)
+    - "<тип счёта>.<карты/операции>" — максимум карт или операций на одном счёте этого типа
+      (например, "credit_card_accounts.purchase_operations": 5)
+
+    Args:
+        user: Пользователь из пула сидов
+
+    Returns:
+        dict[str, int]: Ненулевые возможности пользователя
+    """
+    capabilities = {}
+    for account_field in ACCOUNT_FIELDS:
+        accounts: list[SeedAccountResult] = getattr(user, account_field)
+        if not accounts:
+            continue
+        capabilities[account_field] = len(accounts)
+        if account_field not in CARD_ACCOUNT_FIELDS:
+            continue
+        for item_field in ITEM_FIELDS:
+            count = max(len(getattr(account, item_field)) for account in accounts)
+            if count:
+                capabilities[f"{account_field}.{item_field}"] = count
+
+    return capabilities
+
+
+def get_plan_requirements(plan: SeedUsersPlan) -> dict[str, int]:
+    """
+    Требования плана пользователя в терминах возможностей (см. get_user_capabilities).
+
+    Args:
+        plan: План генерации пользователя
+
+    Returns:
+        dict[str, int]: Минимальные значения возможностей, которые нужны сценарию
+    """
+    requirements = {}
+    for account_field in ACCOUNT_FIELDS:
+        account_plan: SeedAccountsPlan = getattr(plan, account_field)
+        if not account_plan.count:
+            continue
+        requirements[account_field] = account_plan.count
+        if account_field not in CARD_ACCOUNT_FIELDS:
+            continue
+        for item_field in ITEM_FIELDS:
+            count = getattr(account_plan, item_field).count
+            if count:
+                requirements[f"{account_field}.{item_field}"] = count
+
+    return requirements
+
+
+def project_seed_user(plan: SeedUsersPlan, user: SeedUserResult) -> SeedUserResult | None:
+    """
+    Проецирует пользователя общего пула на план сценария: оставляет ровно plan.count счетов
+    каждого типа, на каждом из которых хватает карт и операций, и обрезает их списки до плана.
+    Результат соответствует плану в точности (см. SeedsBuilder.is_user_matching),
+    поэтому сценарий обращается к нему так же, как к пользователю из своего дампа.
+
+    Args:
+        plan: План генерации пользователя
+        user: Пользователь общего пула
+
+    Returns:
+        SeedUserResult | None: Проекция пользователя или None, если пользователь не подходит под план
+    """
+    projection = {"user_id": user.user_id}
+    for account_field in ACCOUNT_FIELDS:
+        account_plan: SeedAccountsPlan = getattr(plan, account_field)
+        accounts: list[SeedAccountResult] = getattr(user, account_field)
+        if account_field not in CARD_ACCOUNT_FIELDS:
+            if len(accounts) < account_plan.count:
+                return None
+            projection[account_field] = [
+                SeedAccountResult(account_id=account.account_id) for account in accounts[:account_plan.count]
+            ]
+            continue
+
+        matching = [
+            account for account in accounts
+            if all(len(getattr(account, field)) >= getattr(account_plan, field).count for field in ITEM_FIELDS)
+        ]
+        if len(matching) < account_plan.count:
+            return None
+        projection[account_field] = [
+            SeedAccountResult(
+                account_id=account.account_id,
+                **{field: getattr(account, field)[:getattr(account_plan, field).count] for field in ITEM_FIELDS}
+            )
+            for account in matching[:account_plan.count]
+        ]
+
+    return SeedUserResult(**projection)
+
+
+def merge_seed_user_results(user: SeedUserResult, update: SeedUserResult) -> SeedUserResult:
+    """
+    Объединяет две записи об одном пользователе (например, запись реестра и дозаполненного
+    сценарием пользователя): счета, карты и операции объединяются по ID без повторов.
+
+    Args:
+        user: Запись реестра
+        update: Новая запись о том же пользователе
+
+    Returns:
+        SeedUserResult: Объединённая запись
+    """
+    merged = user.model_copy(deep=True)
+    for account_field in ACCOUNT_FIELDS:
+        accounts: list[SeedAccountResult] = getattr(merged, account_field)
+        by_id = {account.account_id: account for account in accounts}
+        for account in getattr(update, account_field):
+            if account.account_id not in by_id:
+                by_id[account.account_id] = account.model_copy(deep=True)
+                accounts.append(by_id[account.account_id])
+                continue
+            target = by_id[account.account_id]
+            for item_field in ITEM_FIELDS:
+                items = getattr(target, item_field)
+                known = {item.model_dump_json() for item in items}
+                items.extend(item for item in getattr(account, item_field) if item.model_dump_json() not in known)
+
+    return merged
+
+
+class SeedsRegistry:
+    """
+    Общий пул сидов всех сценариев одного стенда, проиндексированный по возможностям пользователей
+    (см. get_user_capabilities): "есть кредитный счёт с физической картой", "на счёте ≥ 5 покупок" и т.д.
+
+    Сценарий описывает требования своим планом (SeedUsersPlan) и получает из пула подходящих
+    пользователей (см. select) — досоздать нужно только недостающих. Сценарии, которые меняют
+    пользователей под нагрузкой (выпуск карт, операции), только добавляют им возможностей,
+    поэтому выданные пользователи остаются пригодными для остальных сценариев.
+
+    Индекс хранит для каждой возможности пользователей по её значению: кандидаты под требования
+    находятся пересечением индексов, а точная проверка счетов (project_seed_user) выполняется
+    только для кандидатов.
+
+    Attributes:
+        name: Имя дампа реестра
+        users: Пользователи пула
+        positions: Позиции пользователей в users по ID
+        index: Индекс: возможность -> значение -> позиции пользователей в users
+    """
+
+    def __init__(self, name: str, users: list[SeedUserResult] | None = None):
+        self.name = name
+        self.users: list[SeedUserResult] = []
+        self.positions: dict[str, int] = {}
+        self.index: dict[str, dict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+        self.add(users or [])
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def index_user(self, position: int) -> None:
+        """Добавляет возможности пользователя на позиции position в индекс"""
+        for capability, value in get_user_capabilities(self.users[position]).items():
+            self.index[capability][value].add(position)
+
+    def unindex_user(self, position: int) -> None:
+        """Удаляет возможности пользователя на позиции position из индекса (перед обновлением записи)"""
+        for capability, value in get_user_capabilities(self.users[position]).items():
+            self.index[capability][value].discard(position)
+
+    def add(self, users: list[SeedUserResult]) -> int:
+        """
+        Добавляет пользователей в пул. Уже известные пользователи объединяются с записью
+        пула (см. merge_seed_user_results) и переиндексируются.
+
+        Args:
+            users: Созданные или дозаполненные пользователи
+
+        Returns:
+            int: Количество новых пользователей в пуле
+        """
+        added = 0
+        for user in users:
+            position = self.positions.get(user.user_id)
+            if position is None:
+                position = self.positions[user.user_id] = len(self.users)
+                self.users.append(user)
+                added += 1
+            else:
+                self.unindex_user(position)
+                self.users[position] = merge_seed_user_results(self.users[position], user)
+            self.index_user(position)
+
+        return added
+
+    def remove(
+            self,
+            user_ids: list[str],
+            account_ids: list[str] | None = None,
+            card_ids: list[str] | None = None
+    ) -> int:
+        """
+        Удаляет из пула пользователей, которых больше нет на стенде, а у оставшихся — такие же счета
+        и карты (см. SeedsValidationReport). Позиции и индекс пула перестраиваются.
+
+        Args:
+            user_ids: ID удаляемых пользователей
+            account_ids: ID удаляемых счетов
+            card_ids: ID удаляемых карт
+
+        Returns:
+            int: Количество удалённых пользователей
+        """
+        user_ids, account_ids, card_ids = set(user_ids), set(account_ids or []), set(card_ids or [])
+        users = [user for user in self.users if user.user_id not in user_ids]
+        if account_ids or card_ids:
+            users = [
+                user.model_copy(update={
+                    account_field: [
+                        account.model_copy(update={
+                            card_field: [card for card in getattr(account, card_field) if card.card_id not in card_ids]
+                            for card_field in CARD_FIELDS
+                        })
+                        for account in getattr(user, account_field) if account.account_id not in account_ids
+                    ]
+                    for account_field in ACCOUNT_FIELDS
+                })
+                for user in users
+            ]
+
+        removed = len(self.users) - len(users)
+        self.users = []
+        self.positions = {}
+        self.index = defaultdict(lambda: defaultdict(set))
+        self.add(users)
+
+        return removed
+
+    def find(self, requirements: dict[str, int]) -> list[int]:
+        """
+        Позиции пользователей, у которых каждая возможность не меньше требуемой, в порядке добавления.
+        """
+        candidates: set[int] | None = None
+        for capability, minimum in requirements.items():
+            matching = set().union(*(
+                positions for value, positions in self.index.get(capability, {}).items() if value >= minimum
+            ))
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                return []
+
+        return sorted(range(len(self.users)) if candidates is None else candidates)
+
+    def select(self, plan: SeedUsersPlan, exclude: set[str] | None = None) -> list[SeedUserResult]:
+        """
+        Выбирает из пула до plan.count пользователей, подходящих под план, в виде проекций на план.
+
+        Args:
+            plan: План генерации пользователя (count — сколько пользователей нужно)
+            exclude: ID пользователей, которых выбирать не нужно (например, уже есть в чекпоинте)
+
+        Returns:
+            list[SeedUserResult]: Подходящие пользователи, соответствующие плану в точности
+        """
+        exclude = exclude or set()
+        selected = []
+        for position in self.find(get_plan_requirements(plan)):
+            if len(selected) >= plan.count:
+                break
+            user = self.users[position]
+            if user.user_id in exclude:
+                continue
+            projection = project_seed_user(plan, user)
+            if projection is not None:
+                selected.append(projection)
+
+        return selected
+
+    @classmethod
+    def load(cls, gateway: str) -> "SeedsRegistry":
+        """
+        Загружает общий пул сидов стенда (пустой, если его ещё нет).
+
+        Args:
+            gateway: Адрес gateway, на котором созданы данные
+
+        Returns:
+            SeedsRegistry: Общий пул сидов
+        """
+        name = f"shared_{hashlib.sha256(gateway.encode('utf-8')).hexdigest()[:16]}"
+        if not seeds_result_exists(name):
+            return cls(name)
+
+        registry = cls(name, load_seeds_result(scenario=name).users)
+        logger.debug(f"Seeds registry {name} loaded: {len(registry)} users")
+        return registry
+
+    def save(self) -> None:
+        """
+        Сохраняет пул в JSON-дамп (атомарно, см. save_seeds_result).
+        При одновременном сидинге нескольких сценариев побеждает последняя запись: потерянные
+        пользователи остаются на стенде и просто будут созданы заново.
+        """
+        save_seeds_result(SeedsResult(users=self.users), scenario=self.name)
+        logger.debug(f"Seeds registry {self.name} saved: {len(self)} users")
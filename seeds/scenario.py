@@ -1,27 +1,82 @@
+import hashlib
 from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Callable, TYPE_CHECKING
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+import gevent
+from locust import events
+
+from seeds.dumps import (
+    save_seeds_result,
+    load_seeds_result,
+    load_seeds_result_lazy,
+    seeds_result_exists,
+    touch_seeds_result,
+    evict_seeds_dumps,
+    append_seed_user_result,
+    load_seed_user_results,
+    remove_seeds_checkpoint,
+    save_seeds_result_binary,
+    load_seeds_result_binary,
+    save_seeds_failures,
+    save_seeds_telemetry,
+    save_seeds_metadata,
+    find_seeds_base_dump
+)
+from seeds.store import SeedsStore
+from seeds.lazy import SeedsLazyStore
+from seeds.checkout import SeedsCheckout
+from seeds.schema.dump import SeedsDumpMetadata
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.telemetry import SeedsTelemetry
+from config import settings
+from tools.config.seeds import SeedsDumpsFormat, SeedsExhaustionPolicy
 from tools.logger import get_logger
 
+if TYPE_CHECKING:
+    from seeds.builder import SeedsBuilder
+    from seeds.validation import SeedsValidationReport
+
 # Инициализируем логгер с именем SEEDS_SCENARIO
 logger = get_logger("SEEDS_SCENARIO")
 
 
+# Регистрируем аргумент командной строки Locust: --reseed заставляет пересоздать сиды,
+# даже если для текущего плана уже есть сохранённый дамп
+@events.init_command_line_parser.add_listener
+def init_command_line_parser(parser, **kwargs):
+    parser.add_argument(
+        "--reseed",
+        action="store_true",
+        default=settings.seeds.reseed,
+        help="Rebuild seeds even if a dump for the current seeds plan already exists"
+    )
+
+
 class SeedsScenario(ABC):
     """
     Абстрактный класс для работы со сценариями сидинга.
     Этот класс инкапсулирует общую логику генерации, сохранения и загрузки данных для тестов.
+
+    Количество пользователей плана задаётся через get_pool_size: при SEEDS.AUTO_SIZE
+    оно берётся из нагрузки Locust (pool_size, см. seeds/locust.py), иначе — значение по умолчанию сценария.
     """
+    # Размер пула под нагрузку (None — значение по умолчанию из плана сценария)
+    pool_size: int | None = None
 
-    def __init__(self):
+    @cached_property
+    def builder(self) -> "SeedsBuilder":
         """
-        Инициализация класса SeedsScenario.
-        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        Билдер для генерации сидинговых данных через gRPC
+        (через gateway или напрямую через внутренние сервисы — см. SEEDS.BACKEND).
+
+        Создаётся при первом обращении: сценарий (план, имя дампа, сохранение) можно использовать
+        без gevent-клиентов gateway, например, из асинхронного сидера seeds/aio.py.
         """
-        self.builder = build_grpc_seeds_builder()
+        from seeds.services import build_seeds_builder
+
+        return build_seeds_builder()
 
     @property
     @abstractmethod
@@ -32,6 +87,14 @@ class SeedsScenario(ABC):
         """
         ...
 
+    def get_pool_size(self, default: int) -> int:
+        """
+        Количество пользователей для плана сидинга.
+        :param default: Количество пользователей сценария по умолчанию.
+        :return: pool_size, если размер пула задан под нагрузку, иначе default.
+        """
+        return default if self.pool_size is None else self.pool_size
+
     @property
     @abstractmethod
     def scenario(self) -> str:
@@ -41,40 +104,341 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def plan_hash(self) -> str:
+        """
+        Хэш плана сидинга вместе с адресом gateway, для которого строятся данные.
+        Если план или стенд меняются — меняется и хэш, а значит, и файл дампа.
+        """
+        key = f"{settings.gateway_grpc_client.client_url}|{self.plan.model_dump_json()}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def dump(self) -> str:
+        """
+        Имя дампа сидинга: имя сценария и хэш плана.
+        """
+        return f"{self.scenario}_{self.plan_hash}"
+
+    @property
+    def metadata(self) -> SeedsDumpMetadata:
+        """
+        Описание дампа: сценарий, gateway и план. Сохраняется рядом с дампом, чтобы при изменении
+        плана найти предыдущий дамп сценария и дозаполнить его вместо генерации с нуля.
+        """
+        return SeedsDumpMetadata(
+            scenario=self.scenario,
+            gateway=settings.gateway_grpc_client.client_url,
+            plan=self.plan
+        )
+
     def save(self, result: SeedsResult) -> None:
         """
-        Сохраняет результат сидинга в файл.
+        Сохраняет результат сидинга в файл в формате SEEDS.DUMPS_FORMAT.
         :param result: Объект SeedsResult, содержащий сгенерированные данные.
         """
         # Логируем начало сохранения
         logger.info(f"[{self.scenario}] Saving seeding result to file.")
-        save_seeds_result(result=result, scenario=self.scenario)
+        if settings.seeds.dumps_format == SeedsDumpsFormat.BINARY:
+            save_seeds_result_binary(result=result, scenario=self.dump)
+        else:
+            save_seeds_result(result=result, scenario=self.dump)
+        save_seeds_metadata(self.metadata, scenario=self.dump)
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def attach_checkout(
+            self,
+            result: SeedsStore | SeedsLazyStore,
+            closed: bool = True
+    ) -> SeedsStore | SeedsLazyStore:
+        """
+        Настраивает выдачу пользователей виртуальным пользователям (get_next_user)
+        согласно SEEDS.CHECKOUT_ORDER, SEEDS.CHECKOUT_POLICY и SEEDS.CHECKOUT_TIMEOUT.
+        Пока пул пополняется (closed=False), политика RAISE заменяется на BLOCK:
+        виртуальные пользователи ждут новых сидов, а не падают.
+        :param result: Хранилище сидов.
+        :param closed: Пул полный и больше не будет пополняться.
+        :return: То же хранилище с настроенной выдачей.
+        """
+        policy = settings.seeds.checkout_policy
+        if not closed and policy == SeedsExhaustionPolicy.RAISE:
+            policy = SeedsExhaustionPolicy.BLOCK
+
+        result.checkout = SeedsCheckout(
+            result.users,
+            order=settings.seeds.checkout_order,
+            policy=policy,
+            timeout=settings.seeds.checkout_timeout,
+            closed=closed
+        )
+        return result
+
+    def load(self) -> SeedsStore | SeedsLazyStore:
         """
-        Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        Загружает результаты сидинга из файла в колоночное хранилище.
+        Бинарный дамп не читается целиком, а отображается в память (mmap),
+        JSON-дамп валидируется и перекладывается в колонки — или, при SEEDS.LAZY_LOAD,
+        отображается в память с индексом смещений и валидируется по пользователю при выдаче.
+        :return: Хранилище с данными, загруженными из файла.
         """
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        if settings.seeds.dumps_format == SeedsDumpsFormat.BINARY:
+            result = load_seeds_result_binary(scenario=self.dump)
+        elif settings.seeds.lazy_load:
+            result = load_seeds_result_lazy(scenario=self.dump)
+        else:
+            result = SeedsStore.from_result(load_seeds_result(scenario=self.dump))
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
-        return result
+        return self.attach_checkout(result)
+
+    def load_result(self, dump: str | None = None) -> SeedsResult:
+        """
+        Загружает дамп сидинга целиком в SeedsResult (независимо от формата дампа).
+        :param dump: Имя дампа (по умолчанию — дамп текущего плана).
+        :return: Объект SeedsResult.
+        """
+        dump = dump or self.dump
+        if settings.seeds.dumps_format == SeedsDumpsFormat.BINARY:
+            return load_seeds_result_binary(scenario=dump).to_result()
+        return load_seeds_result(scenario=dump)
 
-    def build(self) -> None:
+    def share(self, result: SeedsResult) -> None:
+        """
+        Добавляет пользователей сценария в общий пул сидов стенда (SEEDS.SHARED_POOL),
+        чтобы другие сценарии с пересекающимися требованиями не создавали их заново.
+        :param result: Результат сидинга сценария.
+        """
+        from seeds.registry import SeedsRegistry
+
+        registry = SeedsRegistry.load(settings.gateway_grpc_client.client_url)
+        added = registry.add(result.users)
+        registry.save()
+        logger.info(f"[{self.scenario}] Shared seeds pool updated: {added} new users, {len(registry)} in total.")
+
+    def unshare(self, report: "SeedsValidationReport") -> None:
+        """
+        Удаляет из общего пула сидов стенда пользователей, счета и карты, которых больше нет на стенде,
+        чтобы они не выдавались другим сценариям (см. validate).
+        :param report: Отчёт о проверке дампа сценария.
+        """
+        from seeds.registry import SeedsRegistry
+
+        registry = SeedsRegistry.load(settings.gateway_grpc_client.client_url)
+        removed = registry.remove(report.pruned_users, report.pruned_accounts, report.pruned_cards)
+        registry.save()
+        logger.info(f"[{self.scenario}] Shared seeds pool pruned: {removed} users removed, {len(registry)} left.")
+
+    def validate(self) -> "SeedsValidationReport":
+        """
+        Проверяет сохранённый дамп на стенде и удаляет из него пользователей, счета и карты,
+        которых больше нет (например, после сброса стенда). Если пользователей осталось меньше плана,
+        недостающее досоздаётся билдером (как при дозаполнении дампа, см. SeedsBuilder.top_up).
+        Очищенный дамп пересохраняется, а удалённое убирается и из общего пула сидов (SEEDS.SHARED_POOL).
+        :return: Отчёт о удалённых сущностях.
+        """
+        from seeds.validation import build_grpc_seeds_validator
+
+        logger.info(f"[{self.scenario}] Validating seeding dump {self.dump}.")
+        result, report = build_grpc_seeds_validator().validate(self.load_result(), plan=self.plan.users)
+        logger.info(
+            f"[{self.scenario}] Seeding dump validated: {report.checked_users} users checked, "
+            f"pruned {len(report.pruned_users)} users, {len(report.pruned_accounts)} accounts, "
+            f"{len(report.pruned_cards)} cards, {len(report.unchecked_users)} users left unchecked."
+        )
+        if report.pruned:
+            logger.debug(f"[{self.scenario}] Pruned seeds: {report.model_dump_json(indent=2)}")
+            if len(result.users) < self.plan.users.count:
+                # Пустой или неполный дамп оставил бы виртуальных пользователей без сидов
+                logger.info(
+                    f"[{self.scenario}] Topping up validated seeding dump: "
+                    f"{len(result.users)}/{self.plan.users.count} users left."
+                )
+                result = self.builder.build(self.plan, existing=result)
+            self.save(result)
+            if settings.seeds.shared_pool:
+                self.unshare(report)
+
+        return report
+
+    def load_partition(self, data: str, closed: bool = True) -> SeedsStore | SeedsLazyStore:
+        """
+        Загружает часть пула сидов, присланную мастером Locust воркеру.
+        :param data: JSON-дамп SeedsResult с пользователями воркера.
+        :param closed: Пул полный (False — мастер ещё будет присылать сиды при потоковом сидинге).
+        :return: Хранилище с пользователями воркера (ленивое при SEEDS.LAZY_LOAD, если пул полный).
+        """
+        if settings.seeds.lazy_load and closed:
+            result = SeedsLazyStore.from_json(data)
+        else:
+            result = SeedsStore.from_result(SeedsResult.model_validate_json(data))
+        logger.info(f"[{self.scenario}] Seeding partition received: {len(result)} users.")
+        return self.attach_checkout(result, closed=closed)
+
+    def stream(self, reseed: bool | None = None) -> SeedsStore:
+        """
+        Потоковый сидинг: генерация идёт в фоновом greenlet'е, а пользователи попадают в пул
+        сразу после создания, поэтому нагрузка может стартовать, не дожидаясь конца сидинга.
+        Пока пул пополняется, get_next_user ждёт новых сидов; по завершении генерации пул закрывается.
+        Если дамп для плана уже есть, он просто загружается.
+        :param reseed: Пересоздать данные, даже если дамп существует (по умолчанию — SEEDS.RESEED).
+        :return: Пополняемое хранилище сидов.
+        """
+        reseed = settings.seeds.reseed if reseed is None else reseed
+        if not reseed and seeds_result_exists(self.dump, settings.seeds.dumps_format):
+            self.build(reseed=reseed)
+            return self.load()
+
+        store = self.attach_checkout(SeedsStore.empty(), closed=False)
+
+        def on_user(user: SeedUserResult) -> None:
+            store.append(user)
+            store.checkout.notify()
+
+        def on_done(greenlet: gevent.Greenlet) -> None:
+            if greenlet.exception is not None:
+                logger.error(f"[{self.scenario}] Streaming seeding failed: {greenlet.exception!r}")
+            logger.info(f"[{self.scenario}] Streaming seeding finished: {len(store)} users in the pool.")
+            store.checkout.close()
+
+        logger.info(f"[{self.scenario}] Streaming seeding started, load can start before it completes.")
+        gevent.spawn(self.build, reseed=reseed, on_user=on_user).link(on_done)
+
+        return store
+
+    def build(
+            self,
+            reseed: bool | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Если SEEDS.PROCESSES > 1, пользователи делятся между процессами (см. seeds/shards.py).
+
+        Если дамп для текущего хэша плана уже существует, генерация пропускается. Если есть дамп
+        этого сценария для другого плана (например, с меньшим count), создаётся только недостающее.
+        При SEEDS.SHARED_POOL подходящие под план пользователи берутся из общего пула сидов стенда
+        (см. seeds/registry.py), а созданные пользователи добавляются в него.
+        Каждый созданный пользователь сразу дописывается в JSONL-чекпоинт, поэтому прерванная
+        генерация при следующем запуске продолжается с количества уже сохранённых пользователей.
+        Во время генерации в лог пишется прогресс с ETA, а по завершении — сводка латентностей
+        методов gateway, которая также сохраняется рядом с дампом.
+        :param reseed: Пересоздать данные, даже если дамп существует (по умолчанию — SEEDS.RESEED).
+        :param on_user: Функция, вызываемая для каждого готового пользователя пула при генерации
+            (см. stream). Уже готовые пользователи из чекпоинта и предыдущего дампа передаются сразу.
         """
+        reseed = settings.seeds.reseed if reseed is None else reseed
+        if not reseed and seeds_result_exists(self.dump, settings.seeds.dumps_format):
+            # Отмечаем дамп как недавно использованный, чтобы он не был вытеснен первым
+            touch_seeds_result(self.dump, settings.seeds.dumps_format)
+            logger.info(f"[{self.scenario}] Seeding dump {self.dump} already exists, skipping generation.")
+            # Переиспользуемый дамп мог устареть — проверяем его до старта нагрузки
+            if settings.seeds.validate_dumps:
+                self.validate()
+            # Пользователи дампа, созданного до включения общего пула, тоже становятся доступны другим сценариям
+            if settings.seeds.shared_pool:
+                self.share(self.load_result())
+            return
+        if reseed:
+            remove_seeds_checkpoint(self.dump)
+
+        # Пользователи, созданные в прошлый (прерванный) запуск
+        existing = SeedsResult(users=load_seed_user_results(self.dump))
+        if existing.users:
+            logger.info(f"[{self.scenario}] Resuming seeding from checkpoint with {len(existing.users)} users.")
+
+        # Общий пул сидов стенда: подходящие под план пользователи уже готовы и ничего не стоят
+        if settings.seeds.shared_pool and not reseed:
+            from seeds.registry import SeedsRegistry
+
+            registry = SeedsRegistry.load(settings.gateway_grpc_client.client_url)
+            shortfall = self.plan.users.model_copy(update={"count": max(self.plan.users.count - len(existing.users), 0)})
+            shared_users = registry.select(shortfall, exclude={user.user_id for user in existing.users})
+            existing = SeedsResult(users=existing.users + shared_users)
+            logger.info(
+                f"[{self.scenario}] Taking {len(shared_users)} users from the shared seeds pool of {len(registry)} users."
+            )
+
+        # Дамп этого же сценария для другого плана: переиспользуем его пользователей и досоздаём недостающее
+        base = None if reseed else find_seeds_base_dump(self.metadata, self.dump, settings.seeds.dumps_format)
+        if base:
+            checkpointed = {user.user_id for user in existing.users}
+            base_users = [user for user in self.load_result(base).users if user.user_id not in checkpointed]
+            existing = SeedsResult(users=existing.users + base_users)
+            logger.info(f"[{self.scenario}] Topping up seeding dump {base} with {len(base_users)} users to the new plan.")
+
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
-        # Логируем завершение генерации
-        logger.info(f"[{self.scenario}] Seeding data generation completed.")
+        def on_ready(user: SeedUserResult) -> None:
+            append_seed_user_result(user, scenario=self.dump)
+            if on_user:
+                on_user(user)
+
+        # Пользователи, которые уже соответствуют плану, готовы сразу
+        if on_user:
+            for user in existing.users[:self.plan.users.count]:
+                if self.builder.is_user_matching(self.plan.users, user):
+                    on_user(user)
+
+        telemetry = SeedsTelemetry(
+            total_users=max(self.plan.users.count - len(existing.users), 0),
+            report_interval=settings.seeds.telemetry_interval,
+            name=self.scenario
+        )
+        # Запускаем генерацию (в нескольких процессах, если это разрешено настройками)
+        if settings.seeds.processes > 1:
+            from seeds.services import build_seeds_builder
+            from seeds.shards import build_sharded_seeds_result
+
+            # Дозаполнение уже созданных пользователей — в текущем процессе, новые пользователи — в шардах
+            existing = self.builder.top_up(self.plan, existing, on_user=on_ready)
+            result = build_sharded_seeds_result(
+                self.plan,
+                processes=settings.seeds.processes,
+                builder_factory=build_seeds_builder,
+                existing=existing,
+                checkpoint=self.dump,
+                telemetry=telemetry,
+                allowed_failures=self.builder.get_allowed_failures(self.plan)
+            )
+            # Пользователи из шардов становятся доступны только после завершения всех процессов
+            if on_user:
+                for user in result.users[len(existing.users):]:
+                    on_user(user)
+            # Прогресс пишет каждый шард, здесь телеметрия шардов только объединяется
+            telemetry.stop()
+        else:
+            self.builder.telemetry = telemetry
+            telemetry.start()
+            try:
+                result = self.builder.build(self.plan, existing=existing, on_user=on_ready)
+            finally:
+                telemetry.stop()
+                self.builder.telemetry = None
+        # Логируем завершение генерации и сводку телеметрии
+        summary = telemetry.summary()
+        logger.info(f"[{self.scenario}] Seeding data generation completed.\n{summary.to_table()}")
+        save_seeds_telemetry(summary, scenario=self.dump)
+        # Повторы и исключённые пользователи — в отдельный отчёт, в дамп они не попадают
+        failures = result.failures
+        if failures.retries or failures.failed_users:
+            save_seeds_failures(failures, scenario=self.dump)
+        if failures.failed_users:
+            logger.warning(
+                f"[{self.scenario}] {len(failures.failed_users)} users failed and were dropped "
+                f"({len(result.users)}/{self.plan.users.count} built, {failures.retries} retries)"
+            )
         # Сохраняем результат
-        self.save(result)
\ No newline at end of file
+        self.save(result)
+        # Полный результат сохранён — чекпоинт больше не нужен
+        remove_seeds_checkpoint(self.dump)
+        if settings.seeds.shared_pool:
+            self.share(result)
+
+        # Удаляем старые дампы, если превышен бюджет на диске
+        if settings.seeds.dumps_max_bytes is not None:
+            evict_seeds_dumps(max_bytes=settings.seeds.dumps_max_bytes, keep=self.dump)
\ No newline at end of file
@@ -16,7 +16,7 @@ class ExistingUserGetDocumentsSeedsScenario(SeedsScenario):
         """
         return SeedsPlan(
             users=SeedUsersPlan(
-                count=100,  # Создаём 100 пользователей
+                count=self.get_pool_size(100),  # Создаём 100 пользователей (или по нагрузке, см. SEEDS.AUTO_SIZE)
                 savings_accounts=SeedAccountsPlan(count=1),  # Сберегательный счёт на пользователя
                 debit_card_accounts=SeedAccountsPlan(count=1)  # Дебетовый счёт на пользователя
             ),
@@ -23,7 +23,7 @@ class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
         """
         return SeedsPlan(
             users=SeedUsersPlan(
-                count=300,
+                count=self.get_pool_size(300),
                 credit_card_accounts=SeedAccountsPlan(
                     count=1,
                     purchase_operations = SeedOperationsPlan(count=5),
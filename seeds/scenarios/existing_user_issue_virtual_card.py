@@ -16,7 +16,7 @@ class ExistingUserIssueVirtualCardSeedsScenario(SeedsScenario):
         """
         return SeedsPlan(
             users=SeedUsersPlan(
-                count=300,
+                count=self.get_pool_size(300),
                 debit_card_accounts=SeedAccountsPlan(count=1) 
             )
         )
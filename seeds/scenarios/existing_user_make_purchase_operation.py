@@ -17,7 +17,7 @@ class ExistingUserMakePurchaseOperationSeedsScenario(SeedsScenario):
         """
         return SeedsPlan(
             users=SeedUsersPlan(
-                count=300,  # Количество пользователей
+                count=self.get_pool_size(300),  # Количество пользователей (или по нагрузке, см. SEEDS.AUTO_SIZE)
                 credit_card_accounts=SeedAccountsPlan(
                     count=1,  # Количество счётов на пользователя
                     physical_cards=SeedCardsPlan(count=1)  # Количество физических карт
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+from seeds.schema.plan import SeedsPlan
+
+
+class SeedsDumpMetadata(BaseModel):
+    """
+    Описание дампа сидинга, сохраняемое рядом с ним.
+
+    Attributes:
+        scenario (str): Имя сценария сидинга.
+        gateway (str): Адрес gateway, на котором созданы данные.
+        plan (SeedsPlan): План, по которому построен дамп.
+    """
+    scenario: str
+    gateway: str
+    plan: SeedsPlan
@@ -1,6 +1,8 @@
 import random
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from seeds.checkout import SeedsCheckout
 
 
 class SeedCardResult(BaseModel):
@@ -62,19 +64,66 @@ class SeedUserResult(BaseModel):
     credit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
 
 
+class SeedFailureResult(BaseModel):
+    """
+    Пользователь, исключённый из результата сидинга из-за ошибки.
+
+    Attributes:
+        user_id (str | None): ID пользователя, если он успел создаться (его сущности остаются на стенде).
+        method (str): Метод gateway, на котором закончились повторы.
+        error (str): Текст последней ошибки.
+    """
+    user_id: str | None = None
+    method: str
+    error: str
+
+
+class SeedsFailuresReport(BaseModel):
+    """
+    Отчёт об ошибках сидинга.
+
+    Attributes:
+        retries (int): Количество повторённых запросов (в том числе успешно после повтора).
+        failed_users (list[SeedFailureResult]): Пользователи, исключённые из результата.
+    """
+    retries: int = 0
+    failed_users: list[SeedFailureResult] = Field(default_factory=list)
+
+    def merge(self, report: "SeedsFailuresReport") -> None:
+        self.retries += report.retries
+        self.failed_users.extend(report.failed_users)
+
+
 class SeedsResult(BaseModel):
     """
     Главная модель результата сидинга — агрегирует всех созданных пользователей.
 
     Attributes:
         users (list[SeedUserResult]): Список сгенерированных пользователей.
+        failures (SeedsFailuresReport): Отчёт об ошибках сидинга (в дамп не сохраняется).
     """
 
     users: list[SeedUserResult] = Field(default_factory=list)
+    failures: SeedsFailuresReport = Field(default_factory=SeedsFailuresReport, exclude=True)
+
+    _checkout: SeedsCheckout[SeedUserResult] | None = PrivateAttr(default=None)
+
+    @property
+    def checkout(self) -> SeedsCheckout[SeedUserResult]:
+        """
+        Выдача пользователей (по умолчанию — по порядку, с ошибкой при исчерпании).
+        """
+        if self._checkout is None:
+            self._checkout = SeedsCheckout(self.users)
+        return self._checkout
+
+    @checkout.setter
+    def checkout(self, checkout: SeedsCheckout[SeedUserResult]) -> None:
+        self._checkout = checkout
 
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего пользователя согласно выдаче checkout (за O(1), без удаления из списка).
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
@@ -82,7 +131,7 @@ class SeedsResult(BaseModel):
         Returns:
             SeedUserResult: Следующий пользователь из списка.
         """
-        return self.users.pop(0)
+        return self.checkout.checkout()
 
     def get_random_user(self) -> SeedUserResult:
         """
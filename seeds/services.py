@@ -0,0 +1,172 @@
+from clients.grpc.services.accounts.client import build_accounts_service_grpc_client, AccountsServiceGRPCClient
+from clients.grpc.services.cards.client import build_cards_service_grpc_client, CardsServiceGRPCClient
+from clients.grpc.services.operations.client import (
+    build_operations_service_grpc_client,
+    OperationsServiceGRPCClient
+)
+from clients.grpc.services.users.client import build_users_service_grpc_client
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardResponse
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountResponse
+from contracts.services.operations.operation_pb2 import OperationType
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationResponse
+from seeds.builder import SeedsBuilder, build_grpc_seeds_builder
+from config import settings
+from tools.config.seeds import SeedsBackend
+
+
+# Адаптеры ниже повторяют имена методов клиентов gateway: по ним SeedsBuilder их вызывает,
+# а телеметрия и планировщик (seeds/planner.py) ведут учёт запросов.
+
+class AccountsServiceSeedsClient:
+    """
+    Адаптер AccountsService и CardsService под интерфейс клиента счетов gateway.
+
+    Как и gateway, при открытии карточного счёта выпускает к нему виртуальную карту
+    и возвращает счёт в формате gateway (AccountView вместе с картами).
+
+    Attributes:
+        accounts_service_client: Клиент AccountsService
+        cards_service_client: Клиент CardsService
+    """
+
+    def __init__(self, accounts_service_client: AccountsServiceGRPCClient, cards_service_client: CardsServiceGRPCClient):
+        self.accounts_service_client = accounts_service_client
+        self.cards_service_client = cards_service_client
+
+    def open_account(self, user_id: str, account_type: AccountType.ValueType, with_card: bool = False) -> AccountView:
+        """
+        Открывает счёт и, если нужно, выпускает к нему виртуальную карту.
+        """
+        account = self.accounts_service_client.create_account(user_id=user_id, account_type=account_type).account
+        view = AccountView(id=account.id, type=account.type, status=account.status, balance=account.balance)
+        if with_card:
+            response = self.cards_service_client.create_card(account_id=account.id, card_type=CardType.CARD_TYPE_VIRTUAL)
+            view.cards.append(response.card)
+
+        return view
+
+    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        return OpenSavingsAccountResponse(account=self.open_account(user_id, AccountType.ACCOUNT_TYPE_SAVINGS))
+
+    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        return OpenDepositAccountResponse(account=self.open_account(user_id, AccountType.ACCOUNT_TYPE_DEPOSIT))
+
+    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        return OpenDebitCardAccountResponse(
+            account=self.open_account(user_id, AccountType.ACCOUNT_TYPE_DEBIT_CARD, with_card=True)
+        )
+
+    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        return OpenCreditCardAccountResponse(
+            account=self.open_account(user_id, AccountType.ACCOUNT_TYPE_CREDIT_CARD, with_card=True)
+        )
+
+    def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        """
+        Счета пользователя вместе с картами — как GetAccounts у gateway.
+        """
+        response = GetAccountsResponse()
+        for account in self.accounts_service_client.get_accounts(user_id=user_id).accounts:
+            view = response.accounts.add(id=account.id, type=account.type, status=account.status, balance=account.balance)
+            view.cards.extend(self.cards_service_client.get_cards(account_id=account.id).cards)
+
+        return response
+
+
+class CardsServiceSeedsClient:
+    """
+    Адаптер CardsService под интерфейс клиента карт gateway.
+
+    Attributes:
+        cards_service_client: Клиент CardsService
+    """
+
+    def __init__(self, cards_service_client: CardsServiceGRPCClient):
+        self.cards_service_client = cards_service_client
+
+    def issue_virtual_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        return self.cards_service_client.create_card(account_id=account_id, card_type=CardType.CARD_TYPE_VIRTUAL)
+
+    def issue_physical_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        return self.cards_service_client.create_card(account_id=account_id, card_type=CardType.CARD_TYPE_PHYSICAL)
+
+
+class OperationsServiceSeedsClient:
+    """
+    Адаптер OperationsService под интерфейс клиента операций gateway.
+
+    Attributes:
+        operations_service_client: Клиент OperationsService
+    """
+
+    def __init__(self, operations_service_client: OperationsServiceGRPCClient):
+        self.operations_service_client = operations_service_client
+
+    def make_top_up_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_service_client.create_operation(
+            card_id=card_id, account_id=account_id, operation_type=OperationType.OPERATION_TYPE_TOP_UP
+        )
+
+    def make_purchase_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_service_client.create_operation(
+            card_id=card_id, account_id=account_id, operation_type=OperationType.OPERATION_TYPE_PURCHASE
+        )
+
+    def make_transfer_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_service_client.create_operation(
+            card_id=card_id, account_id=account_id, operation_type=OperationType.OPERATION_TYPE_TRANSFER
+        )
+
+    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_service_client.create_operation(
+            card_id=card_id, account_id=account_id, operation_type=OperationType.OPERATION_TYPE_CASH_WITHDRAWAL
+        )
+
+
+def build_services_seeds_builder() -> SeedsBuilder:
+    """
+    Фабрика для создания сидера, который пишет напрямую во внутренние сервисы в обход gateway.
+
+    Каждая сущность стоит один вызов сервиса вместо запроса к gateway с его fan-out,
+    поэтому большие исторические наборы данных строятся на порядок быстрее.
+    Результат (SeedsResult) такой же, как у gateway-сидера. Побочные эффекты gateway
+    при этом не выполняются: например, операции не меняют баланс счёта.
+
+    Returns:
+        SeedsBuilder: Инициализированный сидер с клиентами внутренних сервисов
+    """
+    cards_service_client = build_cards_service_grpc_client()
+
+    return SeedsBuilder(
+        users_gateway_client=build_users_service_grpc_client(),
+        cards_gateway_client=CardsServiceSeedsClient(cards_service_client),
+        accounts_gateway_client=AccountsServiceSeedsClient(build_accounts_service_grpc_client(), cards_service_client),
+        operations_gateway_client=OperationsServiceSeedsClient(build_operations_service_grpc_client()),
+        users_concurrency=settings.seeds.users_concurrency,
+        entities_concurrency=settings.seeds.entities_concurrency,
+        adaptive_concurrency=settings.seeds.adaptive_concurrency,
+        min_entities_concurrency=settings.seeds.min_entities_concurrency,
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff,
+        failure_budget=settings.seeds.failure_budget
+    )
+
+
+def build_seeds_builder() -> SeedsBuilder:
+    """
+    Фабрика сидера по настройке SEEDS.BACKEND: через gateway (по умолчанию) или через внутренние сервисы.
+
+    Returns:
+        SeedsBuilder: Инициализированный сидер
+    """
+    if settings.seeds.backend == SeedsBackend.SERVICES:
+        return build_services_seeds_builder()
+
+    return build_grpc_seeds_builder()
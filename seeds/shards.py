@@ -0,0 +1,184 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from typing import Callable
+
+from seeds.builder import SeedsBuilder, build_grpc_seeds_builder
+from seeds.dumps import append_seed_user_result
+from seeds.schema.plan import SeedsPlan
+from seeds.schema.result import SeedsResult, SeedsFailuresReport
+from seeds.lazy import SeedsLazyStore
+from seeds.store import SeedsStore
+from seeds.telemetry import SeedsTelemetry
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_SHARDS")
+
+
+def split_count(count: int, parts: int) -> list[int]:
+    """
+    Делит количество на parts частей, отличающихся не более чем на единицу.
+
+    Args:
+        count: Общее количество (например, пользователей)
+        parts: Количество частей (шардов)
+
+    Returns:
+        list[int]: Размер каждой части, сумма равна count
+    """
+    base, rest = divmod(count, parts)
+    return [base + (1 if index < rest else 0) for index in range(parts)]
+
+
+def get_seeds_pool_size(users: int, sharing_factor: float = 1.0, workers: int = 1) -> int:
+    """
+    Размер пула сидов под нагрузку: каждому воркеру Locust — по сиду на sharing_factor
+    его виртуальных пользователей. Виртуальные пользователи и пул делятся между воркерами
+    одинаково (см. split_count и partition_seeds_result), поэтому часть пула каждого воркера
+    покрывает его виртуальных пользователей, а лишних сидов не создаётся.
+
+    Args:
+        users: Количество виртуальных пользователей Locust (users в .conf)
+        sharing_factor: Сколько виртуальных пользователей делят одного сида
+        workers: Количество воркеров Locust
+
+    Returns:
+        int: Количество пользователей в плане сидинга
+    """
+    return sum(math.ceil(count / sharing_factor) for count in split_count(users, workers))
+
+
+def partition_seeds_result(result: SeedsResult | SeedsStore | SeedsLazyStore, parts: int) -> list[SeedsResult]:
+    """
+    Делит пул сидов на parts непересекающихся частей подряд идущих пользователей.
+
+    Args:
+        result: Пул сидов
+        parts: Количество частей (например, воркеров Locust)
+
+    Returns:
+        list[SeedsResult]: Части пула
+    """
+    partitions, start = [], 0
+    for count in split_count(len(result.users), parts):
+        users = result.users[start:start + count]
+        partitions.append(SeedsResult(users=[
+            user.to_result() if isinstance(result, SeedsStore) else user for user in users
+        ]))
+        start += count
+
+    return partitions
+
+
+def build_shard_plan(plan: SeedsPlan, count: int) -> SeedsPlan:
+    """
+    Возвращает копию плана с другим количеством пользователей.
+
+    Args:
+        plan: Исходный план сидинга
+        count: Количество пользователей в шарде
+
+    Returns:
+        SeedsPlan: План шарда
+    """
+    return plan.model_copy(update={"users": plan.users.model_copy(update={"count": count})})
+
+
+def build_seeds_shard(
+        plan: SeedsPlan,
+        builder_factory: Callable[[], SeedsBuilder],
+        checkpoint: str | None = None,
+        allowed_failures: int | None = None
+) -> tuple[str, SeedsTelemetry, SeedsFailuresReport]:
+    """
+    Строит один шард в отдельном процессе. Билдер (и его каналы) создаётся внутри процесса.
+    Каждый шард пишет в лог свою строку прогресса и возвращает телеметрию и отчёт об ошибках для общей сводки.
+
+    Args:
+        plan: План шарда
+        builder_factory: Фабрика сидера (например, build_grpc_seeds_builder)
+        checkpoint: Имя чекпоинта, в который дописывается каждый созданный пользователь
+        allowed_failures: Доля шарда в общем бюджете исключённых пользователей
+
+    Returns:
+        tuple[str, SeedsTelemetry, SeedsFailuresReport]: JSON-дамп SeedsResult шарда, его телеметрия и ошибки
+    """
+    on_user = partial(append_seed_user_result, scenario=checkpoint) if checkpoint else None
+    builder = builder_factory()
+    builder.telemetry = SeedsTelemetry(
+        total_users=plan.users.count,
+        report_interval=settings.seeds.telemetry_interval,
+        name=f"shard of {plan.users.count} users"
+    )
+    builder.telemetry.start()
+    try:
+        result = builder.build(plan, on_user=on_user, allowed_failures=allowed_failures)
+    finally:
+        builder.telemetry.stop()
+
+    return result.model_dump_json(), builder.telemetry, result.failures
+
+
+def build_sharded_seeds_result(
+        plan: SeedsPlan,
+        processes: int,
+        builder_factory: Callable[[], SeedsBuilder] = build_grpc_seeds_builder,
+        existing: SeedsResult | None = None,
+        checkpoint: str | None = None,
+        telemetry: SeedsTelemetry | None = None,
+        allowed_failures: int | None = None
+) -> SeedsResult:
+    """
+    Строит сиды в нескольких процессах: plan.users.count делится между processes воркерами,
+    каждый воркер создаёт свой сидер через builder_factory, а частичные результаты
+    объединяются в один SeedsResult в порядке шардов.
+
+    Процессы запускаются через spawn, так как gRPC-каналы и gevent не переживают fork.
+
+    Бюджет исключённых пользователей общий на весь план: то, что осталось от него после дозаполнения
+    existing, делится между шардами так же, как пользователи (split_count). Иначе каждый шард
+    считал бы бюджет от своей части плана с округлением вниз и падал бы раньше, чем позволяет общий бюджет.
+
+    Args:
+        plan: Полный план сидинга
+        processes: Количество процессов
+        builder_factory: Фабрика сидера, доступная на уровне модуля (должна сериализоваться pickle)
+        existing: Уже созданные пользователи — между процессами делятся только недостающие
+        checkpoint: Имя чекпоинта, общего для всех процессов
+        telemetry: Телеметрия, в которую объединяется телеметрия всех шардов
+        allowed_failures: Сколько пользователей плана можно исключить (по умолчанию — SEEDS.FAILURE_BUDGET от плана)
+
+    Returns:
+        SeedsResult: Объединённый результат всех шардов (с объединённым отчётом об ошибках)
+    """
+    users = list(existing.users) if existing else []
+    failures = existing.failures.model_copy(deep=True) if existing else SeedsFailuresReport()
+    remaining = max(plan.users.count - len(users), 0)
+    counts = [count for count in split_count(remaining, processes) if count > 0]
+    if not counts:
+        return SeedsResult(users=users, failures=failures)
+
+    if allowed_failures is None:
+        allowed_failures = math.floor(plan.users.count * settings.seeds.failure_budget)
+    shard_allowed_failures = split_count(max(allowed_failures - len(failures.failed_users), 0), len(counts))
+
+    logger.info(f"Building {remaining} users in {len(counts)} processes: {counts}")
+
+    with ProcessPoolExecutor(max_workers=len(counts), mp_context=get_context("spawn")) as executor:
+        shards = list(executor.map(
+            build_seeds_shard,
+            [build_shard_plan(plan, count) for count in counts],
+            [builder_factory] * len(counts),
+            [checkpoint] * len(counts),
+            shard_allowed_failures
+        ))
+
+    for dump, shard_telemetry, shard_failures in shards:
+        users.extend(SeedsResult.model_validate_json(dump).users)
+        failures.merge(shard_failures)
+        if telemetry is not None:
+            telemetry.merge(shard_telemetry.samples, shard_telemetry.errors, shard_telemetry.users)
+
+    return SeedsResult(users=users, failures=failures)
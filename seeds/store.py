@@ -0,0 +1,300 @@
+import random
+from array import array
+from collections.abc import Iterable, Sequence
+
+from seeds.checkout import SeedsCheckout
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+
+# Типы счетов пользователя и вложенных сущностей счёта — в порядке хранения в колонках
+ACCOUNT_FIELDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+ITEM_FIELDS = ("physical_cards", "top_up_operations", "purchase_operations", "virtual_cards",
+               "transfer_operations", "cash_withdrawal_operations")
+CARD_FIELDS = ("physical_cards", "virtual_cards")
+
+# Колонки хранилища:
+#   string_offsets: uint64[S + 1]     — границы ID в строковой таблице strings
+#   strings:        bytes             — все ID подряд в UTF-8
+#   user_ids:       uint32[U]         — индекс ID пользователя в строковой таблице
+#   user_accounts:  uint32[U * 4 + 1] — границы счетов пользователя по типам ACCOUNT_FIELDS в account_ids
+#   account_ids:    uint32[A]         — индекс ID счёта в строковой таблице
+#   account_items:  uint32[A * 6 + 1] — границы карт/операций счёта по типам ITEM_FIELDS в item_ids
+#   item_ids:       uint32[I]         — индекс ID карты или операции в строковой таблице
+COLUMNS = ("string_offsets", "strings", "user_ids", "user_accounts", "account_ids", "account_items", "item_ids")
+COLUMN_TYPES = {
+    "string_offsets": "Q",
+    "user_ids": "I",
+    "user_accounts": "I",
+    "account_ids": "I",
+    "account_items": "I",
+    "item_ids": "I"
+}
+
+
+class SeedCardView:
+    """
+    Карта из колоночного хранилища. Совместима по атрибутам с SeedCardResult.
+    """
+    __slots__ = ("card_id",)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+
+class SeedOperationView:
+    """
+    Операция из колоночного хранилища. Совместима по атрибутам с SeedOperationResult.
+    """
+    __slots__ = ("operation_id",)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+class SeedAccountView:
+    """
+    Счёт из колоночного хранилища. Совместим по атрибутам с SeedAccountResult:
+    ID и вложенные карты/операции читаются из колонок при обращении.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "SeedsStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def account_id(self) -> str:
+        return self.store.get_string(self.store.columns["account_ids"][self.index])
+
+    def get_item_ids(self, item_field: str) -> list[str]:
+        """
+        Возвращает ID карт или операций счёта указанного типа (поле из ITEM_FIELDS).
+        """
+        account_items = self.store.columns["account_items"]
+        item_ids = self.store.columns["item_ids"]
+        slot = self.index * len(ITEM_FIELDS) + ITEM_FIELDS.index(item_field)
+        return [self.store.get_string(item_ids[item]) for item in range(account_items[slot], account_items[slot + 1])]
+
+    @property
+    def physical_cards(self) -> list[SeedCardView]:
+        return [SeedCardView(card_id) for card_id in self.get_item_ids("physical_cards")]
+
+    @property
+    def virtual_cards(self) -> list[SeedCardView]:
+        return [SeedCardView(card_id) for card_id in self.get_item_ids("virtual_cards")]
+
+    @property
+    def top_up_operations(self) -> list[SeedOperationView]:
+        return [SeedOperationView(operation_id) for operation_id in self.get_item_ids("top_up_operations")]
+
+    @property
+    def purchase_operations(self) -> list[SeedOperationView]:
+        return [SeedOperationView(operation_id) for operation_id in self.get_item_ids("purchase_operations")]
+
+    @property
+    def transfer_operations(self) -> list[SeedOperationView]:
+        return [SeedOperationView(operation_id) for operation_id in self.get_item_ids("transfer_operations")]
+
+    @property
+    def cash_withdrawal_operations(self) -> list[SeedOperationView]:
+        return [SeedOperationView(operation_id) for operation_id in self.get_item_ids("cash_withdrawal_operations")]
+
+    def to_result(self) -> SeedAccountResult:
+        """
+        Преобразует счёт в pydantic-модель SeedAccountResult.
+        """
+        account = {"account_id": self.account_id}
+        for item_field in ITEM_FIELDS:
+            if item_field in CARD_FIELDS:
+                account[item_field] = [SeedCardResult(card_id=item) for item in self.get_item_ids(item_field)]
+            else:
+                account[item_field] = [SeedOperationResult(operation_id=item) for item in self.get_item_ids(item_field)]
+
+        return SeedAccountResult(**account)
+
+
+class SeedUserView:
+    """
+    Пользователь из колоночного хранилища. Совместим по атрибутам с SeedUserResult
+    (общий протокол — SeedUser, seeds/user.py), например:
+    seed_user.credit_card_accounts[0].physical_cards[0].card_id
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "SeedsStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def user_id(self) -> str:
+        return self.store.get_string(self.store.columns["user_ids"][self.index])
+
+    def get_accounts(self, account_field: str) -> list[SeedAccountView]:
+        """
+        Возвращает счета пользователя указанного типа (поле из ACCOUNT_FIELDS).
+        """
+        user_accounts = self.store.columns["user_accounts"]
+        slot = self.index * len(ACCOUNT_FIELDS) + ACCOUNT_FIELDS.index(account_field)
+        return [SeedAccountView(self.store, account) for account in range(user_accounts[slot], user_accounts[slot + 1])]
+
+    @property
+    def deposit_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts("deposit_accounts")
+
+    @property
+    def savings_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts("savings_accounts")
+
+    @property
+    def debit_card_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts("debit_card_accounts")
+
+    @property
+    def credit_card_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts("credit_card_accounts")
+
+    def to_result(self) -> SeedUserResult:
+        """
+        Преобразует пользователя в pydantic-модель SeedUserResult.
+        """
+        user = {"user_id": self.user_id}
+        for account_field in ACCOUNT_FIELDS:
+            user[account_field] = [account.to_result() for account in self.get_accounts(account_field)]
+
+        return SeedUserResult(**user)
+
+
+class SeedsStoreUsers(Sequence):
+    """
+    Последовательность пользователей хранилища. Элементы — лёгкие SeedUserView.
+    """
+
+    def __init__(self, store: "SeedsStore"):
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [SeedUserView(self.store, position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seed user index out of range")
+        return SeedUserView(self.store, index)
+
+
+class SeedsStore:
+    """
+    Колоночное хранилище результата сидинга.
+
+    Вместо дерева pydantic-моделей хранит плоские массивы индексов ID и смещений связей
+    пользователь → счета → карты/операции (см. COLUMNS). Колонки могут быть array.array
+    (построены в памяти) или memoryview поверх mmap (открыты из бинарного дампа, см. seeds/binary.py).
+    Пользователи выдаются как SeedUserView с тем же набором атрибутов, что у SeedUserResult.
+
+    Attributes:
+        columns: Колонки хранилища (ключи — COLUMNS)
+        checkout: Выдача пользователей для get_next_user
+    """
+
+    def __init__(self, columns: dict[str, Sequence[int] | bytes]):
+        """
+        :param columns: Колонки хранилища (ключи — COLUMNS).
+        """
+        self.columns = columns
+        self.checkout: SeedsCheckout[SeedUserView] = SeedsCheckout(self.users)
+
+    @classmethod
+    def empty(cls) -> "SeedsStore":
+        """
+        Создаёт пустое хранилище, которое можно пополнять через append (например, при потоковом сидинге).
+        """
+        columns = {name: array(typecode) for name, typecode in COLUMN_TYPES.items()}
+        columns["string_offsets"].append(0)
+        columns["user_accounts"].append(0)
+        columns["account_items"].append(0)
+        columns["strings"] = bytearray()
+
+        return cls(columns)
+
+    @classmethod
+    def from_result(cls, result: SeedsResult) -> "SeedsStore":
+        """
+        Строит хранилище из SeedsResult.
+        """
+        store = cls.empty()
+        store.extend(result.users)
+
+        return store
+
+    def add_string(self, value: str) -> int:
+        strings = self.columns["strings"]
+        strings.extend(value.encode("utf-8"))
+        self.columns["string_offsets"].append(len(strings))
+        return len(self.columns["string_offsets"]) - 2
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Добавляет пользователя в конец хранилища. Доступно только для хранилища в памяти
+        (empty или from_result), а не для открытого из бинарного дампа.
+        """
+        columns = self.columns
+        columns["user_ids"].append(self.add_string(user.user_id))
+        for account_field in ACCOUNT_FIELDS:
+            for account in getattr(user, account_field):
+                columns["account_ids"].append(self.add_string(account.account_id))
+                for item_field in ITEM_FIELDS:
+                    for item in getattr(account, item_field):
+                        item_id = item.card_id if item_field in CARD_FIELDS else item.operation_id
+                        columns["item_ids"].append(self.add_string(item_id))
+                    columns["account_items"].append(len(columns["item_ids"]))
+            columns["user_accounts"].append(len(columns["account_ids"]))
+
+    def extend(self, users: Iterable[SeedUserResult]) -> None:
+        """
+        Добавляет пользователей в конец хранилища (см. append).
+        """
+        for user in users:
+            self.append(user)
+
+    def __len__(self) -> int:
+        return len(self.columns["user_ids"])
+
+    @property
+    def users(self) -> SeedsStoreUsers:
+        """
+        Последовательность всех пользователей хранилища.
+        """
+        return SeedsStoreUsers(self)
+
+    def get_string(self, index: int) -> str:
+        """
+        Возвращает ID из строковой таблицы по индексу.
+        """
+        string_offsets = self.columns["string_offsets"]
+        return str(self.columns["strings"][string_offsets[index]:string_offsets[index + 1]], "utf-8")
+
+    def get_user(self, index: int) -> SeedUserView:
+        """
+        Возвращает пользователя по индексу.
+        """
+        return self.users[index]
+
+    def get_next_user(self) -> SeedUserView:
+        """
+        Возвращает следующего пользователя согласно выдаче checkout.
+        """
+        return self.checkout.checkout()
+
+    def get_random_user(self) -> SeedUserView:
+        """
+        Возвращает случайного пользователя.
+        """
+        return self.get_user(random.randrange(len(self)))
+
+    def to_result(self) -> SeedsResult:
+        """
+        Полностью преобразует хранилище в SeedsResult (например, для отладки или конвертации в JSON).
+        """
+        return SeedsResult(users=[user.to_result() for user in self.users])
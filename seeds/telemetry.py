@@ -0,0 +1,209 @@
+import time
+from array import array
+
+import gevent
+from pydantic import BaseModel, Field
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_TELEMETRY")
+
+
+class SeedsMethodSummary(BaseModel):
+    """
+    Сводка по одному методу gateway.
+
+    Attributes:
+        count (int): Количество вызовов.
+        errors (int): Количество вызовов, завершившихся ошибкой.
+        mean_ms (float): Средняя латентность, мс.
+        p50_ms / p90_ms / p99_ms / max_ms (float): Перцентили и максимум латентности, мс.
+        total_seconds (float): Суммарное время вызовов — показывает, какой метод «съедает» сидинг.
+    """
+    count: int = 0
+    errors: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    total_seconds: float = 0.0
+
+
+class SeedsTelemetrySummary(BaseModel):
+    """
+    Итоговая сводка телеметрии сидинга.
+
+    Attributes:
+        users (int): Количество созданных пользователей.
+        elapsed_seconds (float): Длительность сидинга.
+        users_per_second (float): Пропускная способность по пользователям.
+        requests_per_second (float): Пропускная способность по запросам.
+        methods (dict[str, SeedsMethodSummary]): Сводка по методам gateway.
+    """
+    users: int = 0
+    elapsed_seconds: float = 0.0
+    users_per_second: float = 0.0
+    requests_per_second: float = 0.0
+    methods: dict[str, SeedsMethodSummary] = Field(default_factory=dict)
+
+    def to_table(self) -> str:
+        """
+        Форматирует сводку в текстовую таблицу (для логов и файла рядом с дампом).
+        """
+        header = f"{'method':<34}{'count':>8}{'errors':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}{'total s':>10}"
+        lines = [
+            f"users: {self.users}, elapsed: {self.elapsed_seconds:.1f}s, "
+            f"{self.users_per_second:.2f} users/s, {self.requests_per_second:.2f} req/s",
+            header,
+            "-" * len(header)
+        ]
+        for method, summary in sorted(self.methods.items(), key=lambda item: -item[1].total_seconds):
+            lines.append(
+                f"{method:<34}{summary.count:>8}{summary.errors:>8}{summary.mean_ms:>10.1f}{summary.p50_ms:>10.1f}"
+                f"{summary.p90_ms:>10.1f}{summary.p99_ms:>10.1f}{summary.max_ms:>10.1f}{summary.total_seconds:>10.1f}"
+            )
+
+        return "\n".join(lines)
+
+
+def percentile(values: list[float], quantile: float) -> float:
+    """
+    Перцентиль по отсортированному списку значений (nearest-rank).
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(quantile * len(values))) - 1))]
+
+
+class SeedsTelemetry:
+    """
+    Телеметрия сидинга: латентности каждого метода gateway, ошибки, прогресс по пользователям и ETA.
+
+    Сидер вызывает record() на каждый запрос и user_done() на каждого созданного пользователя.
+    Во время сидинга фоновый greenlet раз в report_interval секунд пишет в лог строку прогресса.
+    После stop() объект сериализуется pickle (телеметрия шардов возвращается из процессов).
+
+    Attributes:
+        total_users: Сколько пользователей нужно создать
+        report_interval: Интервал строки прогресса в секундах
+        samples: Латентности вызовов по методам (секунды)
+        errors: Количество ошибок по методам
+        users: Сколько пользователей уже создано
+        concurrency: Текущий лимит одновременных запросов сидера (если сидер его сообщает)
+    """
+
+    def __init__(self, total_users: int, report_interval: float = 5.0, name: str = "seeds"):
+        self.name = name
+        self.total_users = total_users
+        self.report_interval = report_interval
+        self.samples: dict[str, array] = {}
+        self.errors: dict[str, int] = {}
+        self.users = 0
+        self.concurrency: float | None = None
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+        self.reporter: gevent.Greenlet | None = None
+
+    def record(self, method: str, seconds: float, error: bool = False) -> None:
+        """
+        Регистрирует вызов метода gateway.
+        """
+        values = self.samples.get(method)
+        if values is None:
+            values = self.samples[method] = array("d")
+        values.append(seconds)
+        if error:
+            self.errors[method] = self.errors.get(method, 0) + 1
+
+    def user_done(self) -> None:
+        """
+        Регистрирует созданного пользователя.
+        """
+        self.users += 1
+
+    def merge(self, samples: dict[str, array], errors: dict[str, int], users: int) -> None:
+        """
+        Добавляет телеметрию другого сидера (например, процесса-шарда).
+        """
+        for method, values in samples.items():
+            self.samples.setdefault(method, array("d")).extend(values)
+        for method, count in errors.items():
+            self.errors[method] = self.errors.get(method, 0) + count
+        self.users += users
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def progress(self) -> str:
+        """
+        Строка прогресса: пользователи, пропускная способность, ETA и самый «дорогой» метод.
+        """
+        elapsed = self.elapsed
+        requests = sum(len(values) for values in self.samples.values())
+        users_rate = self.users / elapsed if elapsed else 0.0
+        remaining = max(self.total_users - self.users, 0)
+        eta = f"{remaining / users_rate:.0f}s" if users_rate else "n/a"
+        share = f"{self.users / self.total_users:.1%}" if self.total_users else "n/a"
+
+        line = (
+            f"[{self.name}] Seeding progress: {self.users}/{self.total_users} users ({share}), "
+            f"{users_rate:.2f} users/s, {requests / elapsed if elapsed else 0.0:.2f} req/s, ETA {eta}"
+        )
+        if self.concurrency is not None:
+            line += f", concurrency {self.concurrency:.0f}"
+        if self.samples:
+            method, values = max(self.samples.items(), key=lambda item: sum(item[1]))
+            line += f", bottleneck: {method} (mean {sum(values) / len(values) * 1000:.1f}ms)"
+
+        return line
+
+    def report(self) -> None:
+        while True:
+            gevent.sleep(self.report_interval)
+            logger.info(self.progress())
+
+    def start(self) -> None:
+        """
+        Запускает периодическую строку прогресса.
+        """
+        self.started_at = time.perf_counter()
+        self.reporter = gevent.spawn(self.report)
+
+    def stop(self) -> None:
+        """
+        Останавливает строку прогресса и фиксирует время окончания.
+        """
+        self.finished_at = time.perf_counter()
+        if self.reporter is not None:
+            self.reporter.kill()
+            self.reporter = None
+
+    def summary(self) -> SeedsTelemetrySummary:
+        """
+        Итоговая сводка по методам gateway.
+        """
+        elapsed = self.elapsed
+        methods = {}
+        for method, values in self.samples.items():
+            ordered = sorted(values)
+            methods[method] = SeedsMethodSummary(
+                count=len(ordered),
+                errors=self.errors.get(method, 0),
+                mean_ms=sum(ordered) / len(ordered) * 1000 if ordered else 0.0,
+                p50_ms=percentile(ordered, 0.50) * 1000,
+                p90_ms=percentile(ordered, 0.90) * 1000,
+                p99_ms=percentile(ordered, 0.99) * 1000,
+                max_ms=(ordered[-1] if ordered else 0.0) * 1000,
+                total_seconds=sum(ordered)
+            )
+        requests = sum(summary.count for summary in methods.values())
+
+        return SeedsTelemetrySummary(
+            users=self.users,
+            elapsed_seconds=elapsed,
+            users_per_second=self.users / elapsed if elapsed else 0.0,
+            requests_per_second=requests / elapsed if elapsed else 0.0,
+            methods=methods
+        )
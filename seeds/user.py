@@ -0,0 +1,74 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+
+# Пользователь пула сидов в сценариях: конкретный тип зависит от хранилища (SEEDS.DUMPS_FORMAT, SEEDS.LAZY_LOAD) —
+# SeedUserView колоночного хранилища (seeds/store.py) или SeedUserResult ленивого хранилища (seeds/lazy.py)
+# и списка SeedsResult. Протоколы описывают атрибуты, общие для всех этих типов, и только на чтение.
+
+
+class SeedCard(Protocol):
+    """
+    Карта пользователя из пула сидов (SeedCardView или SeedCardResult).
+    """
+
+    @property
+    def card_id(self) -> str: ...
+
+
+class SeedOperation(Protocol):
+    """
+    Операция пользователя из пула сидов (SeedOperationView или SeedOperationResult).
+    """
+
+    @property
+    def operation_id(self) -> str: ...
+
+
+class SeedAccount(Protocol):
+    """
+    Счёт пользователя из пула сидов (SeedAccountView или SeedAccountResult).
+    """
+
+    @property
+    def account_id(self) -> str: ...
+
+    @property
+    def physical_cards(self) -> Sequence[SeedCard]: ...
+
+    @property
+    def virtual_cards(self) -> Sequence[SeedCard]: ...
+
+    @property
+    def top_up_operations(self) -> Sequence[SeedOperation]: ...
+
+    @property
+    def purchase_operations(self) -> Sequence[SeedOperation]: ...
+
+    @property
+    def transfer_operations(self) -> Sequence[SeedOperation]: ...
+
+    @property
+    def cash_withdrawal_operations(self) -> Sequence[SeedOperation]: ...
+
+
+class SeedUser(Protocol):
+    """
+    Пользователь из пула сидов (SeedUserView или SeedUserResult), например:
+    seed_user.credit_card_accounts[0].physical_cards[0].card_id
+    """
+
+    @property
+    def user_id(self) -> str: ...
+
+    @property
+    def deposit_accounts(self) -> Sequence[SeedAccount]: ...
+
+    @property
+    def savings_accounts(self) -> Sequence[SeedAccount]: ...
+
+    @property
+    def debit_card_accounts(self) -> Sequence[SeedAccount]: ...
+
+    @property
+    def credit_card_accounts(self) -> Sequence[SeedAccount]: ...
@@ -0,0 +1,160 @@
+from gevent.pool import Pool
+from grpc import RpcError, StatusCode
+from pydantic import BaseModel, Field
+
+from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
+from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
+from config import settings
+from seeds.schema.plan import SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult
+from seeds.store import ACCOUNT_FIELDS, CARD_FIELDS
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_VALIDATION")
+
+
+class SeedsValidationReport(BaseModel):
+    """
+    Отчёт о проверке пула сидов перед запуском нагрузки.
+
+    Attributes:
+        checked_users (int): Количество проверенных пользователей.
+        pruned_users (list[str]): Пользователи, удалённые из пула (не найдены или не соответствуют плану).
+        pruned_accounts (list[str]): Счета, удалённые у оставшихся пользователей (не найдены).
+        pruned_cards (list[str]): Карты, удалённые у оставшихся счетов (не найдены).
+        unchecked_users (list[str]): Пользователи, которых не удалось проверить из-за ошибки стенда
+            (например, UNAVAILABLE); они остаются в пуле без изменений.
+    """
+    checked_users: int = 0
+    pruned_users: list[str] = Field(default_factory=list)
+    pruned_accounts: list[str] = Field(default_factory=list)
+    pruned_cards: list[str] = Field(default_factory=list)
+    unchecked_users: list[str] = Field(default_factory=list)
+
+    @property
+    def pruned(self) -> bool:
+        return bool(self.pruned_users or self.pruned_accounts or self.pruned_cards)
+
+
+def is_account_valid(account: SeedAccountResult, plan: SeedAccountsPlan) -> bool:
+    """
+    Проверяет, что у счёта остаётся не меньше карт, чем требует план.
+    """
+    return (
+        len(account.physical_cards) >= plan.physical_cards.count and
+        len(account.virtual_cards) >= plan.virtual_cards.count
+    )
+
+
+class SeedsValidator:
+    """
+    Проверяет, что сиды из сохранённого дампа всё ещё существуют на стенде (например, после его сброса).
+
+    Для каждого пользователя выполняется get_user и get_accounts: счета, которых нет в ответе,
+    и карты, которых нет среди карт своего счёта, удаляются. Если после этого пользователь
+    перестаёт соответствовать плану (не хватает счетов или карт), он удаляется из пула целиком.
+    Пользователь, проверка которого упала с другой ошибкой gRPC (не NOT_FOUND), остаётся в пуле как есть.
+    Пользователи проверяются параллельно, не более concurrency одновременно.
+
+    Attributes:
+        users_gateway_client: Клиент для получения пользователей
+        accounts_gateway_client: Клиент для получения счетов (вместе с картами)
+        concurrency: Количество одновременно проверяемых пользователей
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient,
+            concurrency: int = 1
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.concurrency = concurrency
+
+    def validate_user(
+            self,
+            user: SeedUserResult,
+            plan: SeedUsersPlan,
+            report: SeedsValidationReport
+    ) -> SeedUserResult | None:
+        """
+        Проверяет и при необходимости чинит одного пользователя.
+
+        Args:
+            user: Пользователь из пула
+            plan: План генерации пользователя
+            report: Отчёт, в который записываются удалённые сущности
+
+        Returns:
+            SeedUserResult | None: Исправленный пользователь или None, если его нужно удалить
+        """
+        try:
+            self.users_gateway_client.get_user(user_id=user.user_id)
+            response = self.accounts_gateway_client.get_accounts(user_id=user.user_id)
+        except RpcError as error:
+            if error.code() != StatusCode.NOT_FOUND:
+                # Сбой стенда не говорит о том, что пользователя нет: оставляем его и не прерываем проверку пула
+                logger.warning(f"Seed user {user.user_id} left unchecked: {error.code()}")
+                report.unchecked_users.append(user.user_id)
+                return user
+            report.pruned_users.append(user.user_id)
+            return None
+
+        cards = {account.id: {card.id for card in account.cards} for account in response.accounts}
+        repaired = {"user_id": user.user_id}
+        for account_field in ACCOUNT_FIELDS:
+            accounts = []
+            for account in getattr(user, account_field):
+                if account.account_id not in cards:
+                    report.pruned_accounts.append(account.account_id)
+                    continue
+
+                update = {}
+                for card_field in CARD_FIELDS:
+                    existing = [card for card in getattr(account, card_field) if card.card_id in cards[account.account_id]]
+                    report.pruned_cards.extend(
+                        card.card_id for card in getattr(account, card_field) if card not in existing
+                    )
+                    update[card_field] = existing
+                accounts.append(account.model_copy(update=update))
+
+            account_plan: SeedAccountsPlan = getattr(plan, account_field)
+            valid = [account for account in accounts if is_account_valid(account, account_plan)]
+            if len(valid) < account_plan.count:
+                report.pruned_users.append(user.user_id)
+                return None
+            repaired[account_field] = valid
+
+        return SeedUserResult(**repaired)
+
+    def validate(self, result: SeedsResult, plan: SeedUsersPlan) -> tuple[SeedsResult, SeedsValidationReport]:
+        """
+        Проверяет весь пул сидов.
+
+        Args:
+            result: Пул сидов
+            plan: План генерации пользователей, которому должен соответствовать каждый пользователь
+
+        Returns:
+            tuple[SeedsResult, SeedsValidationReport]: Очищенный пул и отчёт о удалённых сущностях
+        """
+        report = SeedsValidationReport(checked_users=len(result.users))
+        pool = Pool(self.concurrency)
+        users = pool.map(lambda user: self.validate_user(user, plan, report), result.users)
+
+        return SeedsResult(users=[user for user in users if user is not None]), report
+
+
+def build_grpc_seeds_validator() -> SeedsValidator:
+    """
+    Фабрика для создания валидатора сидов с использованием gRPC-клиентов.
+
+    Returns:
+        SeedsValidator: Инициализированный валидатор
+    """
+    return SeedsValidator(
+        users_gateway_client=build_users_gateway_grpc_client(),
+        accounts_gateway_client=build_accounts_gateway_grpc_client(),
+        concurrency=settings.seeds.validation_concurrency
+    )
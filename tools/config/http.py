@@ -1,9 +1,38 @@
-from pydantic import BaseModel, HttpUrl
+from enum import StrEnum
+
+from pydantic import BaseModel, HttpUrl, PositiveInt, PositiveFloat
+
+
+class HTTPPoolSharing(StrEnum):
+    USER = "user"
+    DOMAIN = "domain"
+    GLOBAL = "global"
+
+
+class HTTPClientBackend(StrEnum):
+    HTTPX = "httpx"
+    FAST_HTTP = "fasthttp"
+
+
+class HTTPResponseValidation(StrEnum):
+    FULL = "full"
+    SAMPLED = "sampled"
+    LAZY = "lazy"
+    OFF = "off"
+
 
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float = 100.0
+    max_connections: PositiveInt | None = 100
+    max_keepalive_connections: PositiveInt | None = 20
+    keepalive_expiry: PositiveFloat | None = 5.0
+    pool_sharing: HTTPPoolSharing = HTTPPoolSharing.USER
+    http2: bool = False
+    backend: HTTPClientBackend = HTTPClientBackend.HTTPX
+    validation: HTTPResponseValidation = HTTPResponseValidation.FULL
+    validation_sample_rate: PositiveInt = 100
 
     @property
     def client_url(self) -> str:
-        return str(self.url)
\ No newline at end of file
+        return str(self.url)
@@ -0,0 +1,51 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt, PositiveFloat
+
+
+class SeedsDumpsFormat(StrEnum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+class SeedsBackend(StrEnum):
+    GATEWAY = "gateway"
+    SERVICES = "services"
+
+
+class SeedsCheckoutOrder(StrEnum):
+    SEQUENTIAL = "sequential"
+    RANDOM = "random"
+    ROUND_ROBIN = "round_robin"
+
+
+class SeedsExhaustionPolicy(StrEnum):
+    RAISE = "raise"
+    WRAP = "wrap"
+    BLOCK = "block"
+
+
+class SeedsConfig(BaseModel):
+    users_concurrency: PositiveInt = 1
+    entities_concurrency: PositiveInt = 1
+    processes: PositiveInt = 1
+    reseed: bool = False
+    dumps_max_bytes: PositiveInt | None = None
+    dumps_format: SeedsDumpsFormat = SeedsDumpsFormat.JSON
+    checkout_order: SeedsCheckoutOrder = SeedsCheckoutOrder.SEQUENTIAL
+    checkout_policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.RAISE
+    checkout_timeout: PositiveFloat | None = None
+    validate_dumps: bool = False
+    validation_concurrency: PositiveInt = 10
+    telemetry_interval: PositiveFloat = 5.0
+    adaptive_concurrency: bool = False
+    min_entities_concurrency: PositiveInt = 1
+    streaming: bool = False
+    backend: SeedsBackend = SeedsBackend.GATEWAY
+    retries: NonNegativeInt = 3
+    retry_backoff: PositiveFloat = 0.2
+    failure_budget: float = Field(default=0.01, ge=0, le=1)
+    shared_pool: bool = False
+    lazy_load: bool = False
+    auto_size: bool = False
+    sharing_factor: PositiveFloat = 1.0
@@ -112,6 +112,54 @@ class Fake:
         """
         return self.float(1, 1000)
 
+    def pin(self) -> str:
+        """
+        Генерирует случайный PIN-код карты.
+
+        :return: Строка из 4 цифр.
+        """
+        return self.faker.numerify("####")
+
+    def cvv(self) -> str:
+        """
+        Генерирует случайный CVV-код карты.
+
+        :return: Строка из 3 цифр.
+        """
+        return self.faker.credit_card_security_code()
+
+    def card_number(self) -> str:
+        """
+        Генерирует случайный номер карты.
+
+        :return: Номер карты.
+        """
+        return self.faker.credit_card_number()
+
+    def card_holder(self) -> str:
+        """
+        Генерирует имя держателя карты.
+
+        :return: Имя и фамилия держателя.
+        """
+        return self.faker.name()
+
+    def expiry_date(self) -> str:
+        """
+        Генерирует срок действия карты.
+
+        :return: Срок действия в формате MM/YY.
+        """
+        return self.faker.credit_card_expire()
+
+    def date_time(self) -> str:
+        """
+        Генерирует случайные дату и время за последний год.
+
+        :return: Дата и время в формате ISO 8601.
+        """
+        return self.faker.date_time_between(start_date="-1y").isoformat()
+
     def proto_enum(self, value: EnumTypeWrapper) -> int:
         """
         Выбирает случайное значение из proto enum-типа.
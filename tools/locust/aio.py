@@ -0,0 +1,94 @@
+# Event loop asyncio внутри процесса Locust (мастера или воркера).
+# Loop работает в отдельном гринлете: под monkey-patching gevent селектор asyncio кооперативный,
+# поэтому ожидание сокетов loop'ом не блокирует остальные гринлеты, а гринлеты пользователей
+# ждут свои корутины, не блокируя loop. Один loop обслуживает корутины всех пользователей процесса.
+import asyncio
+import inspect
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import gevent
+from gevent.event import AsyncResult
+from locust import TaskSet, SequentialTaskSet
+
+T = TypeVar("T")
+
+event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Возвращает event loop процесса, запуская его в гринлете при первом обращении.
+
+    :return: Работающий event loop.
+    """
+    global event_loop
+    if event_loop is None or event_loop.is_closed():
+        event_loop = asyncio.new_event_loop()
+        gevent.spawn(event_loop.run_forever)
+
+    return event_loop
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Выполняет корутину в event loop процесса и ждёт результат в текущем гринлете.
+    Если гринлет остановлен (например, Locust останавливает пользователя), корутина отменяется.
+
+    Loop и гринлеты пользователей работают в одном потоке, поэтому результат передаётся через
+    gevent.event.AsyncResult: это в разы дешевле concurrent.futures.Future с его блокировками.
+
+    :param coroutine: Корутина (например, запрос асинхронного клиента gateway).
+    :return: Результат корутины.
+    """
+    loop = get_event_loop()
+    waiter = AsyncResult()
+    tasks: list[asyncio.Task] = []
+
+    def on_done(task: asyncio.Task) -> None:
+        if task.cancelled():
+            waiter.set_exception(asyncio.CancelledError())
+        elif task.exception() is not None:
+            waiter.set_exception(task.exception())
+        else:
+            waiter.set(task.result())
+
+    def schedule() -> None:
+        tasks.append(loop.create_task(coroutine))
+        tasks[0].add_done_callback(on_done)
+
+    # call_soon_threadsafe будит loop, ожидающий сокеты в селекторе
+    loop.call_soon_threadsafe(schedule)
+    try:
+        return waiter.get()
+    except BaseException:
+        if not waiter.ready():
+            # schedule уже в очереди loop'а раньше отмены, поэтому задача к этому моменту создана
+            loop.call_soon_threadsafe(lambda: tasks[0].cancel())
+        raise
+
+
+class AsyncTaskSetMixin:
+    """
+    Выполняет задачи-корутины (async def с @task) в event loop процесса; обычные задачи — как в TaskSet.
+    """
+
+    def execute_task(self, task):
+        if not inspect.iscoroutinefunction(task):
+            return super().execute_task(task)
+
+        # Как в TaskSet.execute_task: метод, привязанный к таск-сету, вызывается без self
+        coroutine = task() if getattr(task, "__self__", None) is self else task(self)
+        run_coroutine(coroutine)
+
+
+class AsyncTaskSet(AsyncTaskSetMixin, TaskSet):
+    """
+    TaskSet, задачи которого могут быть корутинами.
+    """
+
+
+class AsyncSequentialTaskSet(AsyncTaskSetMixin, SequentialTaskSet):
+    """
+    SequentialTaskSet, задачи которого могут быть корутинами.
+    """
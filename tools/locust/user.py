@@ -1,5 +1,11 @@
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
 from locust import User, between
 from config import settings
+from tools.locust.aio import get_event_loop, run_coroutine
+
+T = TypeVar("T")
 
 class LocustBaseUser(User):
     """
@@ -11,4 +17,29 @@ class LocustBaseUser(User):
     wait_time = between(
         min_wait=settings.locust_user.wait_time_min,
         max_wait=settings.locust_user.wait_time_max
-        )  # Ожидание между задачами (в секундах)
\ No newline at end of file
+        )  # Ожидание между задачами (в секундах)
+
+class AsyncLocustBaseUser(LocustBaseUser):
+    """
+    Базовый виртуальный пользователь для асинхронных сценариев.
+
+    Задачи пишутся как корутины в AsyncTaskSet / AsyncSequentialTaskSet (tools/locust/aio.py)
+    и выполняются в общем event loop процесса: запросы асинхронных клиентов gateway всех
+    пользователей воркера мультиплексируются одним loop'ом, а гринлет пользователя только ждёт
+    результат. Метрики запросов уходят в тот же environment.events.request, что и у синхронных сценариев.
+
+    Каждый асинхронный пользователь — по-прежнему гринлет Locust, а запрос дополнительно проходит через
+    call_soon_threadsafe и задачу asyncio. Поэтому больше сессий на воркер такой пользователь не даёт
+    (на одном ядре он медленнее синхронного); он нужен для сценариев на асинхронных клиентах и библиотеках.
+    """
+    abstract = True
+
+    def on_start(self) -> None:
+        # Запускаем event loop процесса до первой задачи
+        get_event_loop()
+
+    def run_coroutine(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Выполняет корутину в event loop процесса (например, в on_start таск-сета) и возвращает результат.
+        """
+        return run_coroutine(coroutine)